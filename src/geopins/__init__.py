@@ -1,13 +1,37 @@
+from geopins.batch import PinWriteManyError
 from geopins.boards import GeoBaseBoard
-from geopins.drivers.gdf.dispatch import pin_read_gdf, pin_write_gdf
-from geopins.drivers.raster.dispatch import pin_read_raster, pin_write_raster
+from geopins.drivers.exceptions import MemoryBudgetError
+from geopins.drivers.gdf.dispatch import (
+    pin_iter_gdf,
+    pin_read_dask_gdf,
+    pin_read_gdf,
+    pin_write_gdf,
+)
+from geopins.drivers.raster.blocks import RasterBlocks
+from geopins.drivers.raster.dispatch import (
+    pin_raster_stats,
+    pin_read_raster,
+    pin_read_raster_stack,
+    pin_sample_raster,
+    pin_write_raster,
+)
+from geopins.drivers.raster.stack import RasterStack
 from geopins.patch_ import patch
 
 __all__ = [
     "GeoBaseBoard",
+    "MemoryBudgetError",
+    "PinWriteManyError",
+    "RasterBlocks",
+    "RasterStack",
     "patch",
+    "pin_iter_gdf",
+    "pin_raster_stats",
+    "pin_read_dask_gdf",
     "pin_read_gdf",
     "pin_read_raster",
+    "pin_read_raster_stack",
+    "pin_sample_raster",
     "pin_write_gdf",
     "pin_write_raster",
 ]
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import multiprocessing
+import shutil
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from fsspec.implementations.local import LocalFileSystem
+from geopandas import GeoDataFrame
+from pins.boards import BaseBoard
+from rastr.raster import Raster
+
+from geopins.drivers.gdf.dispatch import pin_write_gdf
+from geopins.drivers.raster.dispatch import pin_write_raster
+from geopins.drivers.raster.stack import RasterStack
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from concurrent.futures import Future
+
+    from pins.boards import IFileSystem
+    from pins.meta import Meta
+
+
+class PinWriteManyError(Exception):
+    """Raised when some of the pins passed to `pin_write_many` could not be written.
+
+    Pins are written independently, so those which were written are kept. Pins in
+    neither `metas` nor `errors` weren't written, since no more pins are started once
+    one fails to encode.
+
+    Attributes:
+        metas: Metadata about each pin which was written, keyed by pin name.
+        errors: The error raised for each pin which failed, keyed by pin name.
+    """
+
+    def __init__(self, *, metas: dict[str, Meta], errors: dict[str, Exception]) -> None:
+        self.metas = metas
+        self.errors = errors
+        written = ", ".join(repr(name) for name in metas) or "none"
+        super().__init__(
+            f"Failed to write pins {', '.join(repr(name) for name in errors)}. "
+            f"Pins written: {written}."
+        )
+
+
+@dataclass
+class _StagedPin:
+    # The encoded files of a pin, and the arguments to upload them with.
+    paths: list[str]
+    title: str | None
+    description: str | None
+    metadata: Mapping | None
+
+
+class _StagingBoard(BaseBoard):
+    """A board which keeps the files passed to `pin_upload`, rather than storing them.
+
+    This separates encoding objects (which happens before the upload in each geopins
+    writer) from uploading them.
+    """
+
+    def __init__(self, staging_dir: Path) -> None:
+        super().__init__(
+            staging_dir.as_posix(), fs=cast("IFileSystem", LocalFileSystem())
+        )
+        self.staging_dir = staging_dir
+        self.staged: _StagedPin | None = None
+
+    def pin_upload(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        paths: str | list[str],
+        name: str | None = None,  # noqa: ARG002
+        title: str | None = None,
+        description: str | None = None,
+        metadata: Mapping | None = None,
+    ) -> None:
+        if isinstance(paths, str):
+            paths = [paths]
+
+        # The writers encode into temporary directories, so move the files out.
+        # N.B. qualified pin names, e.g. "user/pin", aren't valid directory names.
+        pin_dir = Path(tempfile.mkdtemp(dir=self.staging_dir, prefix="pin-"))
+        self.staged = _StagedPin(
+            paths=[str(shutil.move(path, pin_dir / Path(path).name)) for path in paths],
+            title=title,
+            description=description,
+            metadata=metadata,
+        )
+
+
+def pin_write_many(  # noqa: PLR0913
+    board: BaseBoard,
+    objects: Mapping[str, GeoDataFrame | Raster | RasterStack],
+    type: str | None = None,  # noqa: A002
+    metadata: Mapping | None = None,
+    *,
+    max_workers: int | None = None,
+    max_upload_workers: int | None = 8,
+) -> dict[str, Meta]:
+    """Write many GeoDataFrames and Rasters to a board, encoding them in parallel.
+
+    Encoding (e.g. GeoTIFF compression and WKB serialization) is CPU-bound, so each
+    object is encoded to local files in a separate process. Each pin is uploaded by
+    a thread pool as soon as its files are ready, while other objects are still being
+    encoded, and its metadata is written once its files are uploaded.
+
+    The objects are pickled to send them to the worker processes, so this is most
+    worthwhile when encoding is slow relative to pickling, e.g. for compressed
+    formats.
+
+    Each pin is written independently, so there is no all-or-nothing guarantee. If
+    an object fails to encode, no more pins are started, but those already being
+    uploaded are finished. `PinWriteManyError` then reports which pins were written.
+
+    Args:
+        board: The pins board to write to.
+        objects: The objects to pin, keyed by pin name.
+        type: File type used to save each object to disk, as in `pin_write`. Defaults
+              to the default for each type of object.
+        metadata: A dictionary containing additional metadata to store with each pin.
+                  This gets stored on the Meta.user field.
+        max_workers: The maximum number of processes to encode objects with. Defaults
+                     to the number of CPUs.
+        max_upload_workers: The maximum number of pins to upload at once.
+
+    Returns:
+        Metadata about each stored pin, keyed by pin name.
+
+    Raises:
+        PinWriteManyError: If any of the pins could not be written. The first error
+                           is chained as its cause.
+    """
+    metas: dict[str, Meta] = {}
+    errors: dict[str, Exception] = {}
+
+    with (
+        # N.B. warning filters are global, so set them once for all threads.
+        warnings.catch_warnings(),
+        tempfile.TemporaryDirectory() as staging_dir,
+        ProcessPoolExecutor(
+            max_workers=max_workers,
+            # Forking is unsafe once threads have been started, e.g. by GDAL.
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as encode_executor,
+        ThreadPoolExecutor(max_workers=max_upload_workers) as upload_executor,
+    ):
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+
+        encode_futures = {
+            encode_executor.submit(
+                _encode_pin,
+                x,
+                name=name,
+                type=type,
+                metadata=metadata,
+                staging_dir=Path(staging_dir),
+            ): name
+            for name, x in objects.items()
+        }
+
+        upload_futures: dict[Future[Meta], str] = {}
+        for encode_future in as_completed(encode_futures):
+            name = encode_futures[encode_future]
+            if encode_future.cancelled():
+                continue
+            try:
+                staged = encode_future.result()
+            except Exception as err:  # noqa: BLE001 (reported below)
+                errors[name] = err
+                for future in encode_futures:
+                    future.cancel()
+                continue
+            if errors:
+                # Don't start any more pins once one has failed.
+                continue
+            upload_future = upload_executor.submit(
+                _upload_staged_pin, staged, name=name, board=board
+            )
+            upload_futures[upload_future] = name
+
+        for upload_future, name in upload_futures.items():
+            try:
+                metas[name] = upload_future.result()
+            except Exception as err:  # noqa: BLE001 (reported below)
+                errors[name] = err
+
+    # Preserve the order of the input objects
+    metas = {name: metas[name] for name in objects if name in metas}
+    if errors:
+        errors = {name: errors[name] for name in objects if name in errors}
+        raise PinWriteManyError(metas=metas, errors=errors) from next(
+            iter(errors.values())
+        )
+    return metas
+
+
+def _encode_pin(
+    x: GeoDataFrame | Raster | RasterStack,
+    *,
+    name: str,
+    type: str | None,  # noqa: A002
+    metadata: Mapping | None,
+    staging_dir: Path,
+) -> _StagedPin:
+    board = _StagingBoard(staging_dir)
+
+    kwargs: dict[str, Any] = {"name": name, "type": type, "metadata": metadata}
+    if isinstance(x, GeoDataFrame):
+        pin_write_gdf(x, board=board, **kwargs)
+    elif isinstance(x, (Raster, RasterStack)):
+        pin_write_raster(x, board=board, **kwargs)
+    else:
+        msg = (
+            f"Expected a GeoDataFrame, Raster or RasterStack for pin '{name}', got "
+            f"{x.__class__.__name__}."
+        )
+        raise TypeError(msg)
+
+    if board.staged is None:
+        raise AssertionError
+    return board.staged
+
+
+def _upload_staged_pin(staged: _StagedPin, *, name: str, board: BaseBoard) -> Meta:
+    meta = board.pin_upload(
+        paths=staged.paths,
+        name=name,
+        title=staged.title,
+        description=staged.description,
+        metadata=staged.metadata,
+    )
+
+    for path in staged.paths:
+        Path(path).unlink(missing_ok=True)
+    return meta
@@ -1,22 +1,49 @@
 from __future__ import annotations
 
+import hashlib
 import warnings
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 from geopandas import GeoDataFrame
 from pins.boards import BaseBoard
 from rastr.raster import Raster
 
+from geopins.batch import pin_write_many
+from geopins.cache import (
+    DEFAULT_TRANSCODE_CACHE_MAX_BYTES,
+    FileCache,
+    ObjectCache,
+    file_lock,
+    get_geopins_cache_dir,
+)
+from geopins.diff import pin_diff
 from geopins.drivers.gdf.dispatch import _pin_read_gdf, pin_write_gdf
 from geopins.drivers.infer import infer_driver_info
+from geopins.drivers.raster.blocks import RasterBlocks
 from geopins.drivers.raster.dispatch import _pin_read_raster, pin_write_raster
+from geopins.drivers.raster.stack import RasterStack
+from geopins.fs import (
+    get_pooled_fs,
+    get_target_fs,
+    pin_download_verified,
+    set_target_fs,
+)
 from geopins.interfaces import PinReadKwargDict, PinWriteKwargDict
+from geopins.prefetch import prefetch
+from geopins.shared import share_pin
+from geopins.upload import get_multipart_board
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
     from datetime import datetime
 
     from pins.meta import Meta
+    from pyproj import CRS
+
+    from geopins.diff import PinDiff
+    from geopins.prefetch import PrefetchReport
+    from geopins.shared import SharedPin
 
 
 _T = TypeVar("_T")
@@ -24,6 +51,8 @@ _T = TypeVar("_T")
 # Unpatched methods
 base_board_pin_write = BaseBoard.pin_write
 base_board_pin_read = BaseBoard.pin_read
+base_board_pin_download = BaseBoard.pin_download
+base_board_pin_upload = BaseBoard.pin_upload
 
 
 class GeoBaseBoard(BaseBoard):
@@ -80,11 +109,25 @@ class GeoBaseBoard(BaseBoard):
             warnings.simplefilter("ignore", category=ResourceWarning)
             meta = self.pin_fetch(name, version)
 
+        # Decoded objects are only cached when the pin data needn't be validated.
+        object_cache: ObjectCache | None = getattr(self, "_object_cache", None)
+        if hash is not None:
+            object_cache = None
+        cache_key = (self.board, meta.name, meta.version.version, meta.pin_hash)
+        cached = None if object_cache is None else object_cache.get(cache_key)
+
+        max_memory: int | None = getattr(self, "_max_memory", None)
         driver_info = infer_driver_info(meta, board=self)
-        if driver_info.dtype == "gdf":
-            value = _pin_read_gdf(board=self, **kwargs, meta=meta)
+        if cached is not None:
+            value = _copy_cached_object(cached)
+        elif driver_info.dtype == "gdf":
+            value = _pin_read_gdf(
+                board=self, **kwargs, max_memory=max_memory, meta=meta
+            )
         elif driver_info.dtype == "raster":
-            value = _pin_read_raster(board=self, **kwargs, meta=meta)
+            value = _pin_read_raster(
+                board=self, **kwargs, max_memory=max_memory, meta=meta
+            )
         elif driver_info.dtype is None:
             # Otherwise use the default pins implementation.
 
@@ -100,6 +143,18 @@ class GeoBaseBoard(BaseBoard):
             # Change to assert_never after deprecating 3.11 support
             raise AssertionError
 
+        # N.B. only objects read by geopins' drivers are cached, not those read by
+        # the default pins implementation.
+        if (
+            object_cache is not None
+            and cached is None
+            and driver_info.dtype is not None
+            and isinstance(value, (GeoDataFrame, Raster, RasterStack))
+        ):
+            cached = _to_cached_object(value)
+            object_cache.put(cache_key, cached, nbytes=_get_object_nbytes(cached))
+            value = _copy_cached_object(cached)
+
         # N.B. this logic isn't in the original pins implementation, and doesn't make
         # much sense to contribute upstream since Python pins tries tries not to diverge
         # too much from R pins. But it's useful for type safety here.
@@ -125,10 +180,11 @@ class GeoBaseBoard(BaseBoard):
         """Write a pin object to the board.
 
         Args:
-            x: An object (e.g. a geopandas GeoDataFrame or rastr Raster) to pin.
+            x: An object (e.g. a geopandas GeoDataFrame, rastr Raster, or geopins
+               RasterStack or RasterBlocks) to pin.
             name: Pin name.
-            type: File type used to save `x` to disk. May be "gpkg", "tif", "csv",
-                  "arrow", "parquet", "joblib", or "json".
+            type: File type used to save `x` to disk. May be "gpkg", "fgb", "tif",
+                  "csv", "arrow", "parquet", "joblib", or "json".
             title: A title for the pin; most important for shared boards so that others
                    can understand what the pin contains. If omitted, a brief description
                    of the contents will be automatically generated.
@@ -160,7 +216,7 @@ class GeoBaseBoard(BaseBoard):
         )
         if isinstance(x, GeoDataFrame):
             return pin_write_gdf(x, board=self, **kwargs)
-        elif isinstance(x, Raster):
+        elif isinstance(x, (Raster, RasterStack, RasterBlocks)):
             return pin_write_raster(x, board=self, **kwargs)
         else:
             # Otherwise use the default pins implementation.
@@ -170,3 +226,431 @@ class GeoBaseBoard(BaseBoard):
             # This is safe to do since there are no other subclasses of BaseBoard
             # which override pin_read. This limitation is documented in .patch().
             return base_board_pin_write(x=x, self=self, **kwargs)
+
+    def pin_download(
+        self,
+        name: str,
+        version: str | None = None,
+        hash: str | None = None,  # noqa: A002
+    ) -> Sequence[str]:
+        """Download the files contained in a pin.
+
+        If download locks are enabled (see `enable_download_locks`), only one
+        process at a time downloads a given pin, and the others wait for it and then
+        use the cached files.
+
+        If a `hash` is given, the content hash is computed while the files stream
+        from the board, rather than by reading them again afterwards (see
+        `geopins.fs.pin_download_verified`).
+
+        Args:
+            name: Pin name.
+            version: A specific pin version to retrieve.
+            hash: A hash used to validate the retrieved pin data. If specified, it is
+                  compared against the `pin_hash` field retrieved by
+                  `pins.boards.BaseBoard.pin_meta`.
+
+        Returns:
+            The local paths to the downloaded files.
+        """
+        lock_dir: Path | None = getattr(self, "_download_lock_dir", None)
+        if lock_dir is None:
+            return _pin_download(self, name, version=version, hash=hash)
+
+        # One lock per pin, shared by every process using the same board.
+        key = hashlib.sha256(f"{self.fs.protocol}:{self.board}:{name}".encode())
+        lock_path = lock_dir / f"{key.hexdigest()}.lock"
+        with file_lock(
+            lock_path, timeout=getattr(self, "_download_lock_timeout", None)
+        ):
+            return _pin_download(self, name, version=version, hash=hash)
+
+    def pin_upload(
+        self,
+        paths: str | list[str],
+        name: str | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        metadata: Mapping | None = None,
+    ) -> Meta:
+        """Write a pin based on paths to one or more files.
+
+        If multipart uploads are enabled (see `enable_multipart_uploads`), large files
+        are uploaded in parts, concurrently.
+
+        Args:
+            paths: Paths of files to upload.
+            name: Pin name.
+            title: A title for the pin; most important for shared boards so that others
+                   can understand what the pin contains. If omitted, a brief description
+                   of the contents will be automatically generated.
+            description: A detailed description of the pin contents.
+            metadata: A dictionary containing additional metadata to store with the pin.
+                      This gets stored on the Meta.user field.
+
+        Returns:
+            Metadata about the stored pin.
+        """
+        multipart_options: dict[str, Any] | None = getattr(
+            self, "_multipart_upload_options", None
+        )
+        board = (
+            self
+            if multipart_options is None
+            else get_multipart_board(self, **multipart_options)
+        )
+        return base_board_pin_upload(
+            board,
+            paths,
+            name,
+            title=title,
+            description=description,
+            metadata=metadata,
+        )
+
+    def enable_multipart_uploads(
+        self, part_size: int = 64 * 1024**2, max_workers: int | None = 8
+    ) -> None:
+        """Upload large pin files in concurrent parts, to make better use of bandwidth.
+
+        Files larger than `part_size` are split into parts which are uploaded
+        concurrently to a temporary location, then merged server-side. Failed parts
+        are retried, without re-uploading the parts which succeeded. If a file still
+        fails to upload, its parts are deleted; writing the pin again starts a new
+        upload. This applies to all geopins writes, and to `pin_upload`, on boards
+        whose filesystem can merge files (e.g. S3 and GCS); other boards upload each
+        file in one request, as usual.
+
+        Args:
+            part_size: The size of each part, in bytes. Defaults to 64 MiB. Note that
+                       S3 requires parts of at least 5 MiB.
+            max_workers: The maximum number of parts to upload at once. Each worker
+                         holds one part in memory. Defaults to 8.
+        """
+        self._multipart_upload_options = {
+            "part_size": part_size,
+            "max_workers": max_workers,
+        }
+
+    def disable_multipart_uploads(self) -> None:
+        """Upload pin files in a single request each, as pins does by default."""
+        self._multipart_upload_options = None
+
+    def enable_connection_pool(
+        self, max_connections: int = 16, keepalive_timeout: float = 60.0
+    ) -> None:
+        """Reuse a bounded pool of connections to the board's storage.
+
+        All geopins operations on the board share the pool: fetching pin metadata,
+        inferring pin types, downloads and uploads. Connections (and their TLS
+        sessions) are kept open between calls, so their setup cost is paid once
+        rather than per request, and concurrent requests, e.g. from `prefetch` or
+        multipart uploads, are limited to `max_connections`. This is supported for
+        HTTP(S) boards, which need the `http` extra, and S3 boards.
+
+        Args:
+            max_connections: The maximum number of open connections. Defaults to 16.
+            keepalive_timeout: How long idle connections are kept open, in seconds.
+                               Defaults to 60. S3 connections use TCP keep-alive
+                               instead.
+        """
+        unpooled_fs = getattr(self, "_unpooled_fs", None) or get_target_fs(self)
+        set_target_fs(
+            self,
+            get_pooled_fs(
+                unpooled_fs,
+                max_connections=max_connections,
+                keepalive_timeout=keepalive_timeout,
+            ),
+        )
+        self._unpooled_fs = unpooled_fs
+
+    def disable_connection_pool(self) -> None:
+        """Go back to the board's original filesystem and connection settings."""
+        unpooled_fs = getattr(self, "_unpooled_fs", None)
+        if unpooled_fs is not None:
+            set_target_fs(self, unpooled_fs)
+            self._unpooled_fs = None
+
+    def enable_memory_budget(self, max_memory: int) -> None:
+        """Fail fast when reading GeoDataFrames and Rasters which won't fit in memory.
+
+        With a memory budget enabled, `pin_read` estimates the memory needed to read
+        each GeoDataFrame or Raster pin from its metadata, before anything is
+        downloaded, and raises a `MemoryBudgetError` if it exceeds `max_memory`. Use
+        `pin_read_gdf` or `pin_read_raster` with `on_exceed=` to read such pins in
+        batches, memory-mapped, or at a reduced resolution instead.
+
+        Args:
+            max_memory: The memory budget for each read, in bytes.
+        """
+        self._max_memory = max_memory
+
+    def disable_memory_budget(self) -> None:
+        """Read pins regardless of their estimated memory use."""
+        self._max_memory = None
+
+    def enable_download_locks(
+        self, path: Path | str | None = None, timeout: float | None = None
+    ) -> None:
+        """Deduplicate concurrent downloads of the same pin across processes.
+
+        With download locks enabled, a per-pin file lock elects one process to
+        download a pin into the (shared) pins cache, while other processes wait for
+        it to finish, then read the same cached files instead of downloading them
+        again. This is useful when many worker processes on one machine read the same
+        pins at startup.
+
+        Args:
+            path: The directory for the lock files. It must be shared by all of the
+                  processes. Defaults to a "geopins/locks" directory within the pins
+                  cache directory.
+            timeout: The maximum time to wait for another process's download, in
+                     seconds. Defaults to waiting indefinitely.
+        """
+        if path is None:
+            path = get_geopins_cache_dir() / "locks"
+        self._download_lock_dir = Path(path)
+        self._download_lock_timeout = timeout
+
+    def disable_download_locks(self) -> None:
+        """Stop deduplicating concurrent downloads across processes."""
+        self._download_lock_dir = None
+
+    def enable_object_cache(self, max_bytes: int = 1024**3) -> None:
+        """Cache decoded GeoDataFrames and Rasters in memory, to speed up repeat reads.
+
+        The cache is keyed by the pin name, version and hash, so new versions of a pin
+        are always read from the board. The least recently used objects are evicted
+        once the total approximate size of the cached objects exceeds `max_bytes`.
+
+        GeoDataFrames are copied when they are read from the cache. Rasters share the
+        cached cell array, which is made read-only; use `raster.arr.copy()` to get a
+        modifiable array.
+
+        Args:
+            max_bytes: The maximum total size of the cached objects, in bytes.
+                       Defaults to 1 GiB.
+        """
+        self._object_cache = ObjectCache(max_bytes=max_bytes)
+
+    def disable_object_cache(self) -> None:
+        """Stop caching decoded objects, and clear any existing cache."""
+        self._object_cache = None
+
+    def enable_transcode_cache(
+        self,
+        max_bytes: int = DEFAULT_TRANSCODE_CACHE_MAX_BYTES,
+        path: Path | str | None = None,
+    ) -> None:
+        """Serve GeoPackage pins from a faster local copy, transcoded on first read.
+
+        GeoPackage pins are slow to decode. With this cache enabled, the first full read
+        of each GeoPackage pin version also writes an uncompressed Arrow IPC copy to a
+        local cache directory, keyed by the pin hash, which later reads memory-map
+        instead. Reads with a `bbox` or `hash` always use the GeoPackage.
+
+        The same cache also holds the uncompressed copies of GeoTIFF raster pins
+        which are read with `pin_read_raster(..., mode="memmap")`, and reprojected
+        copies of pins read with `crs=`, and the files downloaded by `pin_download`
+        with a `hash`; without this cache enabled, those use a cache with the default
+        settings.
+
+        Args:
+            max_bytes: The maximum total size of the cached copies, in bytes. The least
+                       recently used copies are evicted to stay within this bound.
+                       Defaults to 10 GiB.
+            path: The cache directory. Defaults to a "geopins/transcode" directory
+                  within the pins cache directory.
+        """
+        if path is None:
+            path = get_geopins_cache_dir() / "transcode"
+        self._transcode_cache = FileCache(path, max_bytes=max_bytes)
+
+    def disable_transcode_cache(self) -> None:
+        """Stop serving GeoPackage pins from transcoded copies.
+
+        The cached copies are left in place, for use by other boards or processes.
+        """
+        self._transcode_cache = None
+
+    def prefetch(  # noqa: PLR0913
+        self,
+        names: Sequence[str] | None = None,
+        *,
+        versions: Mapping[str, str] | None = None,
+        pattern: str | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        crs: CRS | str | None = None,
+        max_workers: int | None = 8,
+    ) -> PrefetchReport:
+        """Download pins into the local pins cache concurrently, ahead of reading them.
+
+        Args:
+            names: The names of the pins to prefetch. Defaults to every pin on the
+                   board.
+            versions: Specific versions to prefetch, keyed by pin name. Defaults to the
+                      latest version of each pin.
+            pattern: Only prefetch pins whose names match this glob pattern, e.g.
+                     "flood-*".
+            bbox: Only prefetch pins whose bounds intersect this bounding box, given
+                  as (xmin, ymin, xmax, ymax). Pins without recorded bounds (e.g.
+                  those not written by geopins) are skipped.
+            crs: The CRS of `bbox`. Defaults to the CRS of each pin.
+            max_workers: The maximum number of pins to download at once.
+
+        Returns:
+            A summary of the prefetched pins, including the download throughput.
+        """
+        return prefetch(
+            self,
+            names,
+            versions=versions,
+            pattern=pattern,
+            bbox=bbox,
+            crs=crs,
+            max_workers=max_workers,
+        )
+
+    def pin_write_many(
+        self,
+        objects: Mapping[str, GeoDataFrame | Raster | RasterStack],
+        type: str | None = None,  # noqa: A002
+        metadata: Mapping | None = None,
+        *,
+        max_workers: int | None = None,
+        max_upload_workers: int | None = 8,
+    ) -> dict[str, Meta]:
+        """Write many GeoDataFrames and Rasters, encoding them in parallel processes.
+
+        Args:
+            objects: The objects to pin, keyed by pin name.
+            type: File type used to save each object to disk. Defaults to the default
+                  for each type of object.
+            metadata: A dictionary containing additional metadata to store with each
+                      pin. This gets stored on the Meta.user field.
+            max_workers: The maximum number of processes to encode objects with.
+                         Defaults to the number of CPUs.
+            max_upload_workers: The maximum number of pins to upload at once.
+
+        Returns:
+            Metadata about each stored pin, keyed by pin name.
+
+        Raises:
+            PinWriteManyError: If any of the pins could not be written. The pins which
+                               were written are kept, and listed on the error.
+        """
+        return pin_write_many(
+            self,
+            objects,
+            type=type,
+            metadata=metadata,
+            max_workers=max_workers,
+            max_upload_workers=max_upload_workers,
+        )
+
+    def pin_diff(
+        self,
+        name: str,
+        version_a: str,
+        version_b: str,
+        *,
+        detailed: bool = False,
+    ) -> PinDiff:
+        """Summarize the changes between two versions of a pin.
+
+        By default only the pin metadata is compared, so nothing is downloaded.
+
+        Args:
+            name: Pin name.
+            version_a: The version to compare from.
+            version_b: The version to compare to.
+            detailed: Whether to download both versions and count the changed
+                      features or raster cells, comparing them chunk by chunk.
+
+        Returns:
+            A summary of the changes, e.g. in row count, schema, extent and CRS.
+        """
+        return pin_diff(self, name, version_a, version_b, detailed=detailed)
+
+    def pin_share(
+        self,
+        name: str,
+        version: str | None = None,
+        hash: str | None = None,  # noqa: A002
+    ) -> SharedPin:
+        """Read a GeoDataFrame or Raster pin once, and publish it in shared memory.
+
+        The returned handle can be passed to worker processes, e.g. in a
+        `ProcessPoolExecutor`, which call its `get` method to attach to the shared
+        object rather than each reading the pin. The caller owns the shared memory,
+        and must call `unlink` on the handle (or use it as a context manager) once
+        the workers are done.
+
+        Args:
+            name: Pin name.
+            version: A specific pin version to retrieve.
+            hash: A hash used to validate the retrieved pin data. If specified, it is
+                  compared against the `pin_hash` field retrieved by
+                  `pins.boards.BaseBoard.pin_meta`.
+
+        Returns:
+            A picklable handle to the shared object.
+        """
+        return share_pin(self, name, version=version, hash=hash)
+
+
+def _to_cached_object(value: GeoDataFrame | Raster | RasterStack) -> Any:
+    # Rasters are shared with callers, so make sure they can't modify the cache.
+    if isinstance(value, Raster):
+        value.arr.flags.writeable = False
+    elif isinstance(value, RasterStack):
+        for raster in value.rasters.values():
+            raster.arr.flags.writeable = False
+    return value
+
+
+def _copy_cached_object(value: GeoDataFrame | Raster | RasterStack) -> Any:
+    if isinstance(value, GeoDataFrame):
+        return value.copy()
+    elif isinstance(value, Raster):
+        return Raster(arr=value.arr, raster_meta=value.raster_meta)
+    else:
+        return RasterStack(
+            rasters={
+                label: Raster(arr=raster.arr, raster_meta=raster.raster_meta)
+                for label, raster in value.rasters.items()
+            }
+        )
+
+
+def _get_object_nbytes(value: GeoDataFrame | Raster | RasterStack) -> int:
+    if isinstance(value, GeoDataFrame):
+        # N.B. pandas doesn't look inside geometry objects, so we approximate them by
+        # their coordinates (16 bytes per 2D coordinate) plus per-object overhead.
+        nbytes = int(value.memory_usage(deep=True).sum())
+        for col in value.columns[value.dtypes == "geometry"]:
+            geoseries = value[col]
+            nbytes += 16 * int(geoseries.count_coordinates().sum())
+            nbytes += 64 * len(geoseries)
+        return nbytes
+    elif isinstance(value, Raster):
+        return value.arr.nbytes
+    else:
+        return sum(raster.arr.nbytes for raster in value.rasters.values())
+
+
+def _pin_download(
+    board: BaseBoard,
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+) -> Sequence[str]:
+    if hash is None:
+        return base_board_pin_download(board, name, version=version)
+
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
+    return pin_download_verified(meta, hash=hash, board=board)
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+import pins.config
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+    from pins.boards import BaseBoard
+
+# The default maximum size of the transcode cache (see `FileCache`), in bytes.
+DEFAULT_TRANSCODE_CACHE_MAX_BYTES = 10 * 1024**3
+
+
+def get_geopins_cache_dir() -> Path:
+    """Get the directory for geopins' local caches, within the pins cache directory.
+
+    This respects the `PINS_CACHE_DIR` environment variable, like pins itself.
+
+    Returns:
+        The geopins cache directory. It may not exist yet.
+    """
+    return Path(pins.config.get_cache_dir()) / "geopins"
+
+
+def get_transcode_cache(board: BaseBoard) -> FileCache:
+    """Get the board's transcode cache, for local copies derived from pin files.
+
+    Args:
+        board: The pins board.
+
+    Returns:
+        The cache enabled by `GeoBaseBoard.enable_transcode_cache`, or otherwise a
+        cache with the default settings.
+    """
+    cache: FileCache | None = getattr(board, "_transcode_cache", None)
+    if cache is None:
+        cache = FileCache(
+            get_geopins_cache_dir() / "transcode",
+            max_bytes=DEFAULT_TRANSCODE_CACHE_MAX_BYTES,
+        )
+    return cache
+
+
+def get_variant_key(pin_hash: str, suffix: str, **params: str | None) -> str:
+    """Get the cache key for a local copy of a pin version, or a variant of it.
+
+    Args:
+        pin_hash: The pin hash, which identifies the pin contents.
+        suffix: The file suffix of the copy, e.g. ".arrow".
+        **params: The parameters the variant was derived with, e.g. a target CRS.
+                  Parameters which are None are ignored.
+
+    Returns:
+        The cache key, which is unique to the pin contents and parameters.
+    """
+    params = {key: value for key, value in params.items() if value is not None}
+    if not params:
+        return f"{pin_hash}{suffix}"
+
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f"{pin_hash}-{digest[:16]}{suffix}"
+
+
+class ObjectCache:
+    """An in-memory, thread-safe cache with least-recently-used (LRU) eviction.
+
+    The cache is bounded by the approximate size in bytes of the cached objects, as
+    estimated by the caller when each object is added.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: The maximum total size of the cached objects, in bytes. The
+                       least recently used objects are evicted to stay within this
+                       bound. Objects larger than this are never cached.
+        """
+        if max_bytes < 0:
+            msg = f"`max_bytes` must be non-negative, got {max_bytes}."
+            raise ValueError(msg)
+
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """The total approximate size of the cached objects, in bytes."""
+        return self._nbytes
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached object, marking it as the most recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached object, or None if it is not in the cache.
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, *, nbytes: int) -> None:
+        """Add an object to the cache, evicting least recently used objects as needed.
+
+        Args:
+            key: The cache key.
+            value: The object to cache.
+            nbytes: The approximate size of the object, in bytes.
+        """
+        with self._lock:
+            self._pop(key)
+            if nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all objects from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _pop(self, key: Hashable) -> None:
+        try:
+            _, nbytes = self._entries.pop(key)
+        except KeyError:
+            return
+        self._nbytes -= nbytes
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class FileCache:
+    """A local directory of cached files, with least-recently-used (LRU) eviction.
+
+    The cache is bounded by the total size of the files. Files are written atomically,
+    so the cache directory can safely be shared between processes.
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int) -> None:
+        """Create a cache, or open an existing one.
+
+        Args:
+            path: The cache directory. It is created if it doesn't exist.
+            max_bytes: The maximum total size of the cached files, in bytes. The least
+                       recently used files are evicted to stay within this bound.
+        """
+        if max_bytes < 0:
+            msg = f"`max_bytes` must be non-negative, got {max_bytes}."
+            raise ValueError(msg)
+
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Path | None:
+        """Get the path to a cached file, marking it as the most recently used.
+
+        Args:
+            key: The cache key, which is used as the file name.
+
+        Returns:
+            The path to the cached file, or None if it is not in the cache.
+        """
+        path = self.path / key
+        try:
+            # The modification time records when the file was last used.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, write: Callable[[Path], object]) -> Path:
+        """Add a file to the cache, evicting least recently used files as needed.
+
+        Args:
+            key: The cache key, which is used as the file name.
+            write: A function which writes the file to the path it is given.
+
+        Returns:
+            The path to the cached file.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self.path / key
+
+        # Write to a temporary file first, so other readers never see partial files.
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".", suffix=".tmp")
+        os.close(fd)
+        try:
+            write(Path(tmp))
+            Path(tmp).replace(path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self._evict(keep=path)
+        return path
+
+    def clear(self) -> None:
+        """Remove all files from the cache."""
+        with self._lock:
+            for path in self._list_files():
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    def _evict(self, *, keep: Path) -> None:
+        with self._lock:
+            files = []
+            for path in self._list_files():
+                try:
+                    files.append((path, path.stat()))
+                except FileNotFoundError:
+                    # Evicted by another process
+                    continue
+            nbytes = sum(stat.st_size for _, stat in files)
+            for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+                if nbytes <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                # Another process may have already evicted the file, or be reading
+                # it (which prevents deletion on Windows).
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                nbytes -= stat.st_size
+
+    def _list_files(self) -> list[Path]:
+        if not self.path.exists():
+            return []
+        return [
+            path
+            for path in self.path.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        ]
+
+
+@contextlib.contextmanager
+def file_lock(path: Path | str, *, timeout: float | None = None) -> Iterator[None]:
+    """Hold an exclusive lock on a file, shared between threads and processes.
+
+    The lock file is created if it doesn't exist, and is left in place afterwards.
+
+    Args:
+        path: The path to the lock file.
+        timeout: The maximum time to wait for the lock, in seconds. Defaults to
+                 waiting indefinitely.
+
+    Raises:
+        TimeoutError: If the lock could not be acquired within `timeout`.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with path.open("a+b") as f:
+        while not _try_lock(f):
+            if deadline is not None and time.monotonic() > deadline:
+                msg = f"Timed out waiting for the lock on {path}"
+                raise TimeoutError(msg)
+            time.sleep(0.05)
+
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def _try_lock(f: IO[bytes]) -> bool:
+    try:
+        if sys.platform == "win32":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(f: IO[bytes]) -> None:
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+import pins
+from fsspec.utils import get_protocol
+
+from geopins.boards import GeoBaseBoard
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `geopins` command line interface.
+
+    Args:
+        argv: The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        The exit code.
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "prefetch":
+        return _prefetch(args)
+
+    parser.print_help()
+    return 1
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="geopins", description="Geospatial support for the Python pins package."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    prefetch_parser = subparsers.add_parser(
+        "prefetch",
+        help="Download pins into the local pins cache concurrently.",
+        description=(
+            "Download pins into the local pins cache concurrently, ahead of reading "
+            "them, and report the download throughput."
+        ),
+    )
+    prefetch_parser.add_argument(
+        "board",
+        help="The board URL, e.g. s3://bucket/path, or a local directory.",
+    )
+    prefetch_parser.add_argument(
+        "names",
+        nargs="*",
+        help="The names of the pins to prefetch. Defaults to every pin on the board.",
+    )
+    prefetch_parser.add_argument(
+        "--version",
+        action="append",
+        default=[],
+        metavar="NAME=VERSION",
+        help="A specific pin version to prefetch. May be given more than once.",
+    )
+    prefetch_parser.add_argument(
+        "--pattern",
+        help='Only prefetch pins whose names match this glob pattern, e.g. "flood-*".',
+    )
+    prefetch_parser.add_argument(
+        "--bbox",
+        nargs=4,
+        type=float,
+        metavar=("XMIN", "YMIN", "XMAX", "YMAX"),
+        help="Only prefetch pins whose bounds intersect this bounding box.",
+    )
+    prefetch_parser.add_argument(
+        "--crs",
+        help="The CRS of --bbox, e.g. EPSG:2193. Defaults to the CRS of each pin.",
+    )
+    prefetch_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="The maximum number of pins to download at once. Defaults to 8.",
+    )
+
+    return parser
+
+
+def _prefetch(args: argparse.Namespace) -> int:
+    versions = {}
+    for item in args.version:
+        name, sep, version = item.partition("=")
+        if not sep:
+            msg = f"Expected --version NAME=VERSION, got {item!r}"
+            raise SystemExit(msg)
+        versions[name] = version
+
+    protocol = get_protocol(args.board)
+    path = args.board
+    if protocol != "file" or path.startswith("file://"):
+        # pins expects the path without the protocol, e.g. "bucket/path"
+        path = path.split("://", maxsplit=1)[1]
+
+    board = pins.board(protocol, path, board_factory=GeoBaseBoard)
+    report = board.prefetch(  # pyright: ignore[reportAttributeAccessIssue]
+        args.names or None,
+        versions=versions,
+        pattern=args.pattern,
+        bbox=tuple(args.bbox) if args.bbox is not None else None,
+        crs=args.crs,
+        max_workers=args.max_workers,
+    )
+
+    print(report)
+    for name, error in report.failed.items():
+        print(f"{name}: {error}", file=sys.stderr)
+    return 1 if report.failed else 0
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import json
+import warnings
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyogrio.raw
+import rasterio
+from pandas.util import hash_pandas_object
+from pyarrow import ipc
+from pyarrow import parquet as pq
+
+from geopins.drivers.gdf.dispatch import _get_lod_layer
+from geopins.drivers.gdf.filetypes.parquet import _get_bbox_covering
+from geopins.drivers.infer import infer_driver_info
+from geopins.meta import get_geopins_metadata
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numpy.typing import NDArray
+    from pins.boards import BaseBoard
+    from pins.meta import Meta
+
+# The number of features hashed at once when comparing GeoDataFrame pins row by row.
+_ROW_BATCH_SIZE = 65_536
+
+
+@dataclass
+class PinDiff:
+    """A summary of the changes between two versions of a pin.
+
+    Attributes:
+        name: The pin name.
+        version_a: The version compared from.
+        version_b: The version compared to.
+        identical: Whether the pin contents are identical, according to the pin hash.
+        changes: The metadata fields which differ, e.g. "n_rows", "columns", "bounds",
+                 "crs", "shape", "resolution" or "stats", as (old, new) pairs.
+        rows_added: The number of features only in `version_b`. Only set by a
+                    detailed diff of GeoDataFrame pins.
+        rows_removed: The number of features only in `version_a`. Only set by a
+                      detailed diff of GeoDataFrame pins.
+        blocks_changed: The number of raster blocks with any changed cells. Only set
+                        by a detailed diff of Raster pins.
+        cells_changed: The number of changed raster cells, in any band. Only set by a
+                       detailed diff of Raster pins.
+    """
+
+    name: str
+    version_a: str
+    version_b: str
+    identical: bool
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    rows_added: int | None = None
+    rows_removed: int | None = None
+    blocks_changed: int | None = None
+    cells_changed: int | None = None
+
+    def __str__(self) -> str:
+        lines = [f"{self.name}: {self.version_a} -> {self.version_b}"]
+        if self.identical:
+            lines.append("  identical contents")
+        for key, (old, new) in self.changes.items():
+            lines.append(f"  {key}: {old} -> {new}")
+        if self.rows_added is not None and self.rows_removed is not None:
+            lines.append(f"  rows: +{self.rows_added} -{self.rows_removed}")
+        if self.cells_changed is not None:
+            lines.append(
+                f"  cells changed: {self.cells_changed} "
+                f"(in {self.blocks_changed} blocks)"
+            )
+        return "\n".join(lines)
+
+
+def pin_diff(
+    board: BaseBoard,
+    name: str,
+    version_a: str,
+    version_b: str,
+    *,
+    detailed: bool = False,
+) -> PinDiff:
+    """Summarize the changes between two versions of a pin.
+
+    By default, only the pin metadata is compared, i.e. the pin hash, file size and
+    the summary recorded by geopins when each version was written (e.g. row count,
+    schema, extent, CRS, raster shape, resolution and statistics). Nothing is
+    downloaded.
+
+    A detailed diff also downloads both versions and compares them chunk by chunk,
+    without reading either in full. GeoDataFrame features are compared by hashing
+    each row (including its geometry, as WKB), so reordered features aren't counted
+    as changes. Rasters are compared block by block, and must be on the same grid.
+
+    Args:
+        board: The pins board the pin is stored on.
+        name: Pin name.
+        version_a: The version to compare from.
+        version_b: The version to compare to.
+        detailed: Whether to download both versions and count the changed features
+                  or raster cells. Supported for GeoDataFrame pins and GeoTIFF
+                  Raster pins.
+
+    Returns:
+        A summary of the changes.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta_a = board.pin_fetch(name, version_a)
+        meta_b = board.pin_fetch(name, version_b)
+
+    diff = PinDiff(
+        name=name,
+        version_a=version_a,
+        version_b=version_b,
+        identical=meta_a.pin_hash == meta_b.pin_hash,
+        changes=_get_metadata_changes(meta_a, meta_b),
+    )
+    if not detailed:
+        return diff
+
+    info_a = infer_driver_info(meta_a, board=board)
+    info_b = infer_driver_info(meta_b, board=board)
+    if info_a.dtype == "gdf" and info_b.dtype == "gdf":
+        if diff.identical:
+            diff.rows_added, diff.rows_removed = 0, 0
+        else:
+            diff.rows_added, diff.rows_removed = _diff_rows(meta_a, meta_b, board=board)
+    elif info_a.filetype == "tif" and info_b.filetype == "tif":
+        if diff.identical:
+            diff.blocks_changed, diff.cells_changed = 0, 0
+        else:
+            diff.blocks_changed, diff.cells_changed = _diff_cells(
+                meta_a, meta_b, board=board
+            )
+    else:
+        msg = (
+            "Detailed diffs are only supported for GeoDataFrame pins and GeoTIFF "
+            f"Raster pins, got {info_a.filetype!r} and {info_b.filetype!r} pins."
+        )
+        raise NotImplementedError(msg)
+
+    return diff
+
+
+def _get_metadata_changes(meta_a: Meta, meta_b: Meta) -> dict[str, tuple[Any, Any]]:
+    summary_a = {
+        "pin_hash": meta_a.pin_hash,
+        "file_size": meta_a.file_size,
+        **get_geopins_metadata(meta_a),
+    }
+    summary_b = {
+        "pin_hash": meta_b.pin_hash,
+        "file_size": meta_b.file_size,
+        **get_geopins_metadata(meta_b),
+    }
+
+    changes = {}
+    for key in [*summary_a, *(key for key in summary_b if key not in summary_a)]:
+        old, new = summary_a.get(key), summary_b.get(key)
+        if old != new:
+            changes[key] = (old, new)
+    return changes
+
+
+def _diff_rows(meta_a: Meta, meta_b: Meta, *, board: BaseBoard) -> tuple[int, int]:
+    hashes_a = np.concatenate(
+        [np.empty(0, dtype=np.uint64), *_iter_row_hashes(meta_a, board=board)]
+    )
+    hashes_b = np.concatenate(
+        [np.empty(0, dtype=np.uint64), *_iter_row_hashes(meta_b, board=board)]
+    )
+
+    # Match identical rows, allowing for duplicates.
+    unique_a, counts_a = np.unique(hashes_a, return_counts=True)
+    unique_b, counts_b = np.unique(hashes_b, return_counts=True)
+    _, idx_a, idx_b = np.intersect1d(
+        unique_a, unique_b, assume_unique=True, return_indices=True
+    )
+    n_matched = int(np.minimum(counts_a[idx_a], counts_b[idx_b]).sum())
+    return len(hashes_b) - n_matched, len(hashes_a) - n_matched
+
+
+def _iter_row_hashes(meta: Meta, *, board: BaseBoard) -> Iterator[NDArray[np.uint64]]:
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        filenames = board.pin_download(meta.name, version=meta.version.version)
+
+    filetype = infer_driver_info(meta, board=board).filetype
+    for filename in filenames:
+        if filetype in ("gpkg", "fgb"):
+            layer = _get_lod_layer(meta, max_tolerance=None)
+            with pyogrio.raw.open_arrow(
+                filename, layer=layer, batch_size=_ROW_BATCH_SIZE, use_pyarrow=True
+            ) as (_, reader):
+                for batch in reader:
+                    yield _hash_rows(batch, geometry=None)
+        elif filetype == "parquet":
+            with pq.ParquetFile(filename) as f:
+                geo = json.loads(f.schema_arrow.metadata[b"geo"])
+                covering = _get_bbox_covering(f.schema_arrow)
+                for batch in f.iter_batches(batch_size=_ROW_BATCH_SIZE):
+                    yield _hash_rows(
+                        batch,
+                        geometry=geo["primary_column"],
+                        # Derived from the geometries, so it needn't be compared.
+                        exclude=None if covering is None else covering["xmin"][0],
+                    )
+        elif filetype == "arrow":
+            with pa.memory_map(filename) as source:
+                reader = ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    yield _hash_rows(reader.get_batch(i), geometry=None)
+        else:
+            msg = (
+                f"Detailed diffs are not supported for {filetype!r} GeoDataFrame pins."
+            )
+            raise NotImplementedError(msg)
+
+
+def _hash_rows(
+    batch: pa.RecordBatch, *, geometry: str | None, exclude: str | None = None
+) -> NDArray[np.uint64]:
+    table = pa.Table.from_batches([batch])
+    if exclude is not None:
+        table = table.drop_columns([exclude])
+    nested = {field.name for field in table.schema if pa.types.is_nested(field.type)}
+
+    if geometry is None:
+        # GeoArrow geometries, which are normalized to WKB.
+        gdf = gpd.GeoDataFrame.from_arrow(table)
+        nested -= set(gdf.select_dtypes("geometry").columns)
+        df = pd.DataFrame(gdf.to_wkb()).rename(columns={gdf.geometry.name: "geometry"})
+    else:
+        # WKB geometries.
+        df = table.to_pandas().rename(columns={geometry: "geometry"})
+
+    # Lists and structs aren't hashable, so they are compared as JSON.
+    for column in nested:
+        df[column] = df[column].map(_to_json)
+
+    # Sort the columns, so that only their contents matter.
+    df = df[sorted(df.columns)]
+    # N.B. pandas.util exports this lazily, through a module `__getattr__`, so pyright
+    # infers the union of everything that module exports.
+    hashes = hash_pandas_object(df, index=False)  # pyright: ignore[reportCallIssue]
+    return cast("pd.Series", hashes).to_numpy()
+
+
+def _to_json(value: Any) -> str:
+    return json.dumps(
+        value, default=lambda x: x.tolist() if hasattr(x, "tolist") else str(x)
+    )
+
+
+def _diff_cells(meta_a: Meta, meta_b: Meta, *, board: BaseBoard) -> tuple[int, int]:
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        (filename_a,) = board.pin_download(meta_a.name, version=meta_a.version.version)
+        (filename_b,) = board.pin_download(meta_b.name, version=meta_b.version.version)
+
+    with rasterio.open(filename_a) as src_a, rasterio.open(filename_b) as src_b:
+        if (src_a.count, src_a.shape, src_a.transform) != (
+            src_b.count,
+            src_b.shape,
+            src_b.transform,
+        ):
+            msg = (
+                "Rasters can only be compared cell by cell if they have the same "
+                "number of bands, shape and transform."
+            )
+            raise ValueError(msg)
+
+        blocks_changed, cells_changed = 0, 0
+        for _, window in src_a.block_windows(1):
+            arr_a = src_a.read(window=window)
+            arr_b = src_b.read(window=window)
+            changed = arr_a != arr_b
+            if np.issubdtype(arr_a.dtype, np.floating):
+                changed &= ~(np.isnan(arr_a) & np.isnan(arr_b))
+            n_changed = int(changed.any(axis=0).sum())
+            blocks_changed += n_changed > 0
+            cells_changed += n_changed
+
+    return blocks_changed, cells_changed
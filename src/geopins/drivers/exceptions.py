@@ -46,3 +46,25 @@ def raise_driver_not_supported(
         else:
             # Change to assert_never after deprecating 3.11 support
             raise AssertionError
+
+
+class MemoryBudgetError(MemoryError):
+    """Raised when a pin is estimated to need more memory than `max_memory` allows.
+
+    The estimate is made from the pin metadata, before anything is downloaded.
+
+    Attributes:
+        name: The pin name.
+        estimate: The estimated memory needed to read the pin, in bytes.
+        max_memory: The memory budget, in bytes.
+    """
+
+    def __init__(self, name: str, *, estimate: int, max_memory: int, hint: str) -> None:
+        self.name = name
+        self.estimate = estimate
+        self.max_memory = max_memory
+        super().__init__(
+            f"Reading pin {name!r} needs an estimated {estimate / 1024**2:,.1f} MiB of "
+            f"memory, which exceeds `max_memory` ({max_memory / 1024**2:,.1f} MiB). "
+            f"{hint}"
+        )
@@ -1,33 +1,107 @@
 from __future__ import annotations
 
+import math
 import warnings
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from geopins.drivers.exceptions import raise_driver_not_supported
-from geopins.drivers.gdf.filetypes.gpkg import pin_read_gdf_gpkg, pin_write_gdf_gpkg
+import numpy as np
+from pyproj import CRS
+
+from geopins.cache import get_transcode_cache, get_variant_key
+from geopins.drivers.exceptions import MemoryBudgetError, raise_driver_not_supported
+from geopins.drivers.gdf.filetypes.arrow import (
+    pin_read_gdf_arrow,
+    pin_write_gdf_arrow,
+    read_gdf_arrow,
+    write_gdf_arrow,
+)
+from geopins.drivers.gdf.filetypes.fgb import (
+    pin_iter_gdf_fgb,
+    pin_read_gdf_fgb,
+    pin_write_gdf_fgb,
+)
+from geopins.drivers.gdf.filetypes.gpkg import (
+    get_lod_layer_name,
+    pin_iter_gdf_gpkg,
+    pin_read_gdf_gpkg,
+    pin_read_gdf_gpkg_transcoded,
+    pin_write_gdf_gpkg,
+)
 from geopins.drivers.gdf.filetypes.parquet import (
+    pin_iter_gdf_geoparquet,
+    pin_read_dask_gdf_parquet,
     pin_read_gdf_geoparquet,
     pin_write_gdf_parquet,
 )
 from geopins.drivers.infer import infer_driver_info
 from geopins.interfaces import PinReadKwargDict, PinWriteKwargDict
+from geopins.meta import (
+    add_geopins_metadata,
+    get_bounds_overlap,
+    get_geopins_metadata,
+    get_total_file_size,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from datetime import datetime
 
+    import dask_geopandas
     from geopandas import GeoDataFrame
     from pins.boards import BaseBoard
     from pins.meta import Meta
 
+    from geopins.cache import FileCache
+
+# The estimated in-memory size of a value in an object column (e.g. a string), and
+# the overhead of a geometry object on top of its coordinates, in bytes.
+_OBJECT_NBYTES = 64
+_GEOMETRY_NBYTES = 100
+
+
+@overload
+def pin_read_gdf(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    crs: CRS | str | None = None,
+    max_tolerance: float | None = None,
+    max_memory: int | None = None,
+    on_exceed: Literal["raise"] = "raise",
+    board: BaseBoard,
+) -> GeoDataFrame: ...
+
 
+@overload
 def pin_read_gdf(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    crs: CRS | str | None = None,
+    max_tolerance: float | None = None,
+    max_memory: int | None = None,
+    on_exceed: Literal["iterate"],
+    board: BaseBoard,
+) -> GeoDataFrame | Iterator[GeoDataFrame]: ...
+
+
+def pin_read_gdf(  # noqa: PLR0913
     name: str,
     version: str | None = None,
     hash: str | None = None,  # noqa: A002
     *,
+    bbox: tuple[float, float, float, float] | None = None,
+    crs: CRS | str | None = None,
+    max_tolerance: float | None = None,
+    max_memory: int | None = None,
+    on_exceed: Literal["raise", "iterate"] = "raise",
     board: BaseBoard,
-) -> GeoDataFrame:
+) -> GeoDataFrame | Iterator[GeoDataFrame]:
     """Return the GeoDataFrame stored in a pin.
 
     Args:
@@ -36,20 +110,89 @@ def pin_read_gdf(
         hash: A hash used to validate the retrieved pin data. If specified, it is
                 compared against the `pin_hash` field retrieved by
                 `pins.boards.BaseBoard.pin_meta`.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin. Supported for
+              FlatGeobuf, GeoPackage and GeoParquet pins.
+        crs: Reproject the GeoDataFrame to this CRS. The reprojected GeoDataFrame is
+             stored in the transcode cache, keyed by the pin hash and CRS, so later
+             reads don't reproject it again. Not supported with `bbox`.
+        max_tolerance: Read the most simplified variant of the geometries whose
+                       tolerance is at most this, in the units of the pin's CRS. The
+                       variants are those stored with `lod_tolerances` when the pin
+                       was written. If there is no such variant, the full precision
+                       geometries are read.
+        max_memory: A memory budget for the read, in bytes. The memory needed is
+                    estimated from the pin metadata (the number of rows, the column
+                    dtypes and the file size) before anything is downloaded, and
+                    scaled down by the fraction of the pin's extent within `bbox`.
+                    Defaults to no budget.
+        on_exceed: What to do if the estimate exceeds `max_memory`: "raise" a
+                   `MemoryBudgetError`, or "iterate" over the GeoDataFrame in batches
+                   sized to fit the budget, as with `pin_iter_gdf`. Iterating is
+                   supported for FlatGeobuf, GeoPackage and GeoParquet pins.
         board: The pins board to read from.
 
 
     Returns:
-        The GeoDataFrame stored in the pin.
+        The GeoDataFrame stored in the pin, or an iterator of GeoDataFrames if
+        `on_exceed` is "iterate" and the pin exceeds the budget.
     """
-    return _pin_read_gdf(name=name, version=version, hash=hash, board=board)
+    if max_memory is None or on_exceed == "raise":
+        return _pin_read_gdf(
+            name=name,
+            version=version,
+            hash=hash,
+            bbox=bbox,
+            crs=crs,
+            max_tolerance=max_tolerance,
+            max_memory=max_memory,
+            board=board,
+        )
+    elif on_exceed == "iterate":
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+            meta = board.pin_fetch(name, version)
+
+        estimate = _get_nbytes_estimate(meta, bbox=bbox)
+        if estimate <= max_memory:
+            return _pin_read_gdf(
+                name=name,
+                version=version,
+                hash=hash,
+                bbox=bbox,
+                crs=crs,
+                max_tolerance=max_tolerance,
+                board=board,
+                meta=meta,
+            )
+
+        n_rows = get_geopins_metadata(meta).get("n_rows")
+        batch_size = 65_536 if not n_rows else max(1, n_rows * max_memory // estimate)
+        return pin_iter_gdf(
+            name=name,
+            version=version,
+            hash=hash,
+            bbox=bbox,
+            crs=crs,
+            max_tolerance=max_tolerance,
+            batch_size=batch_size,
+            board=board,
+        )
+    else:
+        msg = f"`on_exceed` must be 'raise' or 'iterate', got {on_exceed!r}."
+        raise ValueError(msg)
 
 
-def _pin_read_gdf(
+def _pin_read_gdf(  # noqa: PLR0913
     name: str,
     version: str | None = None,
     hash: str | None = None,  # noqa: A002
     *,
+    bbox: tuple[float, float, float, float] | None = None,
+    crs: CRS | str | None = None,
+    max_tolerance: float | None = None,
+    max_memory: int | None = None,
     board: BaseBoard,
     meta: Meta | None = None,
 ) -> GeoDataFrame:
@@ -63,18 +206,296 @@ def _pin_read_gdf(
             warnings.simplefilter("ignore", category=ResourceWarning)
             meta = board.pin_fetch(name, version)
 
+    _check_memory_budget(name, bbox=bbox, max_memory=max_memory, meta=meta)
+
     kwargs = PinReadKwargDict(
         name=name,
         version=version,
         hash=hash,
     )
 
+    if crs is not None:
+        if bbox is not None:
+            msg = "`bbox` is not supported together with `crs`."
+            raise NotImplementedError(msg)
+        return _pin_read_gdf_reprojected(
+            board=board,
+            crs=CRS.from_user_input(crs),
+            max_tolerance=max_tolerance,
+            meta=meta,
+            **kwargs,
+        )
+
     filetype = infer_driver_info(meta, board=board).filetype
 
     if filetype == "gpkg":
-        return pin_read_gdf_gpkg(board=board, **kwargs)
+        layer = _get_lod_layer(meta, max_tolerance=max_tolerance)
+        transcode_cache: FileCache | None = getattr(board, "_transcode_cache", None)
+        if transcode_cache is not None and bbox is None and hash is None:
+            return pin_read_gdf_gpkg_transcoded(
+                board=board, layer=layer, cache=transcode_cache, meta=meta, **kwargs
+            )
+        return pin_read_gdf_gpkg(board=board, bbox=bbox, layer=layer, **kwargs)
+    elif filetype == "parquet":
+        return pin_read_gdf_geoparquet(board=board, bbox=bbox, **kwargs)
+    elif filetype == "fgb":
+        return pin_read_gdf_fgb(board=board, bbox=bbox, **kwargs)
+    elif filetype == "arrow":
+        if bbox is not None:
+            msg = "`bbox` is not supported for Arrow pins."
+            raise NotImplementedError(msg)
+        return pin_read_gdf_arrow(board=board, **kwargs)
+    else:
+        raise_driver_not_supported(filetype, cls=board.__class__, mode="read")
+        raise AssertionError  # Change to assert_never after deprecating 3.11 support
+
+
+def pin_iter_gdf(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    crs: CRS | str | None = None,
+    max_tolerance: float | None = None,
+    batch_size: int = 65_536,
+    board: BaseBoard,
+) -> Iterator[GeoDataFrame]:
+    """Stream the GeoDataFrame stored in a pin in batches, without reading it all.
+
+    Streaming is currently supported for FlatGeobuf, GeoPackage and GeoParquet pins.
+    GeoPackage and GeoParquet pins are downloaded in full, but only decoded a batch
+    at a time.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin. GeoParquet pins must
+              have a bounding box covering column, as written by
+              `pin_write_gdf_parquet`.
+        crs: Reproject each batch to this CRS. Not supported with `bbox`.
+        max_tolerance: Read the most simplified variant of the geometries whose
+                       tolerance is at most this, as with `pin_read_gdf`.
+        batch_size: The maximum number of features in each batch.
+        board: The pins board to read from.
+
+    Returns:
+        An iterator of GeoDataFrames of at most `batch_size` features.
+    """
+    if crs is not None and bbox is not None:
+        msg = "`bbox` is not supported together with `crs`."
+        raise NotImplementedError(msg)
+
+    batches = _pin_iter_gdf(
+        name=name,
+        version=version,
+        hash=hash,
+        bbox=bbox,
+        max_tolerance=max_tolerance,
+        batch_size=batch_size,
+        board=board,
+    )
+    if crs is None:
+        return batches
+    return (batch.to_crs(crs) for batch in batches)
+
+
+def _pin_iter_gdf(  # noqa: PLR0913
+    name: str,
+    version: str | None,
+    hash: str | None,  # noqa: A002
+    *,
+    bbox: tuple[float, float, float, float] | None,
+    max_tolerance: float | None,
+    batch_size: int,
+    board: BaseBoard,
+) -> Iterator[GeoDataFrame]:
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
+
+    filetype = infer_driver_info(meta, board=board).filetype
+
+    if filetype == "fgb":
+        return pin_iter_gdf_fgb(
+            name=name,
+            version=version,
+            hash=hash,
+            bbox=bbox,
+            batch_size=batch_size,
+            board=board,
+        )
+    elif filetype == "gpkg":
+        return pin_iter_gdf_gpkg(
+            name=name,
+            version=version,
+            hash=hash,
+            bbox=bbox,
+            layer=_get_lod_layer(meta, max_tolerance=max_tolerance),
+            batch_size=batch_size,
+            board=board,
+        )
     elif filetype == "parquet":
-        return pin_read_gdf_geoparquet(board=board, **kwargs)
+        return pin_iter_gdf_geoparquet(
+            name=name,
+            version=version,
+            hash=hash,
+            bbox=bbox,
+            batch_size=batch_size,
+            board=board,
+        )
+    else:
+        raise_driver_not_supported(filetype, cls=board.__class__, mode="read")
+        raise AssertionError  # Change to assert_never after deprecating 3.11 support
+
+
+def _check_memory_budget(
+    name: str,
+    *,
+    bbox: tuple[float, float, float, float] | None,
+    max_memory: int | None,
+    meta: Meta,
+) -> None:
+    if max_memory is None:
+        return
+    estimate = _get_nbytes_estimate(meta, bbox=bbox)
+    if estimate > max_memory:
+        raise MemoryBudgetError(
+            name,
+            estimate=estimate,
+            max_memory=max_memory,
+            hint="Read a smaller `bbox`, or iterate over the pin in batches with "
+            '`on_exceed="iterate"`.',
+        )
+
+
+def _get_nbytes_estimate(
+    meta: Meta, *, bbox: tuple[float, float, float, float] | None
+) -> int:
+    # The memory needed to read a pin, estimated from its metadata. The geometries are
+    # assumed to be about as large as the file per row, plus the object overhead.
+    geopins_meta = get_geopins_metadata(meta)
+    file_size = get_total_file_size(meta)
+    n_rows = geopins_meta.get("n_rows")
+    columns = geopins_meta.get("columns")
+    if not n_rows or columns is None:
+        return round(file_size * get_bounds_overlap(meta, bbox))
+
+    row_nbytes = 0.0
+    for dtype in columns.values():
+        if dtype == "geometry":
+            row_nbytes += _GEOMETRY_NBYTES + file_size / n_rows
+            continue
+        try:
+            itemsize = np.dtype(dtype).itemsize
+        except TypeError:
+            # e.g. pandas extension dtypes, such as "string" or "category"
+            itemsize = 0
+        row_nbytes += itemsize if itemsize and dtype != "object" else _OBJECT_NBYTES
+    return round(n_rows * row_nbytes * get_bounds_overlap(meta, bbox))
+
+
+def _pin_read_gdf_reprojected(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    crs: CRS,
+    max_tolerance: float | None,
+    board: BaseBoard,
+    meta: Meta,
+) -> GeoDataFrame:
+    cache = get_transcode_cache(board)
+    key = get_variant_key(
+        meta.pin_hash,
+        ".arrow",
+        crs=crs.to_wkt(),
+        layer=_get_lod_layer(meta, max_tolerance=max_tolerance),
+    )
+
+    path = cache.get(key) if hash is None else None
+    if path is not None:
+        try:
+            return read_gdf_arrow(path)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            pass
+
+    gdf = _pin_read_gdf(
+        name=name,
+        version=version,
+        hash=hash,
+        max_tolerance=max_tolerance,
+        board=board,
+        meta=meta,
+    )
+    if gdf.crs is not None and CRS.from_user_input(gdf.crs) == crs:
+        # Already in the target CRS, so there's no need for a variant.
+        return gdf
+
+    gdf = gdf.to_crs(crs)
+    cache.put(key, lambda path: write_gdf_arrow(gdf, path))
+    return gdf
+
+
+def _get_lod_layer(meta: Meta, *, max_tolerance: float | None) -> str | None:
+    # The GeoPackage layer to read, or None for pins with a single layer.
+    lods = get_geopins_metadata(meta).get("lods")
+    if not lods:
+        return None
+
+    tolerances = [
+        lod["tolerance"]
+        for lod in lods
+        if max_tolerance is not None and lod["tolerance"] <= max_tolerance
+    ]
+    if not tolerances:
+        # The main layer, which pyogrio names after the file.
+        return Path(str(meta.file)).stem
+    return get_lod_layer_name(max(tolerances))
+
+
+def pin_read_dask_gdf(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    board: BaseBoard,
+) -> dask_geopandas.GeoDataFrame:
+    """Return the GeoDataFrame stored in a pin as a partitioned dask GeoDataFrame.
+
+    Partitions are read lazily and can be processed in parallel, across all cores or
+    a dask cluster. This is currently supported for GeoParquet pins, which have a
+    partition per row group, and requires the `dask` extra.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        board: The pins board to read from.
+
+    Returns:
+        A dask GeoDataFrame, with spatial partition bounds where they are recorded in
+        the pin.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
+
+    filetype = infer_driver_info(meta, board=board).filetype
+
+    if filetype == "parquet":
+        return pin_read_dask_gdf_parquet(
+            name=name, version=version, hash=hash, board=board
+        )
     else:
         raise_driver_not_supported(filetype, cls=board.__class__, mode="read")
         raise AssertionError  # Change to assert_never after deprecating 3.11 support
@@ -92,6 +513,13 @@ def pin_write_gdf(  # noqa: PLR0913
     created: datetime | None = None,
     *,
     force_identical_write: bool = False,
+    compression: str | None = None,
+    compression_level: int | None = None,
+    sort: Literal["hilbert", "quadkey"] | None = None,
+    row_group_size: int | None = None,
+    use_arrow: bool | None = None,
+    spatial_index: bool | None = None,
+    lod_tolerances: Sequence[float] | None = None,
     board: BaseBoard,
 ) -> Meta:
     """Write a GeoDataFrame object to the board.
@@ -99,8 +527,8 @@ def pin_write_gdf(  # noqa: PLR0913
     Args:
         x: A GeoDataFrame to pin.
         name: Pin name.
-        type: File type used to save `x` to disk. May be "gpkg", or "parquet". Defaults
-              to "parquet".
+        type: File type used to save `x` to disk. May be "gpkg", "parquet", "fgb", or
+              "arrow" (also known as "feather"). Defaults to "gpkg".
         title: A title for the pin; most important for shared boards so that others
                 can understand what the pin contains. If omitted, a brief description
                 of the contents will be automatically generated.
@@ -114,6 +542,25 @@ def pin_write_gdf(  # noqa: PLR0913
                                 to the last version (compared using the hash). Only
                                 the pin contents are compared, not the pin metadata.
                                 Defaults to False.
+        compression: The compression codec, for Arrow and GeoParquet pins only. For
+                     Arrow pins, may be "lz4", "zstd" or "uncompressed" (the default,
+                     which allows zero-copy memory-mapped reads). For GeoParquet pins,
+                     defaults to "snappy".
+        compression_level: The compression level, for GeoParquet pins only.
+        sort: Reorder the features along a space-filling curve ("hilbert" or
+              "quadkey") before writing, for GeoParquet pins only. This clusters
+              each row group spatially, so reads with a `bbox` can skip most of them.
+        row_group_size: The maximum number of features in each row group, for
+                        GeoParquet pins only.
+        use_arrow: Whether to write the features in bulk using pyogrio's Arrow
+                   interface, for GeoPackage pins only. Defaults to True.
+        spatial_index: Whether to build the spatial index, for GeoPackage pins only.
+                       Defaults to True.
+        lod_tolerances: Also store variants of the geometries simplified at these
+                        tolerances, e.g. (1, 10, 100), in the units of the CRS. These
+                        are much smaller to read where full precision isn't needed,
+                        e.g. for web maps; see `max_tolerance` in `pin_read_gdf`. For
+                        GeoPackage pins only.
         board: The (geo)pins board to write to.
 
     Returns:
@@ -131,16 +578,105 @@ def pin_write_gdf(  # noqa: PLR0913
         type=type_,
         title=title,
         description=description,
-        metadata=metadata,
+        metadata=add_geopins_metadata(
+            metadata, **_get_summary_metadata(x, lod_tolerances=lod_tolerances)
+        ),
         versioned=versioned,
         created=created,
         force_identical_write=force_identical_write,
     )
 
+    _check_write_options(
+        type_,
+        compression=compression,
+        compression_level=compression_level,
+        sort=sort,
+        row_group_size=row_group_size,
+        use_arrow=use_arrow,
+        spatial_index=spatial_index,
+        lod_tolerances=lod_tolerances,
+    )
+
     if type_ in ("geopackage", "gpkg"):
-        return pin_write_gdf_gpkg(x, board=board, **kwargs)
+        kwargs["type"] = "gpkg"
+        if use_arrow is None:
+            use_arrow = True
+        if spatial_index is None:
+            spatial_index = True
+        return pin_write_gdf_gpkg(
+            x,
+            board=board,
+            use_arrow=use_arrow,
+            spatial_index=spatial_index,
+            lod_tolerances=lod_tolerances or (),
+            **kwargs,
+        )
     elif type_ == "parquet":
-        return pin_write_gdf_parquet(x, board=board, **kwargs)
+        if compression is None:
+            compression = "snappy"
+        return pin_write_gdf_parquet(
+            x,
+            board=board,
+            sort=sort,
+            row_group_size=row_group_size,
+            compression=compression,  # pyright: ignore[reportArgumentType]
+            compression_level=compression_level,
+            **kwargs,
+        )
+    elif type_ == "fgb":
+        return pin_write_gdf_fgb(x, board=board, **kwargs)
+    elif type_ in ("arrow", "feather"):
+        # N.B. pins also treats "feather" as an alias for "arrow"
+        kwargs["type"] = "arrow"
+        if compression is None:
+            compression = "uncompressed"
+        return pin_write_gdf_arrow(
+            x,
+            board=board,
+            compression=compression,  # pyright: ignore[reportArgumentType]
+            **kwargs,
+        )
     else:
         raise_driver_not_supported(type_, cls=board.__class__, mode="write")
         raise AssertionError  # Change to assert_never after deprecating 3.11 support
+
+
+def _check_write_options(type_: str, **options: object) -> None:
+    # Filetype-specific options, and the filetypes (including aliases) supporting them
+    supported_types = {
+        "compression": ("Arrow and GeoParquet", ("arrow", "feather", "parquet")),
+        "compression_level": ("GeoParquet", ("parquet",)),
+        "sort": ("GeoParquet", ("parquet",)),
+        "row_group_size": ("GeoParquet", ("parquet",)),
+        "use_arrow": ("GeoPackage", ("geopackage", "gpkg")),
+        "spatial_index": ("GeoPackage", ("geopackage", "gpkg")),
+        "lod_tolerances": ("GeoPackage", ("geopackage", "gpkg")),
+    }
+    for option, value in options.items():
+        display_name, types = supported_types[option]
+        if value is not None and type_ not in types:
+            msg = f"`{option}` is only supported for {display_name} GeoDataFrame pins."
+            raise NotImplementedError(msg)
+
+
+def _get_summary_metadata(
+    x: GeoDataFrame, *, lod_tolerances: Sequence[float] | None
+) -> dict[str, Any]:
+    # Recorded with the pin, so the extent of a pin is known without reading it.
+    bounds = [float(v) for v in x.total_bounds]
+    summary = {
+        "bounds": None if any(math.isnan(v) for v in bounds) else bounds,
+        "crs": None if x.crs is None else x.crs.to_string(),
+        "n_rows": len(x),
+        "columns": {str(column): str(dtype) for column, dtype in x.dtypes.items()},
+    }
+
+    # The simplified variants, so readers can pick one without listing the layers.
+    if lod_tolerances:
+        if any(tolerance <= 0 for tolerance in lod_tolerances):
+            msg = f"`lod_tolerances` must be positive, got {lod_tolerances}."
+            raise ValueError(msg)
+        summary["lods"] = [
+            {"tolerance": float(tolerance)} for tolerance in sorted(lod_tolerances)
+        ]
+    return summary
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import tempfile
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import pyogrio
+
+from geopins.filetypes import get_pin_file_stem
+from geopins.fs import get_gdal_pin_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from datetime import datetime
+
+    from geopandas import GeoDataFrame
+    from pins.boards import BaseBoard
+    from pins.meta import Meta
+
+
+def pin_read_gdf_fgb(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    board: BaseBoard,
+) -> GeoDataFrame:
+    """Return the GeoDataFrame stored in a pin as a FlatGeobuf.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin. The spatial index is
+              used to avoid reading other features; on remote boards, only the index
+              and the matching features are fetched, using ranged requests.
+        board: The (geo)pins board to read from.
+
+    Returns:
+        The GeoDataFrame stored in the pin.
+    """
+    path = get_gdal_pin_path(name=name, version=version, hash=hash, board=board)
+    return gpd.read_file(path, bbox=bbox)
+
+
+def pin_iter_gdf_fgb(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    batch_size: int = 65_536,
+    board: BaseBoard,
+) -> Iterator[GeoDataFrame]:
+    """Stream the GeoDataFrame stored in a pin as a FlatGeobuf, in batches of features.
+
+    Only one batch of features is held in memory at a time.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin.
+        batch_size: The maximum number of features in each batch.
+        board: The (geo)pins board to read from.
+
+    Yields:
+        GeoDataFrames of at most `batch_size` features.
+    """
+    path = get_gdal_pin_path(name=name, version=version, hash=hash, board=board)
+
+    with pyogrio.open_arrow(
+        path, bbox=bbox, batch_size=batch_size, use_pyarrow=True
+    ) as (arrow_meta, reader):
+        geometry_name = arrow_meta["geometry_name"] or "wkb_geometry"
+        for batch in reader:
+            df = batch.to_pandas()
+            geometry = gpd.GeoSeries.from_wkb(
+                df.pop(geometry_name), crs=arrow_meta["crs"]
+            ).rename("geometry")
+            yield gpd.GeoDataFrame(df, geometry=geometry)
+
+
+def pin_write_gdf_fgb(  # noqa: PLR0913
+    # N.B. match pins.boards.BaseBoard.pin_write signature
+    x: GeoDataFrame,
+    name: str | None = None,
+    type: str | None = None,  # noqa: A002
+    title: str | None = None,
+    description: str | None = None,
+    metadata: Mapping | None = None,
+    versioned: bool | None = None,  # noqa: FBT001
+    created: datetime | None = None,
+    *,
+    force_identical_write: bool = False,
+    board: BaseBoard,
+) -> Meta:
+    """Write a GeoDataFrame object to the board as a FlatGeobuf.
+
+    A packed Hilbert R-tree spatial index is always written, so that the pin can be
+    read efficiently with a bounding box filter.
+
+    Args:
+        x: A GeoDataFrame to pin.
+        name: Pin name.
+        type: File type used to save `x` to disk. Only "fgb" is supported.
+        title: A title for the pin; most important for shared boards so that others
+                can understand what the pin contains. If omitted, a brief description
+                of the contents will be automatically generated.
+        description: A detailed description of the pin contents.
+        metadata: A dictionary containing additional metadata to store with the pin.
+                    This gets stored on the Meta.user field.
+        versioned: Whether the pin should be versioned. Defaults to versioning.
+        created: A date to store in the Meta.created field. This field may be used
+                    as part of the pin version name.
+        force_identical_write: Store the pin even if the pin contents are identical
+                                to the last version (compared using the hash). Only
+                                the pin contents are compared, not the pin metadata.
+                                Defaults to False.
+        board: The (geo)pins board to write to.
+
+    Returns:
+        Metadata about the stored pin. If `force_identical_write` is False and the
+        pin contents are identical to the last version, the last version's metadata
+        is returned.
+    """
+    if type != "fgb":
+        msg = 'Only `type="fgb"` is supported for this function.'
+        raise ValueError(msg)
+    if force_identical_write:
+        msg = "`force_identical_write=True` is not supported for GeoDataFrame pins."
+        raise NotImplementedError(msg)
+    if versioned is not None:
+        msg = "`versioned` is not supported for GeoDataFrame pins."
+        raise NotImplementedError(msg)
+    if created is not None:
+        msg = "`created` is not supported for GeoDataFrame pins."
+        raise NotImplementedError(msg)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir_path = Path(tmpdir)
+
+        path = Path(tmpdir_path) / f"{get_pin_file_stem(name)}.fgb"
+        x.to_file(path, driver="FlatGeobuf", SPATIAL_INDEX="YES")
+
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+
+            return board.pin_upload(
+                paths=[path.as_posix()],
+                name=name,
+                title=title,
+                description=description,
+                metadata=metadata,
+            )
@@ -6,21 +6,32 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import geopandas as gpd
+import pyarrow as pa
+import pyogrio
+
+from geopins.cache import get_variant_key
+from geopins.drivers.gdf.filetypes.arrow import read_gdf_arrow, write_gdf_arrow
+from geopins.filetypes import get_pin_file_stem
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from datetime import datetime
 
     from geopandas import GeoDataFrame
     from pins.boards import BaseBoard
     from pins.meta import Meta
 
+    from geopins.cache import FileCache
+
 
-def pin_read_gdf_gpkg(
+def pin_read_gdf_gpkg(  # noqa: PLR0913
     name: str,
     version: str | None = None,
     hash: str | None = None,  # noqa: A002
     *,
+    bbox: tuple[float, float, float, float] | None = None,
+    layer: str | None = None,
+    use_arrow: bool = True,
     board: BaseBoard,
 ) -> GeoDataFrame:
     """Return the GeoDataFrame stored in a pin as a GeoPackage.
@@ -33,6 +44,13 @@ def pin_read_gdf_gpkg(
                 `pins.boards.BaseBoard.pin_meta`.
         verify_type: The expected datatype of the pin. This is mostly useful for
                         typechecked code.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin.
+        layer: The layer to read, e.g. a simplified variant (see
+               `get_lod_layer_name`). Defaults to the only layer.
+        use_arrow: Whether to read the features in bulk using pyogrio's Arrow
+                   streaming interface, which is much faster than reading them one
+                   at a time. Defaults to True.
         board: The (geo)pins board to read from.
 
     Returns:
@@ -50,7 +68,106 @@ def pin_read_gdf_gpkg(
         msg = f"Expected 1 file, got {len(filenames)}"
         raise ValueError(msg) from None
 
-    return gpd.read_file(filename)
+    return gpd.read_file(
+        filename, bbox=bbox, layer=layer, engine="pyogrio", use_arrow=use_arrow
+    )
+
+
+def pin_iter_gdf_gpkg(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    layer: str | None = None,
+    batch_size: int = 65_536,
+    board: BaseBoard,
+) -> Iterator[GeoDataFrame]:
+    """Stream the GeoDataFrame stored in a pin as a GeoPackage, in batches of features.
+
+    The GeoPackage is downloaded, but only one batch of features is decoded and held
+    in memory at a time.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin.
+        layer: The layer to read, e.g. a simplified variant (see
+               `get_lod_layer_name`). Defaults to the only layer.
+        batch_size: The maximum number of features in each batch.
+        board: The (geo)pins board to read from.
+
+    Yields:
+        GeoDataFrames of at most `batch_size` features.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        filenames = board.pin_download(name=name, version=version, hash=hash)
+
+    try:
+        (filename,) = filenames
+    except ValueError:
+        msg = f"Expected 1 file, got {len(filenames)}"
+        raise ValueError(msg) from None
+
+    with pyogrio.open_arrow(
+        filename, layer=layer, bbox=bbox, batch_size=batch_size, use_pyarrow=True
+    ) as (_, reader):
+        for batch in reader:
+            yield gpd.GeoDataFrame.from_arrow(pa.Table.from_batches([batch]))
+
+
+def pin_read_gdf_gpkg_transcoded(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    layer: str | None = None,
+    cache: FileCache,
+    board: BaseBoard,
+    meta: Meta,
+) -> GeoDataFrame:
+    """Return the GeoDataFrame stored in a pin as a GeoPackage, via a local copy.
+
+    The first read decodes the GeoPackage as usual, and transcodes it into an
+    uncompressed Arrow IPC file in the cache, keyed by the pin hash. Later reads
+    memory-map that copy instead, which is much faster than decoding the GeoPackage.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        layer: The layer to read, e.g. a simplified variant (see
+               `get_lod_layer_name`). Defaults to the only layer.
+        cache: The local cache of transcoded files.
+        board: The (geo)pins board to read from.
+        meta: The pin metadata.
+
+    Returns:
+        The GeoDataFrame stored in the pin.
+    """
+    key = get_variant_key(meta.pin_hash, ".arrow", layer=layer)
+
+    path = cache.get(key)
+    if path is not None:
+        try:
+            return read_gdf_arrow(path)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            pass
+
+    gdf = pin_read_gdf_gpkg(
+        name=name, version=version, hash=hash, layer=layer, board=board
+    )
+    cache.put(key, lambda path: write_gdf_arrow(gdf, path))
+    return gdf
 
 
 def pin_write_gdf_gpkg(  # noqa: PLR0913
@@ -65,10 +182,16 @@ def pin_write_gdf_gpkg(  # noqa: PLR0913
     created: datetime | None = None,
     *,
     force_identical_write: bool = False,
+    use_arrow: bool = True,
+    spatial_index: bool = True,
+    lod_tolerances: Sequence[float] = (),
     board: BaseBoard,
 ) -> Meta:
     """Write a GeoDataFrame object to the board as a GeoPackage.
 
+    The features are written by pyogrio within a single transaction per layer, rather
+    than committing them one at a time.
+
     Args:
         x: A GeoDataFrame to pin.
         name: Pin name.
@@ -86,6 +209,17 @@ def pin_write_gdf_gpkg(  # noqa: PLR0913
                                 to the last version (compared using the hash). Only
                                 the pin contents are compared, not the pin metadata.
                                 Defaults to False.
+        use_arrow: Whether to write the features in bulk using pyogrio's Arrow
+                   interface, which is much faster than writing them one at a time.
+                   Defaults to True.
+        spatial_index: Whether to build the spatial index (an R-tree), which speeds
+                       up reads with a bounding box filter. GDAL builds it in bulk
+                       once all features are written. Pins which are only ever read
+                       in full can skip it to save time and space. Defaults to True.
+        lod_tolerances: Also store simplified variants of the geometries at these
+                        tolerances (in the units of the CRS), as extra layers named
+                        by `get_lod_layer_name`. The main layer keeps the full
+                        precision geometries.
         board: The (geo)pins board to write to.
 
     Returns:
@@ -109,8 +243,25 @@ def pin_write_gdf_gpkg(  # noqa: PLR0913
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
 
-        path = Path(tmpdir_path) / f"{name}.gpkg"
-        x.to_file(path, driver="GPKG")
+        path = Path(tmpdir_path) / f"{get_pin_file_stem(name)}.gpkg"
+        x.to_file(
+            path,
+            driver="GPKG",
+            engine="pyogrio",
+            use_arrow=use_arrow,
+            SPATIAL_INDEX="YES" if spatial_index else "NO",
+        )
+        for tolerance in lod_tolerances:
+            # N.B. topology-preserving, so polygons stay valid.
+            simplified = x.set_geometry(x.geometry.simplify(tolerance))
+            simplified.to_file(
+                path,
+                layer=get_lod_layer_name(tolerance),
+                driver="GPKG",
+                engine="pyogrio",
+                use_arrow=use_arrow,
+                SPATIAL_INDEX="YES" if spatial_index else "NO",
+            )
 
         with warnings.catch_warnings():
             # Upstream issue relating to opening files without context managers
@@ -123,3 +274,15 @@ def pin_write_gdf_gpkg(  # noqa: PLR0913
                 description=description,
                 metadata=metadata,
             )
+
+
+def get_lod_layer_name(tolerance: float) -> str:
+    """Get the name of the GeoPackage layer holding a simplified variant of a pin.
+
+    Args:
+        tolerance: The simplification tolerance, in the units of the CRS.
+
+    Returns:
+        The layer name, e.g. "lod_10" for a tolerance of 10.
+    """
+    return f"lod_{tolerance:g}"
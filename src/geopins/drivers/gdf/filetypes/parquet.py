@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import json
 import tempfile
 import warnings
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 import geopandas as gpd
+import numpy as np
+import pyarrow as pa
+import shapely
+from pyarrow import compute as pc
+from pyarrow import parquet as pq
+
+from geopins.filetypes import get_pin_file_stem
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
     from datetime import datetime
 
-    from geopandas import GeoDataFrame
+    import dask_geopandas
+    from geopandas import GeoDataFrame, GeoSeries
+    from numpy.typing import NDArray
     from pins.boards import BaseBoard
     from pins.meta import Meta
 
@@ -21,6 +31,7 @@ def pin_read_gdf_geoparquet(
     version: str | None = None,
     hash: str | None = None,  # noqa: A002
     *,
+    bbox: tuple[float, float, float, float] | None = None,
     board: BaseBoard,
 ) -> GeoDataFrame:
     """Return the GeoDataFrame stored in a pin as a GeoParquet.
@@ -33,6 +44,11 @@ def pin_read_gdf_geoparquet(
                 `pins.boards.BaseBoard.pin_meta`.
         verify_type: The expected datatype of the pin. This is mostly useful for
                         typechecked code.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin. Row groups are skipped
+              using their bounding box statistics, so this is most effective for
+              spatially sorted pins. Requires a pin with a bounding box covering
+              column, as written by `pin_write_gdf_parquet`.
         board: The (geo)pins board to read from.
 
     Returns:
@@ -49,7 +65,223 @@ def pin_read_gdf_geoparquet(
         msg = f"Expected 1 file, got {len(filenames)}"
         raise ValueError(msg) from None
 
-    return gpd.read_parquet(filename)
+    return gpd.read_parquet(filename, bbox=bbox)
+
+
+def pin_iter_gdf_geoparquet(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    batch_size: int = 65_536,
+    board: BaseBoard,
+) -> Iterator[GeoDataFrame]:
+    """Stream the GeoDataFrame stored in a pin as a GeoParquet, in batches of features.
+
+    The GeoParquet is downloaded, but only one batch of features is decoded and held
+    in memory at a time.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bbox: Only read features intersecting this bounding box, given as
+              (xmin, ymin, xmax, ymax) in the CRS of the pin. As with
+              `pin_read_gdf_geoparquet`, row groups are skipped using their bounding
+              box statistics, and this requires a pin with a bounding box covering
+              column.
+        batch_size: The maximum number of features in each batch.
+        board: The (geo)pins board to read from.
+
+    Yields:
+        GeoDataFrames of at most `batch_size` features.
+
+    Raises:
+        ValueError: If `bbox` is given and the pin has no bounding box covering
+                    column.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        filenames = board.pin_download(name=name, version=version, hash=hash)
+
+    for filename in filenames:
+        with pq.ParquetFile(filename) as f:
+            covering = _get_bbox_covering(f.schema_arrow)
+            row_groups = _get_row_groups(f.metadata, covering=covering, bbox=bbox)
+            for batch in f.iter_batches(
+                batch_size=batch_size, row_groups=row_groups, use_pandas_metadata=True
+            ):
+                table = pa.Table.from_batches([batch])
+                if bbox is not None and covering is not None:
+                    table = table.filter(_get_bbox_filter(covering, bbox=bbox))
+                yield _read_row_group_gdf(table, covering=covering)
+
+
+def _get_row_groups(
+    metadata: pq.FileMetaData,
+    *,
+    covering: dict[str, list[str]] | None,
+    bbox: tuple[float, float, float, float] | None,
+) -> list[int]:
+    # The row groups which may contain features intersecting the bounding box.
+    if bbox is None:
+        return list(range(metadata.num_row_groups))
+    if covering is None:
+        msg = (
+            "`bbox` is only supported for GeoParquet pins with a bounding box "
+            "covering column, as written by `pin_write_gdf_parquet`."
+        )
+        raise ValueError(msg)
+
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        bounds = _get_row_group_bounds(metadata, i, covering)
+        if bounds is None or shapely.box(*bounds).intersects(shapely.box(*bbox)):
+            row_groups.append(i)
+    return row_groups
+
+
+def _get_bbox_filter(
+    covering: dict[str, list[str]], *, bbox: tuple[float, float, float, float]
+) -> pc.Expression:
+    # The features whose bounding boxes intersect the bounding box, as with the
+    # `bbox` filter of gpd.read_parquet.
+    xmin, ymin, xmax, ymax = bbox
+    return (
+        (pc.field(*covering["xmin"]) <= xmax)
+        & (pc.field(*covering["xmax"]) >= xmin)
+        & (pc.field(*covering["ymin"]) <= ymax)
+        & (pc.field(*covering["ymax"]) >= ymin)
+    )
+
+
+def pin_read_dask_gdf_parquet(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    board: BaseBoard,
+) -> dask_geopandas.GeoDataFrame:
+    """Return the GeoDataFrame stored in a pin as GeoParquet, as a dask GeoDataFrame.
+
+    Each row group (of each file, for multi-file pins) is a separate partition, which
+    is only read when computed. Where the files have a bounding box covering column
+    (as written by `pin_write_gdf_parquet`), the row group statistics give the
+    spatial extent of each partition, so spatial operations such as `sjoin` can skip
+    partitions which don't overlap. Requires the `dask` extra.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        board: The (geo)pins board to read from.
+
+    Returns:
+        The GeoDataFrame stored in the pin, as a lazily-evaluated dask GeoDataFrame.
+    """
+    try:
+        import dask.dataframe as dd  # noqa: PLC0415
+        import dask_geopandas  # noqa: PLC0415
+    except ImportError as err:
+        msg = (
+            "Reading pins as dask GeoDataFrames requires dask-geopandas, which is "
+            "installed with the `dask` extra, i.e. `pip install geopins[dask]`."
+        )
+        raise ImportError(msg) from err
+
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        filenames = board.pin_download(name=name, version=version, hash=hash)
+
+    parts = []
+    partition_bounds = []
+    for filename in filenames:
+        metadata = pq.read_metadata(filename)
+        covering = _get_bbox_covering(metadata.schema.to_arrow_schema())
+        for i in range(metadata.num_row_groups):
+            parts.append((filename, i))
+            partition_bounds.append(_get_row_group_bounds(metadata, i, covering))
+
+    schema = pq.read_schema(filenames[0])
+    meta = _read_row_group_gdf(
+        schema.empty_table(), covering=_get_bbox_covering(schema)
+    )
+    ddf = dd.from_map(
+        _read_row_group, parts, meta=meta, enforce_metadata=False, divisions=None
+    )
+    ddf = dask_geopandas.from_dask_dataframe(ddf, geometry=meta.geometry.name)
+
+    if parts and all(bounds is not None for bounds in partition_bounds):
+        ddf.spatial_partitions = gpd.GeoSeries(
+            [shapely.box(*bounds) for bounds in partition_bounds], crs=meta.crs
+        )
+
+    return ddf
+
+
+def _read_row_group(part: tuple[str, int]) -> GeoDataFrame:
+    filename, i = part
+    with pq.ParquetFile(filename) as f:
+        table = f.read_row_group(i, use_pandas_metadata=True)
+    return _read_row_group_gdf(table, covering=_get_bbox_covering(table.schema))
+
+
+def _read_row_group_gdf(
+    table: pa.Table, *, covering: dict[str, list[str]] | None
+) -> GeoDataFrame:
+    # N.B. geopandas doesn't expose reading a single row group, so this uses the
+    # same (private) conversion as gpd.read_parquet and dask_geopandas.read_parquet.
+    # It is imported here, so that only iterated and dask reads depend on it.
+    from geopandas.io.arrow import (  # noqa: PLC0415
+        _arrow_to_geopandas,  # pyright: ignore[reportAttributeAccessIssue]
+    )
+
+    # The covering column isn't part of the data, as with gpd.read_parquet
+    if covering is not None and covering["xmin"][0] in table.column_names:
+        table = table.drop_columns(covering["xmin"][0])
+    return _arrow_to_geopandas(table)
+
+
+def _get_bbox_covering(schema: pa.Schema) -> dict[str, list[str]] | None:
+    # The bounding box covering column of the primary geometry, per GeoParquet 1.1
+    geo_metadata: dict[str, Any] = json.loads((schema.metadata or {})[b"geo"])
+    geometry_metadata = geo_metadata["columns"][geo_metadata["primary_column"]]
+    return geometry_metadata.get("covering", {}).get("bbox")
+
+
+def _get_row_group_bounds(
+    metadata: pq.FileMetaData, i: int, covering: dict[str, list[str]] | None
+) -> tuple[float, float, float, float] | None:
+    if covering is None:
+        return None
+
+    row_group = metadata.row_group(i)
+    statistics = {}
+    for j in range(row_group.num_columns):
+        column = row_group.column(j)
+        statistics[column.path_in_schema] = column.statistics
+
+    bounds = []
+    for key, attr in [
+        ("xmin", "min"),
+        ("ymin", "min"),
+        ("xmax", "max"),
+        ("ymax", "max"),
+    ]:
+        stats = statistics.get(".".join(covering[key]))
+        if stats is None or not stats.has_min_max:
+            return None
+        bounds.append(getattr(stats, attr))
+
+    xmin, ymin, xmax, ymax = bounds
+    return xmin, ymin, xmax, ymax
 
 
 def pin_write_gdf_parquet(  # noqa: PLR0913
@@ -64,14 +296,23 @@ def pin_write_gdf_parquet(  # noqa: PLR0913
     created: datetime | None = None,
     *,
     force_identical_write: bool = False,
+    sort: Literal["hilbert", "quadkey"] | None = None,
+    row_group_size: int | None = None,
+    compression: Literal[
+        "snappy", "gzip", "brotli", "lz4", "zstd", "uncompressed"
+    ] = "snappy",
+    compression_level: int | None = None,
     board: BaseBoard,
 ) -> Meta:
-    """Write a GeoDataFrame object to the board as a GeoPackage.
+    """Write a GeoDataFrame object to the board as a GeoParquet.
+
+    A bounding box covering column is always written, so that each row group records
+    bounding box statistics which readers can use to skip row groups.
 
     Args:
         x: A GeoDataFrame to pin.
         name: Pin name.
-        type: File type used to save `x` to disk. Only "gpkg" is supported.
+        type: File type used to save `x` to disk. Only "parquet" is supported.
         title: A title for the pin; most important for shared boards so that others
                 can understand what the pin contains. If omitted, a brief description
                 of the contents will be automatically generated.
@@ -85,6 +326,16 @@ def pin_write_gdf_parquet(  # noqa: PLR0913
                                 to the last version (compared using the hash). Only
                                 the pin contents are compared, not the pin metadata.
                                 Defaults to False.
+        sort: Reorder the features along a space-filling curve before writing, so
+              that each row group covers a compact area. May be "hilbert" (Hilbert
+              curve) or "quadkey" (Z-order curve, as used by quadkeys and geohashes).
+              Features with missing or empty geometries are written last. Defaults
+              to None, which keeps the input order.
+        row_group_size: The maximum number of features in each row group. Defaults to
+                        the pyarrow default.
+        compression: The compression codec, e.g. "snappy", "zstd", "gzip", "brotli",
+                     "lz4" or "uncompressed". Defaults to "snappy".
+        compression_level: The compression level, for codecs which support it.
         board: The (geo)pins board to write to.
 
     Returns:
@@ -108,8 +359,16 @@ def pin_write_gdf_parquet(  # noqa: PLR0913
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
 
-        path = Path(tmpdir_path) / f"{name}.parquet"
-        x.to_parquet(path)
+        path = Path(tmpdir_path) / f"{get_pin_file_stem(name)}.parquet"
+        if sort is not None:
+            x = x.iloc[_get_spatial_order(x.geometry, sort=sort)]
+        x.to_parquet(
+            path,
+            compression=None if compression == "uncompressed" else compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+            write_covering_bbox=True,
+        )
 
         with warnings.catch_warnings():
             # Upstream issue relating to opening files without context managers
@@ -122,3 +381,44 @@ def pin_write_gdf_parquet(  # noqa: PLR0913
                 description=description,
                 metadata=metadata,
             )
+
+
+def _get_spatial_order(
+    geometry: GeoSeries, *, sort: Literal["hilbert", "quadkey"]
+) -> NDArray[np.intp]:
+    # The curves are only defined for non-empty geometries, so the others go last.
+    valid = ~(geometry.isna() | geometry.is_empty).to_numpy()
+    keys = np.full(len(geometry), np.iinfo(np.int64).max, dtype=np.int64)
+
+    if valid.any():
+        if sort == "hilbert":
+            keys[valid] = geometry.iloc[valid].hilbert_distance(level=16)
+        elif sort == "quadkey":
+            keys[valid] = _get_zorder_distance(geometry.iloc[valid], level=16)
+        else:
+            msg = f"Unsupported sort: {sort!r}. Expected 'hilbert' or 'quadkey'."
+            raise ValueError(msg)
+
+    return np.argsort(keys, kind="stable")
+
+
+def _get_zorder_distance(geometry: GeoSeries, *, level: int) -> NDArray[np.int64]:
+    # Position of the envelope centres along a Z-order curve over the total bounds,
+    # i.e. the quadkey of the cell containing the centre, as an integer.
+    xmin, ymin, xmax, ymax = geometry.total_bounds
+    bounds = geometry.bounds.to_numpy()
+    x = (bounds[:, 0] + bounds[:, 2]) / 2
+    y = (bounds[:, 1] + bounds[:, 3]) / 2
+
+    n = 2**level - 1
+    col = ((x - xmin) / ((xmax - xmin) or 1) * n).astype(np.uint64)
+    row = ((y - ymin) / ((ymax - ymin) or 1) * n).astype(np.uint64)
+    return (_spread_bits(col) | (_spread_bits(row) << np.uint64(1))).astype(np.int64)
+
+
+def _spread_bits(v: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    # Insert a zero bit between each of the lower 16 bits, for bit interleaving.
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    return (v | (v << np.uint64(1))) & np.uint64(0x55555555)
@@ -4,15 +4,23 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-from pyarrow import parquet
+import pyarrow as pa
+from pyarrow import ipc, parquet
 
-from geopins.meta import get_pinned_file_path
+from geopins.fs import get_local_pin_file_path, get_pin_file_path, get_target_fs
 
 if TYPE_CHECKING:
-    import pyarrow as pa
+    from fsspec import AbstractFileSystem
     from pins.boards import BaseBoard
     from pins.meta import Meta
 
+# The number of bytes read from the end of a remote file to get its schema. This is
+# enough for the footer of most Parquet and Arrow IPC files in a single request.
+_FOOTER_READ_SIZE = 64 * 1024
+
+# The trailing magic bytes of each filetype, which follow the footer length.
+_FOOTER_MAGIC = {"parquet": b"PAR1", "arrow": b"ARROW1"}
+
 
 @dataclass
 class DriverInfo:
@@ -21,16 +29,26 @@ class DriverInfo:
     Attributes:
         dtype: The geopins datatype, e.g. "gdf" or "raster". None if not a geopins type,
                e.g. a standard dataframe pin.
-        filetype: The underlying filetype, e.g. "gpkg", "parquet", or "tif".
+        filetype: The underlying filetype, e.g. "gpkg", "parquet", "fgb", "arrow",
+                  "tif", or "zarr".
     """
 
     dtype: Literal["gdf", "raster"] | None
     filetype: str
 
 
-def infer_driver_info(meta: Meta, *, board: BaseBoard) -> DriverInfo:
+# Driver info inferred from file schemas, keyed by the file URL and pin hash. Pin
+# versions are immutable, so entries never go stale.
+_SNIFFED_DRIVER_INFO: dict[tuple[str, str], DriverInfo] = {}
+
+
+def infer_driver_info(meta: Meta, *, board: BaseBoard) -> DriverInfo:  # noqa: PLR0911
     """Infer the Python datatype and underlying filetype from the pin metadata.
 
+    Parquet and Arrow pins are told apart from plain dataframe pins by their schema,
+    which is read from the file footer alone - with a ranged request, for remote
+    boards - and cached per pin version.
+
     Args:
         meta: The pin metadata.
         board: The pins board the pin is stored on.
@@ -43,6 +61,8 @@ def infer_driver_info(meta: Meta, *, board: BaseBoard) -> DriverInfo:
     file = meta.file
 
     if not isinstance(file, str):
+        if ".zarray" in file:
+            return DriverInfo(dtype="raster", filetype="zarr")
         return DriverInfo(dtype=None, filetype=meta.type)
 
     ext = Path(file).suffix
@@ -51,15 +71,80 @@ def infer_driver_info(meta: Meta, *, board: BaseBoard) -> DriverInfo:
         return DriverInfo(dtype="raster", filetype="tif")
     elif ext == ".gpkg":
         return DriverInfo(dtype="gdf", filetype="gpkg")
-    elif ext == ".parquet":
-        # Need to check if it's a geoparquet - pandas also uses .parquet
-        pinned_file_path = get_pinned_file_path(meta=meta, board=board)
-
-        schema: pa.Schema = parquet.read_schema(pinned_file_path)
-        metadata = schema.metadata
-        if metadata is None or b"geo" not in metadata:
-            return DriverInfo(dtype=None, filetype=meta.type)
-        else:
-            return DriverInfo(dtype="gdf", filetype="parquet")
+    elif ext == ".fgb":
+        return DriverInfo(dtype="gdf", filetype="fgb")
+    elif ext in (".arrow", ".parquet"):
+        # Need to check the schema - pandas also uses .arrow and .parquet
+        return _sniff_driver_info(file, meta=meta, board=board)
     else:
         return DriverInfo(dtype=None, filetype=meta.type)
+
+
+def _sniff_driver_info(fname: str, *, meta: Meta, board: BaseBoard) -> DriverInfo:
+    fs = get_target_fs(board)
+    path = get_pin_file_path(fname, meta=meta, board=board)
+    key = (fs.unstrip_protocol(path), meta.pin_hash)
+
+    info = _SNIFFED_DRIVER_INFO.get(key)
+    if info is None:
+        filetype = Path(fname).suffix.removeprefix(".")
+        schema = _read_schema(fname, filetype=filetype, meta=meta, board=board)
+        if filetype == "parquet":
+            is_geo = schema.metadata is not None and b"geo" in schema.metadata
+        else:
+            is_geo = any(_is_geoarrow_field(field) for field in schema)
+        info = (
+            DriverInfo(dtype="gdf", filetype=filetype)
+            if is_geo
+            else DriverInfo(dtype=None, filetype=meta.type)
+        )
+        _SNIFFED_DRIVER_INFO[key] = info
+    return info
+
+
+def _read_schema(
+    fname: str, *, filetype: str, meta: Meta, board: BaseBoard
+) -> pa.Schema:
+    # Only the footer is read, which holds the schema of both Parquet and Arrow IPC
+    # files. Remote files are read with a ranged request, rather than downloaded.
+    local_path = get_local_pin_file_path(fname, meta=meta, board=board)
+    if local_path is not None:
+        source = pa.memory_map(local_path)
+    else:
+        path = get_pin_file_path(fname, meta=meta, board=board)
+        source = pa.BufferReader(
+            _read_footer(get_target_fs(board), path, magic=_FOOTER_MAGIC[filetype])
+        )
+
+    with source:
+        if filetype == "parquet":
+            return parquet.read_schema(source)
+        return ipc.open_file(source).schema
+
+
+def _read_footer(fs: AbstractFileSystem, path: str, *, magic: bytes) -> bytes:
+    # The end of a file, including its footer, which precedes the footer length (a
+    # 4-byte little-endian integer) and the magic bytes.
+    tail = _cat_file_bytes(fs, path, start=-_FOOTER_READ_SIZE)
+    trailer_size = 4 + len(magic)
+    footer_size = (
+        int.from_bytes(tail[-trailer_size : -len(magic)], "little") + trailer_size
+    )
+    if len(tail) < footer_size:
+        tail = _cat_file_bytes(fs, path, start=-footer_size)
+    return tail
+
+
+def _cat_file_bytes(fs: AbstractFileSystem, path: str, *, start: int) -> bytes:
+    data = fs.cat_file(path, start=start)
+    if not isinstance(data, bytes):
+        msg = f"Expected bytes from {path!r}, got {data.__class__.__name__}."
+        raise TypeError(msg)
+    return data
+
+
+def _is_geoarrow_field(field: pa.Field) -> bool:
+    metadata = field.metadata
+    if metadata is None:
+        return False
+    return metadata.get(b"ARROW:extension:name", b"").startswith(b"geoarrow.")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pyproj import CRS
+from rasterio.transform import array_bounds
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from affine import Affine
+    from numpy.typing import DTypeLike, NDArray
+    from rasterio.windows import Window
+
+
+@dataclass
+class RasterBlocks:
+    """A raster given block by block, for rasters which are too large for memory.
+
+    The blocks are written to the pin as they are produced, e.g. by a model which
+    runs tile by tile, so the whole raster is never held in memory. The blocks are
+    consumed when the raster is written, so a RasterBlocks can only be written once.
+
+    Attributes:
+        shape: The (height, width) of the raster, in cells.
+        transform: The affine transform from cell indices to coordinates.
+        crs: The coordinate reference system.
+        dtype: The data type of the cells.
+        blocks: The blocks of the raster, as (window, array) pairs, where each array
+                has the (height, width) of its window. Blocks must not overlap.
+                Cells not covered by any block are nodata, so for rasters without a
+                nodata value, the blocks must cover the whole raster.
+        nodata: The nodata value. Defaults to NaN for floating point rasters, and no
+                nodata value otherwise.
+    """
+
+    shape: tuple[int, int]
+    transform: Affine
+    crs: CRS
+    dtype: DTypeLike
+    blocks: Iterable[tuple[Window, NDArray[Any]]]
+    nodata: float | None = None
+
+    def __post_init__(self) -> None:
+        self.crs = CRS.from_user_input(self.crs)
+        self.dtype = np.dtype(self.dtype)
+        if self.nodata is None and np.issubdtype(self.dtype, np.floating):
+            self.nodata = np.nan
+
+        height, width = self.shape
+        if height <= 0 or width <= 0:
+            msg = f"The raster shape must be positive, got {self.shape}."
+            raise ValueError(msg)
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """The bounding box of the raster, as (xmin, ymin, xmax, ymax)."""
+        x0, y0, x1, y1 = array_bounds(*self.shape, self.transform)
+        return (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
@@ -1,57 +1,193 @@
 from __future__ import annotations
 
+import math
 import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
-from geopins.drivers.exceptions import raise_driver_not_supported
+import geopandas as gpd
+import numpy as np
+from pyproj import CRS
+from rastr.raster import Raster
+
+from geopins.cache import get_transcode_cache
+from geopins.drivers.exceptions import MemoryBudgetError, raise_driver_not_supported
 from geopins.drivers.infer import infer_driver_info
+from geopins.drivers.raster.blocks import RasterBlocks
 from geopins.drivers.raster.filetypes.tif import (
+    pin_read_raster_stack_tif,
     pin_read_raster_tif,
+    pin_read_raster_tif_memmap,
+    pin_read_raster_tif_overview,
+    pin_sample_raster_tif,
+    pin_write_raster_blocks_tif,
+    pin_write_raster_stack_tif,
     pin_write_raster_tif,
 )
+from geopins.drivers.raster.filetypes.zarr import (
+    pin_read_raster_zarr,
+    pin_write_raster_zarr,
+)
+from geopins.drivers.raster.stack import RasterStack
+from geopins.drivers.raster.stats import get_array_stats, get_tif_stats
 from geopins.interfaces import PinReadKwargDict, PinWriteKwargDict
+from geopins.meta import (
+    add_geopins_metadata,
+    get_bounds_overlap,
+    get_geopins_metadata,
+    get_total_file_size,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
     from datetime import datetime
 
+    from geopandas import GeoSeries
+    from numpy.typing import ArrayLike, NDArray
     from pins.boards import BaseBoard
     from pins.meta import Meta
-    from rastr.raster import Raster
+
+    from geopins.drivers.raster.stats import BandStats
 
 
-def pin_read_raster(
+def pin_read_raster(  # noqa: PLR0913
     name: str,
     version: str | None = None,
     hash: str | None = None,  # noqa: A002
     *,
+    bounds: tuple[float, float, float, float] | None = None,
+    mode: Literal["memory", "memmap"] = "memory",
+    crs: CRS | str | None = None,
+    max_memory: int | None = None,
+    on_exceed: Literal["raise", "memmap", "overview"] = "raise",
     board: BaseBoard,
 ) -> Raster:
     """Return the Raster stored in a pin.
 
+    Use `pin_read_raster_stack` for RasterStack pins.
+
     Args:
         name: Pin name.
         version: A specific pin version to retrieve.
         hash: A hash used to validate the retrieved pin data. If specified, it is
                 compared against the `pin_hash` field retrieved by
                 `pins.boards.BaseBoard.pin_meta`.
+        bounds: Only read the cells overlapping this bounding box, given as
+                (xmin, ymin, xmax, ymax) in the CRS of the raster. Supported for Zarr
+                pins.
+        mode: How to hold the cell array. "memory" reads it into memory. "memmap"
+              returns a read-only memory map over an uncompressed local copy (made on
+              the first read, in the transcode cache), so only the cells which are
+              accessed are paged into memory. "memmap" is supported for GeoTIFF
+              pins. Defaults to "memory".
+        crs: Reproject the raster to this CRS, using nearest neighbour resampling.
+             The reprojected raster is stored in the transcode cache, keyed by the
+             pin hash and CRS, so later reads don't reproject it again. Supported
+             for GeoTIFF pins.
+        max_memory: A memory budget for reading the cell array into memory, in bytes.
+                    The memory needed is estimated from the pin metadata (the shape
+                    and dtype) before anything is downloaded, and scaled down by the
+                    fraction of the raster within `bounds`. Only applies with
+                    `mode="memory"`. Defaults to no budget.
+        on_exceed: What to do if the estimate exceeds `max_memory`: "raise" a
+                   `MemoryBudgetError`, read with `mode="memmap"` instead, or read an
+                   "overview" at the finest whole-number reduction of the resolution
+                   which fits the budget. "memmap" and "overview" are supported for
+                   GeoTIFF pins, and "overview" not together with `crs`.
         board: The pins board to read from.
 
-
     Returns:
         The Raster stored in the pin.
     """
-    return _pin_read_raster(name=name, version=version, hash=hash, board=board)
+    meta = _fetch_raster_meta(name, version, expect_stack=False, board=board)
+    # N.B. the pin is known not to be a RasterStack
+    return _pin_read_raster(  # pyright: ignore[reportReturnType]
+        name=name,
+        version=version,
+        hash=hash,
+        bounds=bounds,
+        mode=mode,
+        crs=crs,
+        max_memory=max_memory,
+        on_exceed=on_exceed,
+        board=board,
+        meta=meta,
+    )
+
+
+def pin_read_raster_stack(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bands: Sequence[str] | None = None,
+    max_memory: int | None = None,
+    board: BaseBoard,
+) -> RasterStack:
+    """Return the RasterStack stored in a pin.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bands: The labels of the bands to read. Only these bands are decoded.
+               Defaults to all bands.
+        max_memory: A memory budget for reading the bands into memory, in bytes. The
+                    memory needed is estimated from the pin metadata (the shape,
+                    dtype and number of bands) before anything is downloaded; if it
+                    exceeds the budget, a `MemoryBudgetError` is raised. Defaults to
+                    no budget.
+        board: The pins board to read from.
+
+    Returns:
+        The RasterStack stored in the pin, restricted to `bands` if given.
+    """
+    meta = _fetch_raster_meta(name, version, expect_stack=True, board=board)
+    # N.B. the pin is known to be a RasterStack
+    return _pin_read_raster(  # pyright: ignore[reportReturnType]
+        name=name,
+        version=version,
+        hash=hash,
+        bands=bands,
+        max_memory=max_memory,
+        board=board,
+        meta=meta,
+    )
+
+
+def _fetch_raster_meta(
+    name: str, version: str | None, *, expect_stack: bool, board: BaseBoard
+) -> Meta:
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
 
+    is_stack = "bands" in get_geopins_metadata(meta)
+    if is_stack and not expect_stack:
+        msg = f"Pin {name!r} is a RasterStack; read it with `pin_read_raster_stack`."
+        raise TypeError(msg)
+    if expect_stack and not is_stack:
+        msg = f"Pin {name!r} is not a RasterStack; read it with `pin_read_raster`."
+        raise TypeError(msg)
+    return meta
 
-def _pin_read_raster(
+
+def _pin_read_raster(  # noqa: PLR0913
     name: str,
     version: str | None = None,
     hash: str | None = None,  # noqa: A002
     *,
+    bounds: tuple[float, float, float, float] | None = None,
+    bands: Sequence[str] | None = None,
+    mode: Literal["memory", "memmap"] = "memory",
+    crs: CRS | str | None = None,
+    max_memory: int | None = None,
+    on_exceed: Literal["raise", "memmap", "overview"] = "raise",
     board: BaseBoard,
     meta: Meta | None = None,
-) -> Raster:
+) -> Raster | RasterStack:
     # We have this helper variable to pass meta around internally to avoid unnecessary
     # fetching of metadata (although some level of unnecessary passing is inevitable
     # since the underlying pins call will invoke .pin_fetch again). At least this way
@@ -69,17 +205,274 @@ def _pin_read_raster(
     )
 
     filetype = infer_driver_info(meta, board=board).filetype
+    is_stack = "bands" in get_geopins_metadata(meta)
+
+    crs = _get_target_crs(crs, meta=meta)
+    mode, overview_factor = _apply_memory_budget(
+        name,
+        bounds=bounds,
+        bands=bands,
+        mode=mode,
+        max_memory=max_memory,
+        on_exceed=on_exceed,
+        meta=meta,
+    )
+    _check_read_options(
+        filetype,
+        is_stack=is_stack,
+        bands=bands,
+        mode=mode,
+        crs=crs,
+        overview=overview_factor is not None,
+    )
 
     if filetype == "tif":
+        if bounds is not None:
+            msg = "`bounds` is not supported for GeoTIFF raster pins."
+            raise NotImplementedError(msg)
+        if is_stack:
+            return pin_read_raster_stack_tif(
+                board=board, bands=bands, meta=meta, **kwargs
+            )
+        if overview_factor is not None:
+            return pin_read_raster_tif_overview(
+                board=board, factor=overview_factor, **kwargs
+            )
+        if mode == "memmap" or crs is not None:
+            raster = pin_read_raster_tif_memmap(
+                board=board,
+                crs=crs,
+                cache=get_transcode_cache(board),
+                meta=meta,
+                **kwargs,
+            )
+            if mode == "memory":
+                raster = Raster(
+                    arr=np.array(raster.arr), raster_meta=raster.raster_meta
+                )
+            return raster
         return pin_read_raster_tif(board=board, **kwargs)
+    elif filetype == "zarr":
+        return pin_read_raster_zarr(board=board, bounds=bounds, meta=meta, **kwargs)
     else:
         raise_driver_not_supported(filetype, cls=board.__class__, mode="read")
         raise AssertionError  # Change to assert_never after deprecating 3.11 support
 
 
+def _apply_memory_budget(  # noqa: PLR0913
+    name: str,
+    *,
+    bounds: tuple[float, float, float, float] | None,
+    bands: Sequence[str] | None,
+    mode: Literal["memory", "memmap"],
+    max_memory: int | None,
+    on_exceed: Literal["raise", "memmap", "overview"],
+    meta: Meta,
+) -> tuple[Literal["memory", "memmap"], int | None]:
+    # The read mode, and the overview factor if reading an overview instead. The
+    # budget only applies to reading the cell array into memory.
+    if max_memory is None or mode != "memory":
+        return mode, None
+    estimate = _get_nbytes_estimate(meta, bounds=bounds, bands=bands)
+    if estimate <= max_memory:
+        return mode, None
+
+    if on_exceed == "raise":
+        raise MemoryBudgetError(
+            name,
+            estimate=estimate,
+            max_memory=max_memory,
+            hint="Read smaller `bounds` or fewer `bands`, or read with "
+            '`on_exceed="memmap"` or `on_exceed="overview"`.',
+        )
+    elif on_exceed == "memmap":
+        return "memmap", None
+    elif on_exceed == "overview":
+        return "memory", math.ceil(math.sqrt(estimate / max(max_memory, 1)))
+    else:
+        msg = f"`on_exceed` must be 'raise', 'memmap' or 'overview', got {on_exceed!r}."
+        raise ValueError(msg)
+
+
+def _get_nbytes_estimate(
+    meta: Meta,
+    *,
+    bounds: tuple[float, float, float, float] | None,
+    bands: Sequence[str] | None,
+) -> int:
+    # The memory needed to read a pin into memory, estimated from its metadata.
+    geopins_meta = get_geopins_metadata(meta)
+    shape = geopins_meta.get("shape")
+    dtype = geopins_meta.get("dtype")
+    if shape is None or dtype is None:
+        return round(get_total_file_size(meta) * get_bounds_overlap(meta, bounds))
+
+    dtype = np.dtype(dtype)
+    # Integers are cast to float16 when read, to handle NaN values.
+    itemsize = 2 if np.issubdtype(dtype, np.integer) else dtype.itemsize
+    n_bands = len(bands if bands is not None else geopins_meta.get("bands", [None]))
+    return round(
+        math.prod(shape) * n_bands * itemsize * get_bounds_overlap(meta, bounds)
+    )
+
+
+def _get_target_crs(crs: CRS | str | None, *, meta: Meta) -> CRS | None:
+    # Rasters which are already in the target CRS needn't be reprojected.
+    if crs is None:
+        return None
+    crs = CRS.from_user_input(crs)
+    pin_crs = get_geopins_metadata(meta).get("crs")
+    if pin_crs is not None and CRS.from_user_input(pin_crs) == crs:
+        return None
+    return crs
+
+
+def _check_read_options(  # noqa: PLR0913
+    filetype: str | None,
+    *,
+    is_stack: bool,
+    bands: Sequence[str] | None,
+    mode: Literal["memory", "memmap"],
+    crs: CRS | None,
+    overview: bool,
+) -> None:
+    if bands is not None and not is_stack:
+        msg = "`bands` is only supported for RasterStack pins."
+        raise NotImplementedError(msg)
+    if mode == "memmap" and (filetype != "tif" or is_stack):
+        msg = '`mode="memmap"` is only supported for GeoTIFF Raster pins.'
+        raise NotImplementedError(msg)
+    if crs is not None and (filetype != "tif" or is_stack):
+        msg = "`crs` is only supported for GeoTIFF Raster pins."
+        raise NotImplementedError(msg)
+    if overview and (filetype != "tif" or is_stack or crs is not None):
+        msg = (
+            '`on_exceed="overview"` is only supported for GeoTIFF Raster pins, '
+            "without `crs`."
+        )
+        raise NotImplementedError(msg)
+
+
+def pin_sample_raster(
+    name: str,
+    points: GeoSeries | ArrayLike,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    board: BaseBoard,
+) -> NDArray[np.float64]:
+    """Sample the cell values of the Raster (or RasterStack) in a pin at points.
+
+    Only the blocks of the raster containing points are read, rather than the whole
+    raster, and the values in each block are gathered in one vectorized operation.
+    This is much faster than reading the raster for sparse points, e.g. asset
+    locations across a national raster. Supported for GeoTIFF pins.
+
+    Args:
+        name: Pin name.
+        points: The points to sample, as a GeoSeries of points, or an array of (x, y)
+                coordinates with shape (n, 2) in the CRS of the raster. A GeoSeries
+                with a different CRS is reprojected to the CRS of the raster.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        board: The pins board to read from.
+
+    Returns:
+        The cell values at each point, with shape (n,) for Raster pins, or (n, bands)
+        for RasterStack pins. Points outside the raster, or in nodata cells, are NaN.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
+
+    filetype = infer_driver_info(meta, board=board).filetype
+    if filetype != "tif":
+        msg = "Sampling is only supported for GeoTIFF Raster pins."
+        raise NotImplementedError(msg)
+
+    xs, ys = _get_point_coords(points, meta=meta)
+    values = pin_sample_raster_tif(
+        name=name, version=version, hash=hash, xs=xs, ys=ys, board=board
+    )
+    if "bands" not in get_geopins_metadata(meta):
+        return values[:, 0]
+    return values
+
+
+def _get_point_coords(
+    points: GeoSeries | ArrayLike, *, meta: Meta
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    if not isinstance(points, gpd.GeoSeries):
+        coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return coords[:, 0], coords[:, 1]
+
+    if not (points.geom_type == "Point").all():
+        msg = "Only Point geometries can be sampled."
+        raise ValueError(msg)
+
+    pin_crs = get_geopins_metadata(meta).get("crs")
+    if points.crs is not None and pin_crs is not None:
+        points = points.to_crs(pin_crs)
+    return points.x.to_numpy(), points.y.to_numpy()
+
+
+def pin_raster_stats(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bounds: tuple[float, float, float, float] | None = None,
+    board: BaseBoard,
+) -> list[BandStats]:
+    """Return summary statistics of each band of the Raster (or RasterStack) in a pin.
+
+    The statistics of the whole raster are recorded when the pin is written, so they
+    are returned without downloading the pin. Otherwise (for a window, or for pins
+    written without statistics), they are computed from the pinned GeoTIFF block by
+    block, without reading the whole raster into memory.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bounds: Only include the cells overlapping this bounding box, given as
+                (xmin, ymin, xmax, ymax) in the CRS of the raster. Supported for
+                GeoTIFF pins.
+        board: The pins board to read from.
+
+    Returns:
+        The minimum, maximum, mean, standard deviation, nodata count and histogram of
+        each band, in band order.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
+
+    stats = get_geopins_metadata(meta).get("stats")
+    if bounds is None and stats is not None and hash is None:
+        return stats
+
+    filetype = infer_driver_info(meta, board=board).filetype
+    if filetype != "tif":
+        msg = "Computing statistics is only supported for GeoTIFF Raster pins."
+        raise NotImplementedError(msg)
+
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        (filename,) = board.pin_download(name=name, version=version, hash=hash)
+    return get_tif_stats(filename, bounds=bounds)
+
+
 def pin_write_raster(  # noqa: PLR0913
     # N.B. match pins.boards.BaseBoard.pin_write signature
-    x: Raster,
+    x: Raster | RasterStack | RasterBlocks,
     name: str | None = None,
     type: str | None = None,  # noqa: A002
     title: str | None = None,
@@ -89,14 +482,18 @@ def pin_write_raster(  # noqa: PLR0913
     created: datetime | None = None,
     *,
     force_identical_write: bool = False,
+    chunk_size: int | None = None,
     board: BaseBoard,
 ) -> Meta:
     """Write a pin object to the board.
 
     Args:
-        x: A rastr.Raster to pin.
+        x: A rastr.Raster, a RasterStack of co-registered rasters, or a RasterBlocks
+           (for rasters produced block by block, which are too large for memory) to
+           pin.
         name: Pin name.
-        type: File type used to save `x` to disk. May be "tif" only.
+        type: File type used to save `x` to disk. May be "tif" or "zarr". Defaults to
+              "tif". RasterStack and RasterBlocks pins are always GeoTIFFs.
         title: A title for the pin; most important for shared boards so that others
                 can understand what the pin contains. If omitted, a brief description
                 of the contents will be automatically generated.
@@ -110,6 +507,8 @@ def pin_write_raster(  # noqa: PLR0913
                                 to the last version (compared using the hash). Only
                                 the pin contents are compared, not the pin metadata.
                                 Defaults to False.
+        chunk_size: The height and width of each chunk, in cells, for Zarr pins
+                    only. Defaults to 512.
         board: The (geo)pins board to write to.
 
     Returns:
@@ -124,7 +523,7 @@ def pin_write_raster(  # noqa: PLR0913
         type=type_,
         title=title,
         description=description,
-        metadata=metadata,
+        metadata=add_geopins_metadata(metadata, **_get_summary_metadata(x)),
         versioned=versioned,
         created=created,
         force_identical_write=force_identical_write,
@@ -133,8 +532,51 @@ def pin_write_raster(  # noqa: PLR0913
     if type_ is None:
         type_ = "tif"  # Default to GeoTIFF for rasters
 
+    if chunk_size is not None and type_ != "zarr":
+        msg = "`chunk_size` is only supported for Zarr Raster pins."
+        raise NotImplementedError(msg)
+
+    if isinstance(x, RasterStack):
+        if type_ != "tif":
+            msg = "RasterStack pins are only supported for GeoTIFF Raster pins."
+            raise NotImplementedError(msg)
+        return pin_write_raster_stack_tif(x, board=board, **kwargs)
+    if isinstance(x, RasterBlocks):
+        if type_ != "tif":
+            msg = "RasterBlocks pins are only supported for GeoTIFF Raster pins."
+            raise NotImplementedError(msg)
+        return pin_write_raster_blocks_tif(x, board=board, **kwargs)
+
     if type_ == "tif":
         return pin_write_raster_tif(x, board=board, **kwargs)
+    elif type_ == "zarr":
+        if chunk_size is None:
+            chunk_size = 512
+        return pin_write_raster_zarr(x, board=board, chunk_size=chunk_size, **kwargs)
     else:
         raise_driver_not_supported(type_, cls=board.__class__, mode="write")
         raise AssertionError  # Change to assert_never after deprecating 3.11 support
+
+
+def _get_summary_metadata(x: Raster | RasterStack | RasterBlocks) -> dict[str, Any]:
+    # Recorded with the pin, so the extent of a pin is known without reading it.
+    if isinstance(x, RasterBlocks):
+        # N.B. the statistics are recorded as the blocks are written.
+        return {
+            "bounds": [float(v) for v in x.bounds],
+            "crs": x.crs.to_string(),
+            "shape": list(x.shape),
+            "resolution": [abs(x.transform.a), abs(x.transform.e)],
+            "dtype": str(x.dtype),
+        }
+
+    rasters = list(x.rasters.values()) if isinstance(x, RasterStack) else [x]
+    raster = rasters[0]
+    return {
+        "bounds": [float(v) for v in raster.bounds],
+        "crs": raster.crs.to_string(),
+        "shape": list(raster.arr.shape),
+        "resolution": [abs(raster.transform.a), abs(raster.transform.e)],
+        "dtype": str(raster.arr.dtype),
+        "stats": [get_array_stats(raster.arr) for raster in rasters],
+    }
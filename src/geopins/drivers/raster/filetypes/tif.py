@@ -1,20 +1,46 @@
 from __future__ import annotations
 
+import contextlib
+import json
+import math
 import tempfile
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+import rasterio
+from affine import Affine
 from pins.boards import BaseBoard
+from pyproj import CRS
+from rasterio.enums import Resampling
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
+from rastr.meta import RasterMeta
 from rastr.raster import Raster
 
+from geopins.cache import get_variant_key
+from geopins.drivers.raster.stack import RasterStack
+from geopins.drivers.raster.stats import StatsAccumulator
+from geopins.filetypes import get_pin_file_stem
+from geopins.fs import get_gdal_pin_path
+from geopins.meta import add_geopins_metadata, get_geopins_metadata
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
     from datetime import datetime
 
+    from numpy.typing import NDArray
     from pins.boards import BaseBoard
     from pins.meta import Meta
 
+    from geopins.cache import FileCache
+    from geopins.drivers.raster.blocks import RasterBlocks
+
+# Memory-mapped copies of rasters start with a JSON header (preceded by its length),
+# and the cell array starts at the next multiple of this alignment.
+_MEMMAP_ALIGNMENT = 4096
+
 
 def pin_read_raster_tif(
     name: str,
@@ -52,6 +78,259 @@ def pin_read_raster_tif(
     return Raster.read_file(filename=filename)
 
 
+def pin_read_raster_tif_memmap(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    crs: CRS | None = None,
+    cache: FileCache,
+    board: BaseBoard,
+    meta: Meta,
+) -> Raster:
+    """Return the Raster stored in a pin as a GeoTIFF, memory-mapped from a local copy.
+
+    The first read transcodes the GeoTIFF block-by-block into an uncompressed copy in
+    the cache, keyed by the pin hash (and target CRS). The returned Raster's array is
+    a read-only memory map over that copy, so cells are only paged into memory when
+    accessed, and rasters larger than the available memory can be read. As with
+    `rastr.Raster.read_file`, integer rasters are cast to float16 and nodata cells are
+    NaN.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`, and the cached copy is rebuilt
+                from the validated GeoTIFF.
+        crs: Reproject the raster to this CRS (using nearest neighbour resampling)
+             while transcoding it, so the reprojected copy is cached.
+        cache: The local cache of transcoded files.
+        board: The (geo)pins board to read from.
+        meta: The pin metadata.
+
+    Returns:
+        The Raster stored in the pin, backed by a read-only memory map.
+    """
+    key = get_variant_key(
+        meta.pin_hash, ".raster", crs=crs.to_wkt() if crs is not None else None
+    )
+
+    path = cache.get(key) if hash is None else None
+    if path is not None:
+        try:
+            return _read_raster_memmap(path)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            pass
+
+    src_path = get_gdal_pin_path(name=name, version=version, hash=hash, board=board)
+    path = cache.put(
+        key, lambda path: _transcode_tif_to_memmap(src_path, path, crs=crs)
+    )
+    return _read_raster_memmap(path)
+
+
+def _transcode_tif_to_memmap(
+    src_path: str, path: Path, *, crs: CRS | None = None
+) -> None:
+    with rasterio.open(src_path) as src, contextlib.ExitStack() as stack:
+        dtype = np.dtype(src.dtypes[0])
+        is_integer = np.issubdtype(dtype, np.integer)
+        if is_integer:
+            # Cast integers to float16 to handle NaN values, like Raster.read_file
+            dtype = np.dtype(np.float16)
+
+        dataset = src
+        nodata = src.nodata
+        if crs is not None:
+            # Warp block-by-block, via a virtual dataset in the target CRS.
+            dataset = stack.enter_context(
+                WarpedVRT(
+                    src,
+                    crs=crs,
+                    dtype="float32" if is_integer else src.dtypes[0],
+                    src_nodata=src.nodata,
+                    nodata=np.nan,
+                )
+            )
+            nodata = None
+
+        header = json.dumps(
+            {
+                "dtype": dtype.str,
+                "shape": [dataset.height, dataset.width],
+                "crs": CRS.from_user_input(dataset.crs).to_wkt(),
+                "transform": list(dataset.transform)[:6],
+            }
+        ).encode()
+        with path.open("wb") as f:
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+
+        arr = np.memmap(
+            path,
+            dtype=dtype,
+            mode="r+",
+            offset=_get_memmap_offset(len(header)),
+            shape=(dataset.height, dataset.width),
+        )
+        # Copy one block at a time, so the raster is never fully in memory.
+        for _, window in dataset.block_windows(1):
+            block = dataset.read(1, window=window).astype(dtype, copy=False)
+            if nodata is not None and not np.isnan(nodata):
+                block[block == nodata] = np.nan
+            arr[window.toslices()] = block
+        arr.flush()
+        del arr
+
+
+def _read_raster_memmap(path: Path) -> Raster:
+    with path.open("rb") as f:
+        header_size = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_size))
+
+    arr = np.memmap(
+        path,
+        dtype=np.dtype(header["dtype"]),
+        mode="r",
+        offset=_get_memmap_offset(header_size),
+        shape=tuple(header["shape"]),
+    )
+    raster_meta = RasterMeta(
+        crs=CRS.from_wkt(header["crs"]), transform=Affine(*header["transform"])
+    )
+    return Raster(arr=arr, raster_meta=raster_meta)
+
+
+def _get_memmap_offset(header_size: int) -> int:
+    return -(-(8 + header_size) // _MEMMAP_ALIGNMENT) * _MEMMAP_ALIGNMENT
+
+
+def pin_read_raster_tif_overview(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    factor: int,
+    board: BaseBoard,
+) -> Raster:
+    """Return a reduced-resolution copy of the Raster stored in a pin as a GeoTIFF.
+
+    The raster is read at 1/`factor` of its resolution along each axis, with nearest
+    neighbour resampling, so the full-resolution array is never held in memory. GDAL
+    reads from the internal overviews of the GeoTIFF where there are any; otherwise,
+    the cells are decimated as they are read. Remote GeoTIFFs are read in place with
+    ranged requests where possible (see `get_gdal_pin_path`).
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        factor: The reduction factor of the resolution, along each axis.
+        board: The (geo)pins board to read from.
+
+    Returns:
+        The reduced-resolution Raster, covering the same extent.
+    """
+    path = get_gdal_pin_path(name=name, version=version, hash=hash, board=board)
+
+    with rasterio.open(path) as src:
+        height, width = math.ceil(src.height / factor), math.ceil(src.width / factor)
+        block = src.read(
+            1, out_shape=(height, width), resampling=Resampling.nearest, masked=True
+        )
+        dtype = np.dtype(src.dtypes[0])
+        if np.issubdtype(dtype, np.integer):
+            # Cast integers to float16 to handle NaN values, like Raster.read_file
+            dtype = np.dtype(np.float16)
+        arr = block.astype(dtype).filled(np.nan)
+
+        t = src.transform
+        x_scale, y_scale = src.width / width, src.height / height
+        transform = Affine(
+            t.a * x_scale, t.b * y_scale, t.c, t.d * x_scale, t.e * y_scale, t.f
+        )
+        crs = CRS.from_user_input(src.crs)
+
+    return Raster(arr=arr, raster_meta=RasterMeta(crs=crs, transform=transform))
+
+
+def pin_sample_raster_tif(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    xs: NDArray[np.floating],
+    ys: NDArray[np.floating],
+    board: BaseBoard,
+) -> NDArray[np.float64]:
+    """Sample the cell values of a raster stored in a pin as a GeoTIFF at points.
+
+    The points are grouped by the internal block (tile or strip) of the GeoTIFF they
+    fall in, and only those blocks are read, once each. Remote GeoTIFFs are read in
+    place with ranged requests where possible (see `get_gdal_pin_path`), so for
+    Cloud-Optimized GeoTIFFs only the touched blocks are fetched.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        xs: The x coordinates of the points, in the CRS of the raster.
+        ys: The y coordinates of the points, in the CRS of the raster.
+        board: The (geo)pins board to read from.
+
+    Returns:
+        The cell values at each point, with a column per band. Points outside the
+        raster, or in nodata cells, are NaN.
+    """
+    path = get_gdal_pin_path(name=name, version=version, hash=hash, board=board)
+
+    with rasterio.open(path) as src:
+        values = np.full((len(xs), src.count), np.nan)
+
+        inverse = ~src.transform
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        cols = np.floor(inverse.a * xs + inverse.b * ys + inverse.c).astype(np.int64)
+        rows = np.floor(inverse.d * xs + inverse.e * ys + inverse.f).astype(np.int64)
+        (idx,) = np.nonzero(
+            (rows >= 0) & (rows < src.height) & (cols >= 0) & (cols < src.width)
+        )
+
+        # Group the points by block, so each block is read once.
+        block_height, block_width = src.block_shapes[0]
+        n_block_cols = math.ceil(src.width / block_width)
+        block_rows, block_cols = rows[idx] // block_height, cols[idx] // block_width
+        block_ids = block_rows * n_block_cols + block_cols
+        order = np.argsort(block_ids, kind="stable")
+        idx, block_ids = idx[order], block_ids[order]
+        block_starts = np.flatnonzero(np.diff(block_ids, prepend=-1))
+
+        for start, stop in zip(
+            block_starts, [*block_starts[1:], len(idx)], strict=True
+        ):
+            block_row, block_col = divmod(int(block_ids[start]), n_block_cols)
+            row_off, col_off = block_row * block_height, block_col * block_width
+            window = Window.from_slices(
+                (row_off, min(row_off + block_height, src.height)),
+                (col_off, min(col_off + block_width, src.width)),
+            )
+            block = src.read(window=window, masked=True).astype(np.float64)
+            points = idx[start:stop]
+            values[points] = block.filled(np.nan)[
+                :,
+                rows[points] - window.row_off,
+                cols[points] - window.col_off,
+            ].T
+
+    return values
+
+
 def pin_write_raster_tif(  # noqa: PLR0913
     # N.B. match pins.boards.BaseBoard.pin_write signature
     x: Raster,
@@ -108,7 +387,7 @@ def pin_write_raster_tif(  # noqa: PLR0913
 
     # Create a temporary file to write the raster
     with tempfile.TemporaryDirectory() as tmpdir:
-        tif_path = Path(tmpdir) / f"{name}.tif"
+        tif_path = Path(tmpdir) / f"{get_pin_file_stem(name)}.tif"
         x.to_file(tif_path)
 
         with warnings.catch_warnings():
@@ -122,3 +401,333 @@ def pin_write_raster_tif(  # noqa: PLR0913
                 description=description,
                 metadata=metadata,
             )
+
+
+def pin_read_raster_stack_tif(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bands: Sequence[str] | None = None,
+    board: BaseBoard,
+    meta: Meta,
+) -> RasterStack:
+    """Return the RasterStack stored in a pin as a multi-band GeoTIFF.
+
+    Only the requested bands are decoded. On remote boards, the file is read in-place
+    where possible, so only the tiles of the requested bands are fetched.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+        bands: The labels of the bands to read, in the order they should appear in
+               the returned stack. Defaults to all bands.
+        board: The (geo)pins board to read from.
+        meta: The pin metadata.
+
+    Returns:
+        The RasterStack stored in the pin, restricted to `bands` if given.
+    """
+    labels: list[str] = get_geopins_metadata(meta)["bands"]
+    if bands is None:
+        bands = labels
+
+    missing = [band for band in bands if band not in labels]
+    if missing:
+        msg = f"Bands {missing} are not in the raster stack. Available bands: {labels}"
+        raise ValueError(msg)
+
+    path = get_gdal_pin_path(name=name, version=version, hash=hash, board=board)
+    with rasterio.open(path) as src:
+        arr = src.read([labels.index(band) + 1 for band in bands])
+        nodata = src.nodata
+        raster_meta = RasterMeta(
+            crs=CRS.from_user_input(src.crs), transform=src.transform
+        )
+
+    if nodata is not None and not np.isnan(nodata):
+        arr = np.where(arr == nodata, np.nan, arr)
+
+    return RasterStack(
+        rasters={
+            band: Raster(arr=band_arr, raster_meta=raster_meta)
+            for band, band_arr in zip(bands, arr, strict=True)
+        }
+    )
+
+
+def pin_write_raster_stack_tif(  # noqa: PLR0913
+    # N.B. match pins.boards.BaseBoard.pin_write signature
+    x: RasterStack,
+    name: str | None = None,
+    type: str | None = None,  # noqa: A002
+    title: str | None = None,
+    description: str | None = None,
+    metadata: Mapping | None = None,
+    versioned: bool | None = None,  # noqa: FBT001
+    created: datetime | None = None,
+    *,
+    force_identical_write: bool = False,
+    board: BaseBoard,
+) -> Meta:
+    """Write a RasterStack object to the board as a multi-band GeoTIFF.
+
+    The GeoTIFF is tiled with band interleaving, so that each band can be decoded
+    independently. The band labels are recorded in the pin metadata and as the band
+    descriptions of the GeoTIFF.
+
+    Args:
+        x: A RasterStack to pin.
+        name: Pin name.
+        type: File type used to save `x` to disk. Only "tif" is supported.
+        title: A title for the pin; most important for shared boards so that others
+                can understand what the pin contains. If omitted, a brief description
+                of the contents will be automatically generated.
+        description: A detailed description of the pin contents.
+        metadata: A dictionary containing additional metadata to store with the pin.
+                    This gets stored on the Meta.user field.
+        versioned: Whether the pin should be versioned. Defaults to versioning, and
+                   the alternative is not supported.
+        created: Not supported. A date to store in the Meta.created field. This field
+                 may be used as part of the pin version name.
+        force_identical_write: Not supported. Store the pin even if the pin contents are
+                               identical to the last version (compared using the hash).
+                               Only the pin contents are compared, not the pin metadata.
+                               Defaults to False.
+        board: The (geo)pins board to write to.
+
+    Returns:
+        Metadata about the stored pin. If `force_identical_write` is False and the
+        pin contents are identical to the last version, the last version's metadata
+        is returned.
+    """
+    if type not in (None, "tif"):
+        msg = 'Only `type="tif"` is supported for this function.'
+        raise ValueError(msg)
+    if force_identical_write:
+        msg = "`force_identical_write=True` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+    if versioned is not None:
+        msg = "`versioned` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+    if created is not None:
+        msg = "`created` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+
+    rasters = list(x.rasters.values())
+    dtype = np.result_type(*(raster.arr.dtype for raster in rasters))
+    height, width = rasters[0].arr.shape
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tif_path = Path(tmpdir) / f"{get_pin_file_stem(name)}.tif"
+        with rasterio.open(
+            tif_path,
+            "w",
+            driver="GTiff",
+            height=height,
+            width=width,
+            count=len(rasters),
+            dtype=dtype,
+            crs=rasters[0].raster_meta.crs,
+            transform=rasters[0].raster_meta.transform,
+            nodata=np.nan if np.issubdtype(dtype, np.floating) else None,
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+            interleave="band",
+            compress="deflate",
+        ) as dst:
+            for band, (label, raster) in enumerate(x.rasters.items(), start=1):
+                dst.write(raster.arr.astype(dtype, copy=False), band)
+                dst.set_band_description(band, label)
+
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+
+            return board.pin_upload(
+                paths=[tif_path.as_posix()],
+                name=name,
+                title=title,
+                description=description,
+                metadata=add_geopins_metadata(metadata, bands=x.labels),
+            )
+
+
+def pin_write_raster_blocks_tif(  # noqa: PLR0913
+    # N.B. match pins.boards.BaseBoard.pin_write signature
+    x: RasterBlocks,
+    name: str | None = None,
+    type: str | None = None,  # noqa: A002
+    title: str | None = None,
+    description: str | None = None,
+    metadata: Mapping | None = None,
+    versioned: bool | None = None,  # noqa: FBT001
+    created: datetime | None = None,
+    *,
+    force_identical_write: bool = False,
+    board: BaseBoard,
+) -> Meta:
+    """Write a raster given block by block to the board as a tiled GeoTIFF.
+
+    Each block is written to a local GeoTIFF as it is produced, and then discarded,
+    so only one block is held in memory at a time. The statistics of the raster are
+    accumulated as the blocks are written, and recorded in the pin metadata.
+
+    Args:
+        x: A RasterBlocks to pin.
+        name: Pin name.
+        type: File type used to save `x` to disk. Only "tif" is supported.
+        title: A title for the pin; most important for shared boards so that others
+                can understand what the pin contains. If omitted, a brief description
+                of the contents will be automatically generated.
+        description: A detailed description of the pin contents.
+        metadata: A dictionary containing additional metadata to store with the pin.
+                    This gets stored on the Meta.user field.
+        versioned: Whether the pin should be versioned. Defaults to versioning, and
+                   the alternative is not supported.
+        created: Not supported. A date to store in the Meta.created field. This field
+                 may be used as part of the pin version name.
+        force_identical_write: Not supported. Store the pin even if the pin contents are
+                               identical to the last version (compared using the hash).
+                               Only the pin contents are compared, not the pin metadata.
+                               Defaults to False.
+        board: The (geo)pins board to write to.
+
+    Returns:
+        Metadata about the stored pin. If `force_identical_write` is False and the
+        pin contents are identical to the last version, the last version's metadata
+        is returned.
+    """
+    if type not in (None, "tif"):
+        msg = 'Only `type="tif"` is supported for this function.'
+        raise ValueError(msg)
+    if force_identical_write:
+        msg = "`force_identical_write=True` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+    if versioned is not None:
+        msg = "`versioned` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+    if created is not None:
+        msg = "`created` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+
+    height, width = x.shape
+    accumulator = StatsAccumulator()
+    coverage = _BlockCoverage()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tif_path = Path(tmpdir) / f"{get_pin_file_stem(name)}.tif"
+        with rasterio.open(
+            tif_path,
+            "w",
+            driver="GTiff",
+            height=height,
+            width=width,
+            count=1,
+            dtype=x.dtype,
+            crs=x.crs,
+            transform=x.transform,
+            nodata=x.nodata,
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+            compress="deflate",
+        ) as dst:
+            for window, block in x.blocks:
+                _check_block(window, block, shape=x.shape)
+                coverage.add(window)
+                arr = block.astype(x.dtype, copy=False)
+                dst.write(arr, 1, window=window)
+
+                if x.nodata is not None and not np.isnan(x.nodata):
+                    accumulator.update(np.ma.masked_equal(arr, x.nodata))
+                else:
+                    accumulator.update(arr)
+
+        # Cells not covered by any block are left as nodata.
+        n_uncovered = height * width - coverage.n_cells
+        if n_uncovered and x.nodata is None:
+            msg = (
+                f"The blocks don't cover {n_uncovered} cells of the raster, which "
+                "can only be left as nodata if the RasterBlocks has a `nodata` value."
+            )
+            raise ValueError(msg)
+        accumulator.add_nodata(n_uncovered)
+
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+
+            return board.pin_upload(
+                paths=[tif_path.as_posix()],
+                name=name,
+                title=title,
+                description=description,
+                metadata=add_geopins_metadata(metadata, stats=[accumulator.result()]),
+            )
+
+
+def _check_block(window: Window, arr: NDArray, *, shape: tuple[int, int]) -> None:
+    height, width = shape
+    if arr.shape != (window.height, window.width):
+        msg = (
+            f"Expected a block of shape {(window.height, window.width)} for window "
+            f"{window}, got {arr.shape}."
+        )
+        raise ValueError(msg)
+    if (
+        window.row_off < 0
+        or window.col_off < 0
+        or window.row_off + window.height > height
+        or window.col_off + window.width > width
+    ):
+        msg = f"Window {window} is outside the raster of shape {shape}."
+        raise ValueError(msg)
+
+
+class _BlockCoverage:
+    """The windows of the blocks written so far, to reject overlapping blocks."""
+
+    def __init__(self) -> None:
+        # (row_start, col_start, row_stop, col_stop) of each window
+        self._windows = np.empty((64, 4), dtype=np.int64)
+        self._n_windows = 0
+        self.n_cells = 0
+
+    def add(self, window: Window) -> None:
+        """Add the window of a block.
+
+        Args:
+            window: The window.
+
+        Raises:
+            ValueError: If the window overlaps the window of an earlier block.
+        """
+        row_start, col_start = int(window.row_off), int(window.col_off)
+        row_stop, col_stop = (
+            row_start + int(window.height),
+            col_start + int(window.width),
+        )
+
+        windows = self._windows[: self._n_windows]
+        overlaps = (
+            (windows[:, 0] < row_stop)
+            & (row_start < windows[:, 2])
+            & (windows[:, 1] < col_stop)
+            & (col_start < windows[:, 3])
+        )
+        if overlaps.any():
+            msg = f"Window {window} overlaps the window of an earlier block."
+            raise ValueError(msg)
+
+        if self._n_windows == len(self._windows):
+            self._windows = np.concatenate(
+                [self._windows, np.empty_like(self._windows)]
+            )
+        self._windows[self._n_windows] = (row_start, col_start, row_stop, col_stop)
+        self._n_windows += 1
+        self.n_cells += (row_stop - row_start) * (col_stop - col_start)
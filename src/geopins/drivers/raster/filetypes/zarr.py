@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import json
+import math
+import tempfile
+import warnings
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from affine import Affine
+from pyproj import CRS
+from rasterio.windows import Window
+from rastr.meta import RasterMeta
+from rastr.raster import Raster
+
+from geopins.fs import open_pin_file
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from numpy.typing import NDArray
+    from pins.boards import BaseBoard
+    from pins.meta import Meta
+
+# The stores written here follow the Zarr v2 storage specification, with zlib chunk
+# compression (available in the standard library), so they can also be opened with
+# zarr-python or xarray by anyone who downloads the pin.
+_ZARRAY = ".zarray"
+_ZATTRS = ".zattrs"
+_ZLIB_LEVEL = 5
+
+
+def pin_read_raster_zarr(  # noqa: PLR0913
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    bounds: tuple[float, float, float, float] | None = None,
+    max_workers: int | None = None,
+    board: BaseBoard,
+    meta: Meta | None = None,
+) -> Raster:
+    """Return the Raster stored in a pin as a chunked Zarr store.
+
+    Chunks are fetched and decompressed concurrently in a thread pool. When `bounds`
+    is given, only the chunks overlapping the bounds are fetched.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: Not supported. A hash used to validate the retrieved pin data.
+        bounds: Only read the cells overlapping this bounding box, given as
+                (xmin, ymin, xmax, ymax) in the CRS of the raster.
+        max_workers: The maximum number of threads used to fetch chunks. Defaults to
+                     the `concurrent.futures.ThreadPoolExecutor` default.
+        board: The (geo)pins board to read from.
+        meta: The pin metadata, if already fetched.
+
+    Returns:
+        The Raster stored in the pin, cropped to `bounds` if given.
+    """
+    if hash is not None:
+        msg = "`hash` is not supported for Zarr raster pins."
+        raise NotImplementedError(msg)
+
+    if meta is None:
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+            meta = board.pin_fetch(name, version)
+
+    with open_pin_file(_ZARRAY, meta=meta, board=board) as f:
+        zarray = json.load(f)
+    with open_pin_file(_ZATTRS, meta=meta, board=board) as f:
+        zattrs = json.load(f)
+
+    height, width = zarray["shape"]
+    chunk_height, chunk_width = zarray["chunks"]
+    dtype = np.dtype(zarray["dtype"])
+    fill_value = _decode_fill_value(zarray["fill_value"])
+    transform = Affine(*zattrs["transform"])
+
+    if bounds is None:
+        window = Window.from_slices((0, height), (0, width))
+    else:
+        window = _bounds_to_window(bounds, transform=transform, shape=(height, width))
+    row_start, col_start = window.row_off, window.col_off
+    row_stop, col_stop = row_start + window.height, col_start + window.width
+
+    arr = np.full((row_stop - row_start, col_stop - col_start), fill_value, dtype=dtype)
+    files = set(meta.file)
+
+    def read_chunk(chunk_row: int, chunk_col: int) -> None:
+        key = f"{chunk_row}.{chunk_col}"
+        if key not in files:
+            # Chunks which are entirely fill values are not stored.
+            return
+
+        with open_pin_file(key, meta=meta, board=board) as f:
+            chunk = np.frombuffer(zlib.decompress(f.read()), dtype=dtype)
+        chunk = chunk.reshape(chunk_height, chunk_width)
+
+        # Intersect the chunk with the requested window, in array coordinates
+        chunk_row_start = chunk_row * chunk_height
+        chunk_col_start = chunk_col * chunk_width
+        r0 = max(row_start, chunk_row_start)
+        r1 = min(row_stop, chunk_row_start + chunk_height)
+        c0 = max(col_start, chunk_col_start)
+        c1 = min(col_stop, chunk_col_start + chunk_width)
+        arr[r0 - row_start : r1 - row_start, c0 - col_start : c1 - col_start] = chunk[
+            r0 - chunk_row_start : r1 - chunk_row_start,
+            c0 - chunk_col_start : c1 - chunk_col_start,
+        ]
+
+    chunk_rows = range(row_start // chunk_height, math.ceil(row_stop / chunk_height))
+    chunk_cols = range(col_start // chunk_width, math.ceil(col_stop / chunk_width))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(read_chunk, chunk_row, chunk_col)
+            for chunk_row in chunk_rows
+            for chunk_col in chunk_cols
+        ]
+        for future in futures:
+            future.result()
+
+    raster_meta = RasterMeta(
+        crs=CRS.from_user_input(zattrs["crs"]),
+        transform=transform @ Affine.translation(col_start, row_start),
+    )
+    return Raster(arr=arr, raster_meta=raster_meta)
+
+
+def pin_write_raster_zarr(  # noqa: PLR0913
+    # N.B. match pins.boards.BaseBoard.pin_write signature
+    x: Raster,
+    name: str | None = None,
+    type: str | None = None,  # noqa: A002
+    title: str | None = None,
+    description: str | None = None,
+    metadata: Mapping | None = None,
+    versioned: bool | None = None,  # noqa: FBT001
+    created: datetime | None = None,
+    *,
+    force_identical_write: bool = False,
+    chunk_size: int = 512,
+    max_workers: int | None = None,
+    board: BaseBoard,
+) -> Meta:
+    """Write a Raster object to the board as a chunked Zarr store.
+
+    The array is split into square chunks which are compressed concurrently in a
+    thread pool, and each chunk is stored as a separate file in the pin version,
+    alongside the CRS and transform attributes.
+
+    Args:
+        x: A Raster to pin.
+        name: Pin name.
+        type: File type used to save `x` to disk. Only "zarr" is supported.
+        title: A title for the pin; most important for shared boards so that others
+                can understand what the pin contains. If omitted, a brief description
+                of the contents will be automatically generated.
+        description: A detailed description of the pin contents.
+        metadata: A dictionary containing additional metadata to store with the pin.
+                    This gets stored on the Meta.user field.
+        versioned: Whether the pin should be versioned. Defaults to versioning, and
+                   the alternative is not supported.
+        created: Not supported. A date to store in the Meta.created field. This field
+                 may be used as part of the pin version name.
+        force_identical_write: Not supported. Store the pin even if the pin contents are
+                               identical to the last version (compared using the hash).
+                               Only the pin contents are compared, not the pin metadata.
+                               Defaults to False.
+        chunk_size: The height and width of each chunk, in cells.
+        max_workers: The maximum number of threads used to compress chunks. Defaults
+                     to the `concurrent.futures.ThreadPoolExecutor` default.
+        board: The (geo)pins board to write to.
+
+    Returns:
+        Metadata about the stored pin. If `force_identical_write` is False and the
+        pin contents are identical to the last version, the last version's metadata
+        is returned.
+    """
+    if type != "zarr":
+        msg = 'Only `type="zarr"` is supported for this function.'
+        raise ValueError(msg)
+    if force_identical_write:
+        msg = "`force_identical_write=True` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+    if versioned is not None:
+        msg = "`versioned` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+    if created is not None:
+        msg = "`created` is not supported for Raster pins."
+        raise NotImplementedError(msg)
+
+    arr = x.arr
+    height, width = arr.shape
+    fill_value = np.nan if np.issubdtype(arr.dtype, np.floating) else 0
+
+    zarray = {
+        "zarr_format": 2,
+        "shape": [height, width],
+        "chunks": [chunk_size, chunk_size],
+        "dtype": arr.dtype.str,
+        "compressor": {"id": "zlib", "level": _ZLIB_LEVEL},
+        "fill_value": _encode_fill_value(fill_value),
+        "order": "C",
+        "filters": None,
+        "dimension_separator": ".",
+    }
+    zattrs = {
+        # Allows xarray to label the dimensions
+        "_ARRAY_DIMENSIONS": ["y", "x"],
+        "crs": x.crs.to_wkt(),
+        "transform": list(x.transform)[:6],
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir_path = Path(tmpdir)
+
+        zarray_path = tmpdir_path / _ZARRAY
+        zarray_path.write_text(json.dumps(zarray))
+        zattrs_path = tmpdir_path / _ZATTRS
+        zattrs_path.write_text(json.dumps(zattrs))
+
+        def write_chunk(chunk_row: int, chunk_col: int) -> Path | None:
+            chunk = _get_padded_chunk(
+                arr,
+                chunk_row=chunk_row,
+                chunk_col=chunk_col,
+                chunk_size=chunk_size,
+                fill_value=fill_value,
+            )
+            if _is_all_fill(chunk, fill_value=fill_value):
+                return None
+
+            path = tmpdir_path / f"{chunk_row}.{chunk_col}"
+            path.write_bytes(zlib.compress(chunk.tobytes(), _ZLIB_LEVEL))
+            return path
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(write_chunk, chunk_row, chunk_col)
+                for chunk_row in range(math.ceil(height / chunk_size))
+                for chunk_col in range(math.ceil(width / chunk_size))
+            ]
+            chunk_paths = [future.result() for future in futures]
+
+        paths = [zarray_path, zattrs_path] + [p for p in chunk_paths if p is not None]
+
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+
+            return board.pin_upload(
+                paths=[path.as_posix() for path in paths],
+                name=name,
+                title=title,
+                description=description,
+                metadata=metadata,
+            )
+
+
+def _get_padded_chunk(
+    arr: NDArray, *, chunk_row: int, chunk_col: int, chunk_size: int, fill_value: Any
+) -> NDArray:
+    # Zarr v2 always stores full-sized chunks, so edge chunks are padded.
+    chunk = arr[
+        chunk_row * chunk_size : (chunk_row + 1) * chunk_size,
+        chunk_col * chunk_size : (chunk_col + 1) * chunk_size,
+    ]
+    if chunk.shape == (chunk_size, chunk_size):
+        return np.ascontiguousarray(chunk)
+
+    padded = np.full((chunk_size, chunk_size), fill_value, dtype=arr.dtype)
+    padded[: chunk.shape[0], : chunk.shape[1]] = chunk
+    return padded
+
+
+def _is_all_fill(chunk: NDArray, *, fill_value: Any) -> bool:
+    if isinstance(fill_value, float) and np.isnan(fill_value):
+        return bool(np.isnan(chunk).all())
+    return bool((chunk == fill_value).all())
+
+
+def _bounds_to_window(
+    bounds: tuple[float, float, float, float],
+    *,
+    transform: Affine,
+    shape: tuple[int, int],
+) -> Window:
+    # The window of whole cells overlapping the bounds, clipped to the raster extent.
+    # N.B. rastr only supports non-rotated transforms, which may be north-up or
+    # south-up, so we can't use rasterio.windows.from_bounds (north-up only).
+    xmin, ymin, xmax, ymax = bounds
+    height, width = shape
+    cols = sorted(
+        ((xmin - transform.c) / transform.a, (xmax - transform.c) / transform.a)
+    )
+    rows = sorted(
+        ((ymin - transform.f) / transform.e, (ymax - transform.f) / transform.e)
+    )
+    row_start = min(max(math.floor(rows[0]), 0), height)
+    row_stop = min(max(math.ceil(rows[1]), 0), height)
+    col_start = min(max(math.floor(cols[0]), 0), width)
+    col_stop = min(max(math.ceil(cols[1]), 0), width)
+    return Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+
+def _encode_fill_value(fill_value: float) -> float | str:
+    # JSON has no NaN, so Zarr v2 uses the string "NaN" instead.
+    if isinstance(fill_value, float) and np.isnan(fill_value):
+        return "NaN"
+    return fill_value
+
+
+def _decode_fill_value(fill_value: float | str) -> float:
+    if fill_value == "NaN":
+        return np.nan
+    return float(fill_value)
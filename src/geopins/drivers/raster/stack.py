@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from rastr.raster import Raster
+
+
+@dataclass
+class RasterStack:
+    """A sequence of co-registered rasters, e.g. a time series or a set of scenarios.
+
+    Each raster is a band of the stack, identified by a label such as a date or a
+    scenario name. All rasters must share the same shape, CRS and transform.
+
+    Attributes:
+        rasters: The rasters in the stack, keyed by their band label, in band order.
+    """
+
+    rasters: dict[str, Raster]
+
+    def __post_init__(self) -> None:
+        if not self.rasters:
+            msg = "A RasterStack must contain at least one raster."
+            raise ValueError(msg)
+
+        first_label, first = next(iter(self.rasters.items()))
+        for label, raster in self.rasters.items():
+            if not raster.is_like(first):
+                msg = (
+                    f"Raster '{label}' is not co-registered with raster "
+                    f"'{first_label}': all rasters in a stack must have the same "
+                    "shape, CRS and transform."
+                )
+                raise ValueError(msg)
+
+    @property
+    def labels(self) -> list[str]:
+        """The band labels, in band order."""
+        return list(self.rasters)
+
+    def __getitem__(self, label: str) -> Raster:
+        return self.rasters[label]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.rasters)
+
+    def __len__(self) -> int:
+        return len(self.rasters)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, TypedDict
+
+import numpy as np
+import rasterio
+from rasterio.windows import Window, from_bounds, intersect
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+# The number of bins in each band histogram.
+_HISTOGRAM_BINS = 64
+
+# The number of rows of an in-memory array processed at once.
+_BLOCK_ROWS = 256
+
+
+class Histogram(TypedDict):
+    """A histogram of the cell values of a raster band.
+
+    Attributes:
+        edges: The bin edges, in ascending order. There is one more edge than bins.
+        counts: The number of cells in each bin.
+    """
+
+    edges: list[float]
+    counts: list[int]
+
+
+class BandStats(TypedDict):
+    """Summary statistics of the cell values of a raster band.
+
+    The statistics exclude nodata cells; they are None if every cell is nodata.
+
+    Attributes:
+        min: The minimum value.
+        max: The maximum value.
+        mean: The mean value.
+        std: The (population) standard deviation.
+        nodata_count: The number of nodata cells, including NaN cells.
+        histogram: A histogram of the values, with equal-width bins.
+    """
+
+    min: float | None
+    max: float | None
+    mean: float | None
+    std: float | None
+    nodata_count: int
+    histogram: Histogram
+
+
+def get_array_stats(arr: NDArray) -> BandStats:
+    """Compute the statistics of a band in memory, in a single pass over row blocks.
+
+    Args:
+        arr: The cell values of the band, with NaN for nodata cells.
+
+    Returns:
+        The band statistics.
+    """
+    accumulator = StatsAccumulator()
+    for i in range(0, arr.shape[0], _BLOCK_ROWS):
+        accumulator.update(arr[i : i + _BLOCK_ROWS])
+    return accumulator.result()
+
+
+def get_tif_stats(
+    path: Path | str, *, bounds: tuple[float, float, float, float] | None = None
+) -> list[BandStats]:
+    """Compute the statistics of each band of a GeoTIFF, in a single pass over blocks.
+
+    Only one block of the file is held in memory at a time.
+
+    Args:
+        path: The path to the GeoTIFF.
+        bounds: Only include cells overlapping this bounding box, given as
+                (xmin, ymin, xmax, ymax) in the CRS of the raster. Defaults to the
+                whole raster.
+
+    Returns:
+        The statistics of each band, in band order.
+    """
+    with rasterio.open(path) as src:
+        window = Window.from_slices((0, src.height), (0, src.width))
+        if bounds is not None:
+            bounds_window = _get_outer_window(
+                from_bounds(*bounds, transform=src.transform)
+            )
+            window = (
+                window.intersection(bounds_window)
+                if intersect(window, bounds_window)
+                else Window.from_slices((0, 0), (0, 0))
+            )
+
+        accumulators = [StatsAccumulator() for _ in range(src.count)]
+        for _, block_window in src.block_windows(1):
+            if window.width == 0 or not intersect(block_window, window):
+                continue
+            block = src.read(window=block_window.intersection(window), masked=True)
+            for accumulator, band in zip(accumulators, block, strict=True):
+                accumulator.update(band)
+
+    return [accumulator.result() for accumulator in accumulators]
+
+
+def _get_outer_window(window: Window) -> Window:
+    # The smallest window of whole cells containing a fractional window. It may extend
+    # beyond the raster, so it is boundless.
+    rows = (
+        math.floor(window.row_off),
+        math.ceil(window.row_off + window.height),
+    )
+    cols = (
+        math.floor(window.col_off),
+        math.ceil(window.col_off + window.width),
+    )
+    return Window.from_slices(rows, cols, boundless=True)
+
+
+class StatsAccumulator:
+    """Statistics of a raster band, accumulated block by block in a single pass.
+
+    Blocks are merged with Chan et al.'s parallel variance algorithm. The histogram
+    bins double in width, merging pairs of bins, whenever a block falls outside the
+    current range, so their counts stay exact.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.nodata_count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.hist_start = 0.0
+        self.hist_width = 0.0
+        self.hist_counts = np.zeros(_HISTOGRAM_BINS, dtype=np.int64)
+
+    def update(self, block: NDArray | np.ma.MaskedArray) -> None:
+        """Add the cells of a block.
+
+        Args:
+            block: The cell values. Masked and NaN cells are counted as nodata.
+        """
+        mask = np.ma.getmaskarray(block)
+        values = np.ma.getdata(block)
+        if np.issubdtype(values.dtype, np.floating):
+            mask = mask | np.isnan(values)
+        values = values[~mask].astype(np.float64)
+
+        self.nodata_count += int(mask.sum())
+        if values.size == 0:
+            return
+
+        block_mean = float(values.mean())
+        block_m2 = float(((values - block_mean) ** 2).sum())
+        count = self.count + values.size
+        delta = block_mean - self.mean
+        self.m2 += block_m2 + delta**2 * self.count * values.size / count
+        self.mean += delta * values.size / count
+        self.count = count
+
+        block_min, block_max = float(values.min()), float(values.max())
+        self._extend_histogram(block_min, block_max)
+        self.min = min(self.min, block_min)
+        self.max = max(self.max, block_max)
+
+        idx = np.floor((values - self.hist_start) / self.hist_width).astype(np.int64)
+        self.hist_counts += np.bincount(
+            np.clip(idx, 0, _HISTOGRAM_BINS - 1), minlength=_HISTOGRAM_BINS
+        )
+
+    def _extend_histogram(self, block_min: float, block_max: float) -> None:
+        if self.hist_width == 0:
+            self.hist_start = block_min
+            self.hist_width = (block_max - block_min) / _HISTOGRAM_BINS or 1.0
+            return
+
+        half = _HISTOGRAM_BINS // 2
+        while block_min < self.hist_start:
+            merged = self.hist_counts.reshape(half, 2).sum(axis=1)
+            self.hist_counts = np.concatenate([np.zeros(half, np.int64), merged])
+            self.hist_start -= self.hist_width * _HISTOGRAM_BINS
+            self.hist_width *= 2
+        while block_max > self.hist_start + self.hist_width * _HISTOGRAM_BINS:
+            merged = self.hist_counts.reshape(half, 2).sum(axis=1)
+            self.hist_counts = np.concatenate([merged, np.zeros(half, np.int64)])
+            self.hist_width *= 2
+
+    def add_nodata(self, count: int) -> None:
+        """Add nodata cells which aren't in any block.
+
+        Args:
+            count: The number of nodata cells.
+        """
+        self.nodata_count += count
+
+    def result(self) -> BandStats:
+        """Get the statistics of the cells added so far.
+
+        Returns:
+            The band statistics.
+        """
+        histogram = Histogram(
+            edges=[
+                self.hist_start + i * self.hist_width
+                for i in range(_HISTOGRAM_BINS + 1)
+            ],
+            counts=[int(count) for count in self.hist_counts],
+        )
+        if self.count == 0:
+            return BandStats(
+                min=None,
+                max=None,
+                mean=None,
+                std=None,
+                nodata_count=self.nodata_count,
+                histogram=histogram,
+            )
+        return BandStats(
+            min=self.min,
+            max=self.max,
+            mean=self.mean,
+            std=(self.m2 / self.count) ** 0.5,
+            nodata_count=self.nodata_count,
+            histogram=histogram,
+        )
@@ -27,3 +27,18 @@ def get_filetype_display_name(filetype: str) -> str:
     except KeyError:
         msg = f"Filetype '{filetype}' is not recognized."
         raise NotImplementedError(msg) from None
+
+
+def get_pin_file_stem(name: str | None) -> str:
+    """Get the stem of the name of the file which a pin's object is written to.
+
+    As in pins, qualified pin names (e.g. "user/pin" on Posit Connect) are reduced to
+    their final component, since they aren't valid file names.
+
+    Args:
+        name: The pin name.
+
+    Returns:
+        The file name stem, e.g. "pin" for "user/pin".
+    """
+    return str(name).rsplit("/", maxsplit=1)[-1]
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import functools
+import warnings
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from fsspec.implementations.cached import (
+    CachingFileSystem,
+    SimpleCacheFileSystem,
+    WholeFileCacheFileSystem,
+)
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.utils import get_protocol
+from pins.errors import PinsError
+from xxhash import xxh64
+
+from geopins.cache import get_transcode_cache
+
+if TYPE_CHECKING:
+    import aiohttp
+    from fsspec import AbstractFileSystem
+    from pins.boards import BaseBoard, IFileSystem
+    from pins.meta import Meta
+
+# Mapping from fsspec protocols to the GDAL virtual filesystem prefixes which support
+# ranged (partial) reads of remote objects.
+_GDAL_VSI_PREFIXES = {
+    "s3": "/vsis3/",
+    "s3a": "/vsis3/",
+    "gs": "/vsigs/",
+    "gcs": "/vsigs/",
+    "az": "/vsiaz/",
+    "abfs": "/vsiaz/",
+    "abfss": "/vsiaz/",
+    "http": "/vsicurl/",
+    "https": "/vsicurl/",
+}
+
+# The size of the chunks in which files are streamed while hashing them.
+_HASH_CHUNK_SIZE = 8 * 1024**2
+
+
+def get_pin_file_path(fname: str, *, meta: Meta, board: BaseBoard) -> str:
+    """Get the path to a file in a pin version, relative to the board's filesystem.
+
+    Args:
+        fname: The name of the file within the pin version, e.g. as listed in
+               `meta.file`.
+        meta: The pin metadata.
+        board: The pins board the pin is stored on.
+
+    Returns:
+        The path to the file, suitable for passing to `board.fs`.
+    """
+    if meta.name is None:
+        msg = "The pin metadata has no pin name."
+        raise ValueError(msg)
+    return board.construct_path(
+        [board.path_to_pin(meta.name), meta.version.version, fname]
+    )
+
+
+def get_board_fs(board: BaseBoard) -> AbstractFileSystem:
+    """Get the filesystem of a board, including any local cache.
+
+    Args:
+        board: The pins board.
+
+    Returns:
+        The board's filesystem, i.e. `board.fs`.
+    """
+    # N.B. pins only types board.fs as a minimal protocol, but every board's
+    # filesystem is an fsspec filesystem.
+    return cast("AbstractFileSystem", board.fs)
+
+
+def set_board_fs(board: BaseBoard, fs: AbstractFileSystem) -> None:
+    """Replace the filesystem of a board, including any local cache.
+
+    Args:
+        board: The pins board.
+        fs: The new filesystem of the board.
+    """
+    board.fs = cast("IFileSystem", fs)
+
+
+def get_target_fs(board: BaseBoard) -> AbstractFileSystem:
+    """Get the filesystem which actually stores the board, bypassing any local cache.
+
+    Args:
+        board: The pins board.
+
+    Returns:
+        The underlying filesystem of the board.
+    """
+    return unwrap_cache(get_board_fs(board))
+
+
+def unwrap_cache(fs: AbstractFileSystem) -> AbstractFileSystem:
+    """Get the filesystem underneath any local caches of a filesystem.
+
+    Args:
+        fs: The filesystem, e.g. `board.fs`.
+
+    Returns:
+        The filesystem which actually stores the files.
+    """
+    while isinstance(fs, CachingFileSystem):
+        fs = fs.fs
+    return fs  # pyright: ignore[reportReturnType]
+
+
+def set_target_fs(board: BaseBoard, fs: AbstractFileSystem) -> None:
+    """Replace the filesystem which actually stores the board, keeping any local cache.
+
+    Args:
+        board: The pins board.
+        fs: The new underlying filesystem of the board.
+    """
+    cache_fs = get_board_fs(board)
+    if not isinstance(cache_fs, CachingFileSystem):
+        set_board_fs(board, fs)
+        return
+
+    while isinstance(cache_fs.fs, CachingFileSystem):
+        cache_fs = cache_fs.fs
+    cache_fs.fs = fs
+
+
+def get_pooled_fs(
+    fs: AbstractFileSystem, *, max_connections: int, keepalive_timeout: float
+) -> AbstractFileSystem:
+    """Get a copy of a filesystem which keeps a bounded pool of reusable connections.
+
+    Args:
+        fs: The filesystem to copy, e.g. as returned by `get_target_fs`.
+        max_connections: The maximum number of open connections.
+        keepalive_timeout: How long idle connections are kept open, in seconds. S3
+                           connections use TCP keep-alive instead.
+
+    Returns:
+        A filesystem with the same storage options as `fs`, plus the pool settings.
+    """
+    protocol = _get_protocol(fs)
+    if protocol in ("http", "https"):
+        pool_options: dict[str, Any] = {
+            "get_client": functools.partial(
+                _get_pooled_http_client,
+                max_connections=max_connections,
+                keepalive_timeout=keepalive_timeout,
+            )
+        }
+    elif protocol in ("s3", "s3a"):
+        pool_options = {
+            "config_kwargs": {
+                **(fs.storage_options.get("config_kwargs") or {}),
+                "max_pool_connections": max_connections,
+                "tcp_keepalive": True,
+            }
+        }
+    else:
+        msg = f"Connection pooling is not supported for {protocol!r} filesystems."
+        raise NotImplementedError(msg)
+
+    return type(fs)(**{**fs.storage_options, **pool_options})
+
+
+async def _get_pooled_http_client(
+    *, max_connections: int, keepalive_timeout: float, **kwargs: Any
+) -> aiohttp.ClientSession:
+    # Replaces the default client factory of fsspec's HTTP filesystem.
+    try:
+        import aiohttp  # noqa: PLC0415
+    except ImportError as err:
+        msg = (
+            "Connection pooling for HTTP boards requires aiohttp, which is installed "
+            "with the `http` extra, i.e. `pip install geopins[http]`."
+        )
+        raise ImportError(msg) from err
+
+    connector = aiohttp.TCPConnector(
+        limit=max_connections, keepalive_timeout=keepalive_timeout
+    )
+    return aiohttp.ClientSession(connector=connector, **kwargs)
+
+
+def _get_protocol(fs: AbstractFileSystem) -> str:
+    return fs.protocol if isinstance(fs.protocol, str) else fs.protocol[0]
+
+
+def get_local_pin_file_path(fname: str, *, meta: Meta, board: BaseBoard) -> str | None:
+    """Get a local path to a file in a pin version, if it is available without download.
+
+    This is the case for boards on the local filesystem, and for files which have
+    already been downloaded into the pins cache.
+
+    Args:
+        fname: The name of the file within the pin version.
+        meta: The pin metadata.
+        board: The pins board the pin is stored on.
+
+    Returns:
+        The local path to the file, or None if the file would need to be downloaded.
+    """
+    path = get_pin_file_path(fname, meta=meta, board=board)
+
+    if isinstance(get_target_fs(board), LocalFileSystem):
+        return path
+
+    # N.B. only whole-file caches hold complete copies of files; the pins cache is a
+    # SimpleCacheFileSystem.
+    fs = get_board_fs(board)
+    if isinstance(fs, SimpleCacheFileSystem):
+        return fs._check_file(path) or None  # noqa: SLF001
+    if isinstance(fs, WholeFileCacheFileSystem):
+        detail = fs._check_file(path)  # noqa: SLF001
+        return detail[1] if detail else None
+    return None
+
+
+def get_gdal_pin_file_path(fname: str, *, meta: Meta, board: BaseBoard) -> str | None:
+    """Get a path to a file in a pin version which GDAL can read without a download.
+
+    Local files (including those already in the pins cache) are returned as-is. Files
+    on remote boards are returned as GDAL virtual filesystem paths (e.g. `/vsis3/...`),
+    which GDAL reads using ranged requests, so drivers with a spatial index (such as
+    FlatGeobuf and Cloud-Optimized GeoTIFF) only fetch the bytes they need. GDAL is
+    responsible for authentication in that case, via its usual configuration options
+    and environment variables.
+
+    Args:
+        fname: The name of the file within the pin version.
+        meta: The pin metadata.
+        board: The pins board the pin is stored on.
+
+    Returns:
+        A path readable by GDAL, or None if the board's filesystem has no GDAL
+        equivalent, in which case the file should be downloaded instead.
+    """
+    local_path = get_local_pin_file_path(fname, meta=meta, board=board)
+    if local_path is not None:
+        return local_path
+
+    fs = get_target_fs(board)
+    path = get_pin_file_path(fname, meta=meta, board=board)
+    protocol = _get_protocol(fs)
+
+    try:
+        prefix = _GDAL_VSI_PREFIXES[protocol]
+    except KeyError:
+        return None
+
+    if protocol in ("http", "https"):
+        # HTTP paths keep their protocol, e.g. /vsicurl/https://example.com/...
+        if get_protocol(path) not in ("http", "https"):
+            path = f"{protocol}://{path}"
+        return f"{prefix}{path}"
+
+    return f"{prefix}{fs._strip_protocol(path)}"  # noqa: SLF001
+
+
+def open_pin_file(fname: str, *, meta: Meta, board: BaseBoard) -> IO[bytes]:
+    """Open a single file in a pin version for binary reading.
+
+    Unlike `pins.boards.BaseBoard.pin_download`, only the requested file is fetched
+    (and cached, if the board has a cache), rather than every file in the pin.
+
+    Args:
+        fname: The name of the file within the pin version.
+        meta: The pin metadata.
+        board: The pins board the pin is stored on.
+
+    Returns:
+        A binary file object, which should be closed by the caller.
+    """
+    path = get_pin_file_path(fname, meta=meta, board=board)
+    return get_board_fs(board).open(path, "rb")  # pyright: ignore[reportReturnType]
+
+
+def get_gdal_pin_path(
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+    *,
+    board: BaseBoard,
+) -> str:
+    """Get a path which GDAL can read for a single-file pin, downloading if needed.
+
+    The file is read in-place where possible (see `get_gdal_pin_file_path`), and is
+    otherwise downloaded into the pins cache. Validating a `hash` requires a local
+    copy of the file, so remote files are always downloaded in that case.
+
+    Args:
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data.
+        board: The pins board the pin is stored on.
+
+    Returns:
+        A path to the pinned file, readable by GDAL.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        meta = board.pin_fetch(name, version)
+
+    if isinstance(meta.file, str) and hash is None:
+        # Avoid a full download where GDAL can read the file in-place.
+        path = get_gdal_pin_file_path(meta.file, meta=meta, board=board)
+        if path is not None:
+            return path
+
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        filenames = board.pin_download(name=name, version=version, hash=hash)
+
+    try:
+        (filename,) = filenames
+    except ValueError:
+        msg = f"Expected 1 file, got {len(filenames)}"
+        raise ValueError(msg) from None
+
+    return filename
+
+
+def pin_download_verified(meta: Meta, *, hash: str, board: BaseBoard) -> list[str]:  # noqa: A002
+    """Download the files contained in a pin, validating their contents against a hash.
+
+    The content hash is computed incrementally while each file streams from the
+    board, so files are read once rather than downloaded and then re-read to hash
+    them. Local files (including those already in the pins cache) are hashed in
+    place. Downloaded files are stored in the board's transcode cache (see
+    `GeoBaseBoard.enable_transcode_cache`), keyed by the pin hash, so later calls
+    reuse them without downloading or hashing them again, and the least recently
+    used copies are evicted to keep the cache within its size bound.
+
+    Args:
+        meta: The pin metadata.
+        hash: The expected pin hash, as in the `pin_hash` field of the metadata.
+        board: The pins board the pin is stored on.
+
+    Returns:
+        The local paths to the verified files.
+
+    Raises:
+        PinsError: If `hash` doesn't match the pin metadata, or the downloaded
+                   contents don't match `hash`.
+    """
+    if hash != meta.pin_hash:
+        msg = (
+            f"The requested hash '{hash}' does not match the hash of pin "
+            f"'{meta.name}' version '{meta.version.version}': '{meta.pin_hash}'."
+        )
+        raise PinsError(msg)
+
+    fnames = [meta.file] if isinstance(meta.file, str) else list(meta.file)
+    cache = get_transcode_cache(board)
+
+    paths = []
+    file_hashes = []
+    downloaded = []
+    for fname in fnames:
+        # N.B. the files of a pin share a key prefix, so multi-file formats (e.g.
+        # shapefiles) keep a common stem.
+        path, file_hash = _get_verified_file(
+            fname, f"{meta.pin_hash}_{fname}", meta=meta, board=board
+        )
+        if file_hash is not None and Path(path).parent == cache.path:
+            downloaded.append(Path(path))
+        paths.append(str(path))
+        file_hashes.append(file_hash)
+
+    if all(file_hash is None for file_hash in file_hashes):
+        # Every file was verified by an earlier download.
+        return paths
+
+    # N.B. this follows pins.versions.Version.from_files
+    for i, path in enumerate(paths):
+        if file_hashes[i] is None and len(fnames) > 1:
+            with Path(path).open("rb") as f:
+                file_hashes[i] = _hash_stream(f)
+    if len(file_hashes) == 1:
+        (content_hash,) = file_hashes
+    else:
+        combined_hashes = "".join(file_hash or "" for file_hash in file_hashes)
+        content_hash = xxh64(combined_hashes.encode("utf-8")).hexdigest()
+
+    if content_hash != hash:
+        for path in downloaded:
+            path.unlink(missing_ok=True)
+        msg = (
+            f"The contents of pin '{meta.name}' version '{meta.version.version}' do "
+            f"not match its hash: expected '{hash}', got '{content_hash}'."
+        )
+        raise PinsError(msg)
+
+    return paths
+
+
+def _get_verified_file(
+    fname: str, key: str, *, meta: Meta, board: BaseBoard
+) -> tuple[Path, str | None]:
+    cache = get_transcode_cache(board)
+    path = cache.get(key)
+    if path is not None:
+        return path, None
+
+    local_path = get_local_pin_file_path(fname, meta=meta, board=board)
+    if local_path is not None:
+        with Path(local_path).open("rb") as f:
+            return Path(local_path).absolute(), _hash_stream(f)
+
+    file_hashes = []
+
+    def write(path: Path) -> None:
+        file_hashes.append(_download_and_hash(fname, path, meta=meta, board=board))
+
+    path = cache.put(key, write)
+    (file_hash,) = file_hashes
+    return path, file_hash
+
+
+def _download_and_hash(
+    fname: str, local_path: Path, *, meta: Meta, board: BaseBoard
+) -> str:
+    with (
+        local_path.open("wb") as dst,
+        cast(
+            "IO[bytes]",
+            get_target_fs(board).open(
+                get_pin_file_path(fname, meta=meta, board=board), "rb"
+            ),
+        ) as src,
+    ):
+        return _hash_stream(src, dst=dst)
+
+
+def _hash_stream(src: IO[bytes], *, dst: IO[bytes] | None = None) -> str:
+    # N.B. pins hashes file contents using xxh64 (see pins.versions.Version)
+    hasher = xxh64()
+    while chunk := src.read(_HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+        if dst is not None:
+            dst.write(chunk)
+    return hasher.hexdigest()
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pins.boards import BaseBoard
     from pins.meta import Meta
 
+# The key in the user metadata (`Meta.user`) under which geopins records its own
+# metadata about a pin, e.g. the band labels of a raster stack.
+GEOPINS_METADATA_KEY = "geopins"
+
 
 def get_pinned_file_path(*, meta: Meta, board: BaseBoard) -> Path | list[Path]:
     """Get the path to the main data file for a pin, if it exists.
@@ -26,3 +32,78 @@ def get_pinned_file_path(*, meta: Meta, board: BaseBoard) -> Path | list[Path]:
         return [pin_path / f for f in file]
 
     return pin_path / file
+
+
+def get_geopins_metadata(meta: Meta) -> dict[str, Any]:
+    """Get the metadata recorded by geopins drivers when the pin was written.
+
+    This is stored under the "geopins" key of the user metadata (`Meta.user`).
+
+    Args:
+        meta: The pin metadata.
+
+    Returns:
+        The geopins metadata, which is empty if none was recorded.
+    """
+    return dict(meta.user.get(GEOPINS_METADATA_KEY) or {})
+
+
+def add_geopins_metadata(metadata: Mapping | None, **fields: Any) -> dict[str, Any]:
+    """Add geopins driver metadata to the user metadata for a pin being written.
+
+    Args:
+        metadata: The user metadata passed to `pin_write`, if any.
+        **fields: The geopins metadata fields to record.
+
+    Returns:
+        A copy of the user metadata, with the fields added under the "geopins" key.
+    """
+    metadata = dict(metadata or {})
+    metadata[GEOPINS_METADATA_KEY] = {
+        **(metadata.get(GEOPINS_METADATA_KEY) or {}),
+        **fields,
+    }
+    return metadata
+
+
+def get_bounds_overlap(
+    meta: Meta, bbox: tuple[float, float, float, float] | None
+) -> float:
+    """Get the fraction of the recorded extent of a pin which overlaps a bounding box.
+
+    Args:
+        meta: The pin metadata.
+        bbox: The bounding box, given as (xmin, ymin, xmax, ymax) in the CRS of the
+              pin.
+
+    Returns:
+        The overlapping fraction of the pin's extent, between 0 and 1. This is 1 if
+        there is no bounding box, or if the extent of the pin wasn't recorded or has
+        no area.
+    """
+    bounds = get_geopins_metadata(meta).get("bounds")
+    if bbox is None or bounds is None:
+        return 1.0
+
+    xmin, ymin, xmax, ymax = bounds
+    area = (xmax - xmin) * (ymax - ymin)
+    if area <= 0:
+        return 1.0
+    width = max(min(xmax, bbox[2]) - max(xmin, bbox[0]), 0.0)
+    height = max(min(ymax, bbox[3]) - max(ymin, bbox[1]), 0.0)
+    return width * height / area
+
+
+def get_total_file_size(meta: Meta) -> int:
+    """Get the total size of the files in a pin version.
+
+    Args:
+        meta: The pin metadata.
+
+    Returns:
+        The total size of the pin's files, in bytes.
+    """
+    file_size = meta.file_size
+    if isinstance(file_size, list):
+        return sum(file_size)
+    return file_size or 0
@@ -7,10 +7,46 @@ from geopins.boards import GeoBaseBoard
 def patch() -> None:
     """Monkey patches pins boards to support geospatial data types.
 
+    The following `pins.boards.BaseBoard` methods are replaced with those of
+    `GeoBaseBoard`, so they apply to every board, including for non-geospatial pins:
+
+    - `pin_read` and `pin_write`, which dispatch GeoDataFrames, Rasters and
+      RasterStacks to the geopins drivers, and otherwise behave as in pins.
+    - `pin_download` and `pin_upload`, which the geopins drivers use to transfer pin
+      files. These behave as in pins unless download locks or multipart uploads are
+      enabled, except that `pin_download` also supports validating a `hash`.
+
+    The following `GeoBaseBoard` methods are also added to every board:
+
+    - `enable_*`/`disable_*` methods for the opt-in features: connection pooling,
+      download locks, memory budgets, multipart uploads, and the object and
+      transcode caches. All of these are disabled by default.
+    - `prefetch`, `pin_write_many`, `pin_diff` and `pin_share`.
+
+    Finally, `pins.boards.BaseBoard` is replaced with `GeoBaseBoard`.
+
     This does not affect any custom board subclasses that provide custom implementations
-    of `pin_read` or `pin_write`.
+    of these methods.
     """
 
     BaseBoard.pin_read = GeoBaseBoard.pin_read  # pyright: ignore[reportAttributeAccessIssue]
     BaseBoard.pin_write = GeoBaseBoard.pin_write  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.pin_download = GeoBaseBoard.pin_download  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.pin_upload = GeoBaseBoard.pin_upload  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.enable_download_locks = GeoBaseBoard.enable_download_locks  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.disable_download_locks = GeoBaseBoard.disable_download_locks  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.enable_connection_pool = GeoBaseBoard.enable_connection_pool  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.disable_connection_pool = GeoBaseBoard.disable_connection_pool  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.enable_memory_budget = GeoBaseBoard.enable_memory_budget  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.disable_memory_budget = GeoBaseBoard.disable_memory_budget  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.enable_multipart_uploads = GeoBaseBoard.enable_multipart_uploads  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.disable_multipart_uploads = GeoBaseBoard.disable_multipart_uploads  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.enable_object_cache = GeoBaseBoard.enable_object_cache  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.disable_object_cache = GeoBaseBoard.disable_object_cache  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.enable_transcode_cache = GeoBaseBoard.enable_transcode_cache  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.disable_transcode_cache = GeoBaseBoard.disable_transcode_cache  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.prefetch = GeoBaseBoard.prefetch  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.pin_write_many = GeoBaseBoard.pin_write_many  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.pin_diff = GeoBaseBoard.pin_diff  # pyright: ignore[reportAttributeAccessIssue]
+    BaseBoard.pin_share = GeoBaseBoard.pin_share  # pyright: ignore[reportAttributeAccessIssue]
     pins.boards.BaseBoard = GeoBaseBoard
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import fnmatch
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pins.errors import PinsError
+from pyproj import CRS, Transformer
+
+from geopins.fs import get_local_pin_file_path
+from geopins.meta import get_geopins_metadata
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pins.boards import BaseBoard
+    from pins.meta import Meta
+
+
+@dataclass
+class PrefetchReport:
+    """A summary of the pins downloaded by `prefetch`.
+
+    Attributes:
+        names: The names of the pins which were prefetched.
+        nbytes: The total size of the downloaded files, in bytes. Files which were
+                already in the cache aren't counted.
+        seconds: The elapsed time, in seconds.
+        failed: The errors raised while prefetching pins, keyed by pin name. The
+                other pins are still prefetched.
+    """
+
+    names: list[str] = field(default_factory=list)
+    nbytes: int = 0
+    seconds: float = 0.0
+    failed: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """The average download throughput, in bytes per second."""
+        if self.seconds == 0:
+            return 0.0
+        return self.nbytes / self.seconds
+
+    def __str__(self) -> str:
+        summary = (
+            f"Prefetched {len(self.names)} pins ({self.nbytes / 1e6:.1f} MB) in "
+            f"{self.seconds:.1f} s ({self.throughput / 1e6:.1f} MB/s)"
+        )
+        if self.failed:
+            summary += f"; {len(self.failed)} failed ({', '.join(self.failed)})"
+        return summary
+
+
+def prefetch(  # noqa: PLR0913
+    board: BaseBoard,
+    names: Sequence[str] | None = None,
+    *,
+    versions: Mapping[str, str] | None = None,
+    pattern: str | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    crs: CRS | str | None = None,
+    max_workers: int | None = 8,
+) -> PrefetchReport:
+    """Download pins into the local pins cache concurrently, ahead of reading them.
+
+    This has no effect for boards without a cache, e.g. local boards.
+
+    Args:
+        board: The pins board to prefetch from.
+        names: The names of the pins to prefetch. Defaults to every pin on the board.
+        versions: Specific versions to prefetch, keyed by pin name. Defaults to the
+                  latest version of each pin.
+        pattern: Only prefetch pins whose names match this glob pattern, e.g.
+                 "flood-*".
+        bbox: Only prefetch pins whose bounds intersect this bounding box, given as
+              (xmin, ymin, xmax, ymax). Pins without recorded bounds (e.g. those not
+              written by geopins) are skipped.
+        crs: The CRS of `bbox`. Defaults to the CRS of each pin.
+        max_workers: The maximum number of pins to download at once.
+
+    Returns:
+        A summary of the prefetched pins, including the download throughput, and of
+        any pins which couldn't be prefetched.
+    """
+    if versions is None:
+        versions = {}
+
+    start = time.perf_counter()
+
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+
+        if names is None:
+            names = board.pin_list()
+        if pattern is not None:
+            names = [name for name in names if fnmatch.fnmatchcase(name, pattern)]
+
+        def prefetch_pin(name: str) -> int | None:
+            meta = board.pin_fetch(name, versions.get(name))
+            if bbox is not None and not _intersects(meta, bbox=bbox, crs=crs):
+                return None
+
+            fnames = [meta.file] if isinstance(meta.file, str) else list(meta.file)
+            uncached = {
+                fname
+                for fname in fnames
+                if get_local_pin_file_path(fname, meta=meta, board=board) is None
+            }
+            paths = board.pin_download(name, version=meta.version.version)
+            return sum(
+                Path(path).stat().st_size
+                for path in paths
+                if Path(path).name in uncached
+            )
+
+        report = PrefetchReport()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(name, executor.submit(prefetch_pin, name)) for name in names]
+            for name, future in futures:
+                try:
+                    nbytes = future.result()
+                except (PinsError, OSError) as e:
+                    report.failed[name] = e
+                    continue
+                if nbytes is not None:
+                    report.names.append(name)
+                    report.nbytes += nbytes
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _intersects(
+    meta: Meta, *, bbox: tuple[float, float, float, float], crs: CRS | str | None
+) -> bool:
+    geopins_metadata = get_geopins_metadata(meta)
+    bounds = geopins_metadata.get("bounds")
+    if bounds is None:
+        return False
+
+    pin_crs = geopins_metadata.get("crs")
+    if crs is not None and pin_crs is not None:
+        transformer = Transformer.from_crs(
+            CRS.from_user_input(crs), CRS.from_user_input(pin_crs), always_xy=True
+        )
+        bbox = transformer.transform_bounds(*bbox)
+
+    xmin, ymin, xmax, ymax = bounds
+    return not (bbox[2] < xmin or bbox[0] > xmax or bbox[3] < ymin or bbox[1] > ymax)
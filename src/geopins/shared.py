@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import pyarrow as pa
+from affine import Affine
+from geopandas import GeoDataFrame
+from pyproj import CRS
+from rastr.meta import RasterMeta
+from rastr.raster import Raster
+
+if TYPE_CHECKING:
+    from pins.boards import BaseBoard
+    from typing_extensions import Self
+
+# Shared memory blocks attached to by this process, keyed by name. These are kept
+# open for the lifetime of the process, since the objects read from them don't
+# own their memory.
+_ATTACHED: dict[str, shared_memory.SharedMemory] = {}
+
+
+@dataclass
+class SharedPin:
+    """A pin which has been read once and published in shared memory.
+
+    This is a small, picklable handle, which can be passed to worker processes (e.g.
+    as an argument to `ProcessPoolExecutor.submit`) in place of the object itself.
+    Each worker calls `get` to attach to the shared memory, rather than reading the
+    pin again or receiving a pickled copy.
+
+    Rasters are attached zero-copy, as read-only arrays. GeoDataFrames are published
+    as an Arrow IPC file; the Arrow table is attached zero-copy, and only the
+    conversion to a GeoDataFrame is done in each worker.
+
+    The process which created the handle owns the shared memory, and must call
+    `unlink` (or use the handle as a context manager) once the workers are done.
+
+    Attributes:
+        kind: The type of the shared object, "raster" or "gdf".
+        shm_name: The name of the shared memory block.
+        nbytes: The size of the shared data, in bytes.
+        shape: The shape of the cell array, for rasters.
+        dtype: The data type of the cell array, for rasters.
+        crs: The CRS of the raster, as WKT.
+        transform: The affine transform of the raster, as a tuple of 6 coefficients.
+    """
+
+    kind: Literal["raster", "gdf"]
+    shm_name: str
+    nbytes: int
+    shape: tuple[int, ...] | None = None
+    dtype: str | None = None
+    crs: str | None = None
+    transform: tuple[float, ...] | None = None
+    _shm: shared_memory.SharedMemory | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def get(self) -> GeoDataFrame | Raster:
+        """Attach to the shared memory, and return the shared object.
+
+        Returns:
+            The shared GeoDataFrame or Raster. The cell arrays of rasters are
+            read-only views of the shared memory.
+        """
+        buf = _get_buffer(_attach(self.shm_name))
+        if self.kind == "raster":
+            if (
+                self.shape is None
+                or self.dtype is None
+                or self.crs is None
+                or self.transform is None
+            ):
+                msg = "A shared raster must have a shape, dtype, CRS and transform."
+                raise ValueError(msg)
+            arr = np.ndarray(
+                self.shape, dtype=np.dtype(self.dtype), buffer=buf[: self.nbytes]
+            )
+            arr.flags.writeable = False
+            return Raster(
+                arr=arr,
+                raster_meta=RasterMeta(
+                    crs=CRS.from_wkt(self.crs), transform=Affine(*self.transform)
+                ),
+            )
+
+        with pa.ipc.open_file(pa.py_buffer(buf[: self.nbytes])) as reader:
+            table = reader.read_all()
+        return GeoDataFrame.from_arrow(table)
+
+    def unlink(self) -> None:
+        """Release the shared memory. Only the process which created it may do this.
+
+        Objects already attached to in other processes remain valid until those
+        processes exit.
+        """
+        if self._shm is None:
+            msg = "Only the process which shared the pin can unlink it."
+            raise RuntimeError(msg)
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.unlink()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Workers attach by name, rather than inheriting the owner's handle.
+        state = self.__dict__.copy()
+        state["_shm"] = None
+        return state
+
+
+def share_pin(
+    board: BaseBoard,
+    name: str,
+    version: str | None = None,
+    hash: str | None = None,  # noqa: A002
+) -> SharedPin:
+    """Read a GeoDataFrame or Raster pin once, and publish it in shared memory.
+
+    Args:
+        board: The pins board to read from.
+        name: Pin name.
+        version: A specific pin version to retrieve.
+        hash: A hash used to validate the retrieved pin data. If specified, it is
+                compared against the `pin_hash` field retrieved by
+                `pins.boards.BaseBoard.pin_meta`.
+
+    Returns:
+        A picklable handle to the shared object, for passing to worker processes.
+    """
+    with warnings.catch_warnings():
+        # Upstream issue relating to opening files without context managers
+        warnings.simplefilter("ignore", category=ResourceWarning)
+        x = board.pin_read(name, version=version, hash=hash)
+
+    if not isinstance(x, (GeoDataFrame, Raster)):
+        msg = f"Pin {name!r} is a {x.__class__.__name__}, not a GeoDataFrame or Raster."
+        raise TypeError(msg)
+    return share_object(x)
+
+
+def share_object(x: GeoDataFrame | Raster) -> SharedPin:
+    """Publish a GeoDataFrame or Raster in shared memory.
+
+    Args:
+        x: The object to share.
+
+    Returns:
+        A picklable handle to the shared object, for passing to worker processes.
+    """
+    if isinstance(x, Raster):
+        arr = np.ascontiguousarray(x.arr)
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=_get_buffer(shm))[...] = arr
+        return SharedPin(
+            kind="raster",
+            shm_name=shm.name,
+            nbytes=arr.nbytes,
+            shape=arr.shape,
+            dtype=arr.dtype.str,
+            crs=x.crs.to_wkt(),
+            transform=tuple(x.transform)[:6],
+            _shm=shm,
+        )
+    elif isinstance(x, GeoDataFrame):
+        table = pa.table(x.to_arrow(geometry_encoding="WKB"))
+        sink = pa.MockOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        nbytes = sink.size()
+
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        _write_table(table, buf=_get_buffer(shm))
+        return SharedPin(kind="gdf", shm_name=shm.name, nbytes=nbytes, _shm=shm)
+    else:
+        msg = f"Expected a GeoDataFrame or Raster, got {x.__class__.__name__}."
+        raise TypeError(msg)
+
+
+def _write_table(table: pa.Table, *, buf: memoryview) -> None:
+    # N.B. the Arrow buffers must be released before the shared memory can be closed.
+    with (
+        pa.FixedSizeBufferWriter(pa.py_buffer(buf)) as stream,
+        pa.ipc.new_file(stream, table.schema) as writer,
+    ):
+        writer.write_table(table)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    return shm
+
+
+def _get_buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    # N.B. the buffer is only None once the block has been closed.
+    buf = shm.buf
+    if buf is None:
+        msg = f"Shared memory block {shm.name!r} has been closed."
+        raise ValueError(msg)
+    return buf
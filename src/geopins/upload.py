@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import copy
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fsspec.callbacks import DEFAULT_CALLBACK
+
+from geopins.fs import get_board_fs, set_board_fs, unwrap_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fsspec import AbstractFileSystem
+    from pins.boards import BaseBoard
+
+    # The wrapper delegates everything it doesn't override to an fsspec filesystem.
+    _FileSystemWrapper = AbstractFileSystem
+else:
+    _FileSystemWrapper = object
+
+# The maximum number of files which can be merged at once, by protocol. Larger
+# uploads are merged in stages.
+_MAX_MERGE_SOURCES = {"gs": 32, "gcs": 32}
+
+
+def get_multipart_board(
+    board: BaseBoard, *, part_size: int, max_workers: int | None
+) -> BaseBoard:
+    """Get a copy of a board which uploads large pin files in parts.
+
+    Writing pins through the copy (e.g. with `pins.boards.BaseBoard.pin_upload`) is
+    otherwise unchanged: only the transfer of each new pin version to the board's
+    filesystem is replaced. Files larger than `part_size` are uploaded with
+    `put_file_multipart`, if the filesystem can merge the parts server-side (e.g. S3
+    and GCS); otherwise, the version is uploaded as usual.
+
+    Args:
+        board: The pins board to write to.
+        part_size: The size of each part, in bytes.
+        max_workers: The maximum number of parts to upload at once.
+
+    Returns:
+        A shallow copy of the board, sharing its cache and target filesystem.
+    """
+    multipart_board = copy.copy(board)
+    set_board_fs(
+        multipart_board,
+        _MultipartFileSystem(
+            get_board_fs(board), part_size=part_size, max_workers=max_workers
+        ),
+    )
+    return multipart_board
+
+
+class _MultipartFileSystem(_FileSystemWrapper):
+    """A filesystem wrapper which uploads the files of pin versions in parts.
+
+    Everything except `put` is delegated to the wrapped filesystem.
+    """
+
+    def __init__(
+        self, fs: AbstractFileSystem, *, part_size: int, max_workers: int | None
+    ) -> None:
+        self.fs = fs
+        self.part_size = part_size
+        self.max_workers = max_workers
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fs, name)
+
+    def put(
+        self,
+        lpath: str,
+        rpath: str,
+        recursive: bool = False,  # noqa: FBT001, FBT002
+        callback: Any = DEFAULT_CALLBACK,
+        maxdepth: int | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        # N.B. pins puts each new pin version as a directory of files.
+        target_fs = unwrap_cache(self.fs)
+        local_paths = (
+            list(Path(lpath).iterdir()) if recursive and Path(lpath).is_dir() else []
+        )
+        if (
+            getattr(target_fs, "merge", None) is None
+            or not local_paths
+            or any(not path.is_file() for path in local_paths)
+            or all(path.stat().st_size <= self.part_size for path in local_paths)
+        ):
+            return self.fs.put(
+                lpath,
+                rpath,
+                recursive=recursive,
+                callback=callback,
+                maxdepth=maxdepth,
+                **kwargs,
+            )
+
+        # The metadata goes last, so the version is only readable once complete.
+        target_fs.makedirs(rpath, exist_ok=True)
+        for local_path in sorted(local_paths, key=lambda path: path.name == "data.txt"):
+            path = f"{rpath.rstrip('/')}/{local_path.name}"
+            if local_path.stat().st_size > self.part_size:
+                put_file_multipart(
+                    target_fs,
+                    local_path,
+                    path,
+                    part_size=self.part_size,
+                    max_workers=self.max_workers,
+                )
+            else:
+                target_fs.put_file(local_path.as_posix(), path)
+        return None
+
+
+def put_file_multipart(  # noqa: PLR0913
+    fs: AbstractFileSystem,
+    lpath: Path | str,
+    rpath: str,
+    *,
+    part_size: int,
+    max_workers: int | None = None,
+    max_attempts: int = 3,
+) -> None:
+    """Upload a local file in parts, concurrently.
+
+    Parts are uploaded to a temporary "<rpath>.parts" directory, then merged into
+    `rpath` server-side. GCS merges at most 32 files at once, so larger uploads are
+    merged there in stages. Each part is retried after transient failures, without
+    re-uploading the parts which succeeded. If the upload still fails, the parts are
+    deleted: retries only happen within this call, and e.g. a retried `pin_write`
+    uploads to a new pin version, so the parts would never be reused.
+
+    Filesystems which can't merge files server-side, i.e. which (unlike S3 and GCS)
+    have no `merge` method, get a single `put_file` instead, since merging the parts
+    client-side would download and re-upload them.
+
+    Args:
+        fs: The filesystem to upload to.
+        lpath: The local file to upload.
+        rpath: The destination path on `fs`.
+        part_size: The size of each part, in bytes. Filesystems with server-side
+                   merges may have a minimum part size, e.g. 5 MiB for S3.
+        max_workers: The maximum number of parts to upload at once. Each worker holds
+                     one part in memory.
+        max_attempts: The maximum number of attempts to upload each part.
+    """
+    lpath = Path(lpath)
+    merge = getattr(fs, "merge", None)
+    if merge is None:
+        fs.put_file(lpath.as_posix(), rpath)
+        return
+
+    size = lpath.stat().st_size
+    n_parts = max(math.ceil(size / part_size), 1)
+    parts_dir = f"{rpath}.parts"
+    part_paths = [f"{parts_dir}/{i:05d}" for i in range(n_parts)]
+
+    def upload_part(i: int) -> None:
+        with lpath.open("rb") as f:
+            f.seek(i * part_size)
+            data = f.read(part_size)
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                fs.pipe_file(part_paths[i], data)
+            except OSError:
+                if attempt == max_attempts:
+                    raise
+                time.sleep(0.1 * 2**attempt)
+            else:
+                return
+
+    try:
+        fs.makedirs(parts_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(upload_part, i) for i in range(n_parts)]:
+                future.result()
+
+        _merge_parts(merge, rpath, part_paths, max_sources=_get_max_merge_sources(fs))
+    finally:
+        try:
+            fs.rm(parts_dir, recursive=True)
+        except FileNotFoundError:
+            pass
+
+
+def _get_max_merge_sources(fs: AbstractFileSystem) -> int | None:
+    protocols = [fs.protocol] if isinstance(fs.protocol, str) else fs.protocol
+    limits = [
+        _MAX_MERGE_SOURCES[protocol]
+        for protocol in protocols
+        if protocol in _MAX_MERGE_SOURCES
+    ]
+    return min(limits, default=None)
+
+
+def _merge_parts(
+    merge: Callable[[str, list[str]], object],
+    rpath: str,
+    part_paths: list[str],
+    *,
+    max_sources: int | None,
+) -> None:
+    if max_sources is None:
+        max_sources = len(part_paths)
+
+    stage = 0
+    while len(part_paths) > max_sources:
+        # Merge each group of parts into an intermediate part, until few enough
+        # remain to merge them into the destination.
+        stage += 1
+        groups = [
+            part_paths[i : i + max_sources]
+            for i in range(0, len(part_paths), max_sources)
+        ]
+        part_paths = [f"{rpath}.parts/{stage}-{j:05d}" for j in range(len(groups))]
+        for path, group in zip(part_paths, groups, strict=True):
+            merge(path, group)
+    merge(rpath, part_paths)
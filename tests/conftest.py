@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+from http_stand_in import HTTPStandIn, StandInRequestHandler
 from pins import board, board_folder
 
 from geopins.boards import GeoBaseBoard
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pins.boards import BaseBoard
 
 collect_ignore_glob = ["assets/**"]
@@ -31,3 +37,43 @@ def tmp_board(tmp_path: Path) -> BaseBoard:
 def tmp_geoboard(tmp_path: Path) -> GeoBaseBoard:
     """Return a geo board based in a (local) temporary directory."""
     return board("file", path=tmp_path.as_posix(), board_factory=GeoBaseBoard)  # pyright: ignore[reportReturnType] https://github.com/rstudio/pins-python/issues/347
+
+
+@pytest.fixture
+def http_stand_in(tmp_path: Path) -> Iterator[HTTPStandIn]:
+    """Serve a (local) temporary directory over HTTP, as remote board storage."""
+    directory = tmp_path / "http"
+    directory.mkdir()
+    stand_in = HTTPStandIn(url="", directory=directory)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        partial(StandInRequestHandler, stand_in=stand_in, directory=directory),
+    )
+    server.daemon_threads = True
+    stand_in.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_local_geoboard(http_stand_in: HTTPStandIn) -> GeoBaseBoard:
+    """Return a geo board on the directory served by the HTTP stand-in, for writing."""
+    return board(  # pyright: ignore[reportReturnType] https://github.com/rstudio/pins-python/issues/347
+        "file", path=http_stand_in.directory.as_posix(), board_factory=GeoBaseBoard
+    )
+
+
+@pytest.fixture
+def http_geoboard(
+    http_stand_in: HTTPStandIn, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> GeoBaseBoard:
+    """Return a (read-only) geo board served by the HTTP stand-in.
+
+    Pins are written to the stand-in with `http_local_geoboard`.
+    """
+    pytest.importorskip("aiohttp")
+    monkeypatch.setenv("PINS_CACHE_DIR", (tmp_path / "cache").as_posix())
+    return board("http", path=http_stand_in.url, board_factory=GeoBaseBoard)  # pyright: ignore[reportReturnType] https://github.com/rstudio/pins-python/issues/347
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+import shapely
+from pins.meta import Meta
+
+from geopins.drivers.gdf.dispatch import pin_write_gdf
+
+if TYPE_CHECKING:
+    from geopins.boards import GeoBaseBoard
+
+
+def test_round_trip(tmp_geoboard: GeoBaseBoard):
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": [1, 2, 3]},
+        geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+        crs="EPSG:2193",  # NZGD2000 / New Zealand Transverse Mercator 2000
+    )
+
+    # Act
+    meta = tmp_geoboard.pin_write(gdf, name="test-gdf", type="arrow")
+    assert isinstance(meta, Meta)
+    retrieved = tmp_geoboard.pin_read("test-gdf", verify_type=gpd.GeoDataFrame)
+
+    # Assert
+    assert gdf.equals(retrieved)
+    assert gdf.crs == retrieved.crs
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd"])
+def test_mixed_geometry_types_compressed(tmp_geoboard: GeoBaseBoard, compression: str):
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": [1, 2]},
+        geometry=[shapely.Point(0, 0), shapely.box(0, 0, 1, 1)],
+        crs="EPSG:2193",
+    )
+
+    # Act
+    pin_write_gdf(
+        gdf,
+        name="test-gdf",
+        type="feather",
+        compression=compression,
+        board=tmp_geoboard,
+    )
+    retrieved = tmp_geoboard.pin_read("test-gdf", verify_type=gpd.GeoDataFrame)
+
+    # Assert
+    assert gdf.equals(retrieved)
+
+
+def test_pandas_arrow_pin_unaffected(tmp_geoboard: GeoBaseBoard):
+    # Arrange
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    with pytest.warns(ResourceWarning):
+        # Upstream issue relating to opening files without context managers
+        tmp_geoboard.pin_write(df, "test-df", type="arrow")
+
+    # Act
+    retrieved = tmp_geoboard.pin_read("test-df")
+
+    # Assert
+    assert not isinstance(retrieved, gpd.GeoDataFrame)
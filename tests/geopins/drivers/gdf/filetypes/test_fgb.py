@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import pytest
+from pins.meta import Meta
+
+from geopins.drivers.gdf.dispatch import pin_iter_gdf, pin_read_gdf
+
+if TYPE_CHECKING:
+    from geopins.boards import GeoBaseBoard
+
+
+@pytest.fixture
+def gdf() -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame(
+        {"id": [1, 2, 3]},
+        geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+        crs="EPSG:2193",  # NZGD2000 / New Zealand Transverse Mercator 2000
+    )
+
+
+def test_round_trip(tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+    # Act
+    meta = tmp_geoboard.pin_write(gdf, name="test-gdf", type="fgb")
+    assert isinstance(meta, Meta)
+    retrieved = tmp_geoboard.pin_read("test-gdf", verify_type=gpd.GeoDataFrame)
+
+    # Assert
+    # N.B. FlatGeobuf stores features in spatial index order
+    assert gdf.equals(retrieved.sort_values("id", ignore_index=True))
+
+
+def test_bbox(tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+    # Arrange
+    tmp_geoboard.pin_write(gdf, name="test-gdf", type="fgb")
+
+    # Act
+    retrieved = pin_read_gdf("test-gdf", bbox=(0.5, 0.5, 1.5, 1.5), board=tmp_geoboard)
+
+    # Assert
+    assert retrieved["id"].tolist() == [2]
+
+
+def test_iter(tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+    # Arrange
+    tmp_geoboard.pin_write(gdf, name="test-gdf", type="fgb")
+
+    # Act
+    batches = list(pin_iter_gdf("test-gdf", batch_size=2, board=tmp_geoboard))
+
+    # Assert
+    assert [len(batch) for batch in batches] == [2, 1]
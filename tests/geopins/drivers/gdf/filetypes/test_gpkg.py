@@ -3,11 +3,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import geopandas as gpd
+import pytest
+import shapely
 from pins.meta import Meta
 
 from geopins.boards import GeoBaseBoard
+from geopins.drivers.gdf.dispatch import pin_iter_gdf, pin_read_gdf, pin_write_gdf
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from geopins.boards import GeoBaseBoard
 
 
@@ -27,3 +32,119 @@ def test_round_trip(tmp_geoboard: GeoBaseBoard):
     # Assert
     assert gdf.equals(retrieved)
     assert gdf.crs == retrieved.crs
+
+
+def test_transcode_cache(tmp_geoboard: GeoBaseBoard, tmp_path: Path):
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": [1, 2, 3]},
+        geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+        crs="EPSG:2193",
+    )
+    meta = tmp_geoboard.pin_write(gdf, name="test-gdf", type="gpkg")
+    cache_dir = tmp_path / "transcode"
+    tmp_geoboard.enable_transcode_cache(path=cache_dir)
+
+    # Act
+    first = tmp_geoboard.pin_read("test-gdf", verify_type=gpd.GeoDataFrame)
+    second = tmp_geoboard.pin_read("test-gdf", verify_type=gpd.GeoDataFrame)
+
+    # Assert
+    assert (cache_dir / f"{meta.pin_hash}.arrow").exists()
+    assert gdf.equals(first)
+    assert gdf.equals(second)
+    assert gdf.crs == second.crs
+
+
+def test_reproject(tmp_geoboard: GeoBaseBoard, tmp_path: Path):
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": [1, 2, 3]},
+        geometry=gpd.points_from_xy([1.7e6, 1.8e6, 1.9e6], [5.9e6, 5.8e6, 5.7e6]),
+        crs="EPSG:2193",
+    )
+    tmp_geoboard.pin_write(gdf, name="test-gdf", type="gpkg")
+    cache_dir = tmp_path / "transcode"
+    tmp_geoboard.enable_transcode_cache(path=cache_dir)
+
+    # Act
+    first = pin_read_gdf("test-gdf", crs="EPSG:4326", board=tmp_geoboard)
+    second = pin_read_gdf("test-gdf", crs="EPSG:4326", board=tmp_geoboard)
+
+    # Assert
+    expected = gdf.to_crs("EPSG:4326")
+    # The transcoded GeoPackage, and its reprojected variant
+    assert len(list(cache_dir.iterdir())) == 2
+    assert expected.geom_equals_exact(first.geometry, tolerance=1e-9).all()
+    assert expected.geom_equals_exact(second.geometry, tolerance=1e-9).all()
+    assert second.crs == expected.crs
+
+
+def test_lod_variants(tmp_geoboard: GeoBaseBoard):
+    # Arrange
+    circle = shapely.Point(1.8e6, 5.8e6).buffer(1000, quad_segs=64)
+    gdf = gpd.GeoDataFrame({"id": [1]}, geometry=[circle], crs="EPSG:2193")
+    pin_write_gdf(gdf, name="test-gdf", lod_tolerances=[1, 100], board=tmp_geoboard)
+
+    # Act
+    full = pin_read_gdf("test-gdf", board=tmp_geoboard)
+    fine = pin_read_gdf("test-gdf", max_tolerance=50, board=tmp_geoboard)
+    coarse = pin_read_gdf("test-gdf", max_tolerance=100, board=tmp_geoboard)
+    finest = pin_read_gdf("test-gdf", max_tolerance=0.1, board=tmp_geoboard)
+
+    # Assert
+    n_vertices = [
+        shapely.get_num_coordinates(x.geometry.to_numpy()).item()
+        for x in (full, fine, coarse, finest)
+    ]
+    assert n_vertices[0] == shapely.get_num_coordinates(circle)
+    assert n_vertices[0] > n_vertices[1] > n_vertices[2]
+    assert n_vertices[3] == n_vertices[0]
+    assert coarse["id"].tolist() == [1]
+    assert circle.hausdorff_distance(coarse.geometry.item()) <= 100
+
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+def test_write_options(tmp_geoboard: GeoBaseBoard, *, use_arrow: bool):
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": [1, 2, 3], "name": ["a", "b", "c"]},
+        geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+        crs="EPSG:2193",
+    )
+
+    # Act
+    pin_write_gdf(
+        gdf,
+        name="test-gdf",
+        type="gpkg",
+        use_arrow=use_arrow,
+        spatial_index=False,
+        board=tmp_geoboard,
+    )
+    retrieved = pin_read_gdf("test-gdf", board=tmp_geoboard)
+
+    # Assert
+    assert gdf.equals(retrieved)
+
+
+def test_iter(tmp_geoboard: GeoBaseBoard):
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": range(10)},
+        geometry=gpd.points_from_xy(range(10), range(10)),
+        crs="EPSG:2193",
+    )
+    tmp_geoboard.pin_write(gdf, name="test-gdf", type="gpkg")
+
+    # Act
+    batches = list(
+        pin_iter_gdf(
+            "test-gdf", bbox=(0.0, 0.0, 5.5, 5.5), batch_size=4, board=tmp_geoboard
+        )
+    )
+
+    # Assert
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert all(batch.crs == gdf.crs for batch in batches)
+    assert [i for batch in batches for i in batch["id"]] == list(range(6))
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
 from pins.meta import Meta
+from pyarrow import parquet as pq
 
 from geopins.boards import GeoBaseBoard
+from geopins.drivers.exceptions import MemoryBudgetError
+from geopins.drivers.gdf.dispatch import (
+    pin_read_dask_gdf,
+    pin_read_gdf,
+    pin_write_gdf,
+)
 
 if TYPE_CHECKING:
     from geopins.boards import GeoBaseBoard
@@ -26,3 +37,159 @@ def test_round_trip(tmp_geoboard: GeoBaseBoard):
 
     # Assert
     assert gdf.equals(retrieved)
+
+
+@pytest.mark.parametrize("sort", ["hilbert", "quadkey"])
+def test_sorted_bbox(tmp_geoboard: GeoBaseBoard, sort: str):
+    # Arrange
+    rng = np.random.default_rng(0)
+    gdf = gpd.GeoDataFrame(
+        {"id": range(100)},
+        geometry=gpd.points_from_xy(rng.uniform(0, 100, 100), rng.uniform(0, 100, 100)),
+        crs="EPSG:2193",
+    )
+    gdf.loc[0, "geometry"] = None
+    bbox = (0.0, 0.0, 30.0, 30.0)
+
+    # Act
+    pin_write_gdf(
+        gdf,
+        name="test-gdf",
+        type="parquet",
+        sort=sort,  # pyright: ignore[reportArgumentType]
+        row_group_size=10,
+        compression="zstd",
+        compression_level=3,
+        board=tmp_geoboard,
+    )
+    retrieved = pin_read_gdf("test-gdf", bbox=bbox, board=tmp_geoboard)
+
+    # Assert
+    expected = gdf.cx[: bbox[2], : bbox[3]]
+    assert sorted(retrieved["id"]) == sorted(expected["id"])
+    (path,) = tmp_geoboard.pin_download("test-gdf")
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 10
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    # The missing geometry is written last
+    assert pd.isna(gpd.read_parquet(path).geometry.iloc[-1])
+
+
+def test_dask_partitions(tmp_geoboard: GeoBaseBoard):
+    pytest.importorskip("dask_geopandas")
+
+    # Arrange
+    gdf = gpd.GeoDataFrame(
+        {"id": range(30)},
+        geometry=gpd.points_from_xy(range(30), range(30)),
+        crs="EPSG:2193",
+    )
+    pin_write_gdf(
+        gdf, name="test-gdf", type="parquet", row_group_size=10, board=tmp_geoboard
+    )
+
+    # Act
+    ddf = pin_read_dask_gdf("test-gdf", board=tmp_geoboard)
+
+    # Assert
+    assert ddf.npartitions == 3
+    assert ddf.spatial_partitions is not None
+    assert ddf.spatial_partitions.total_bounds.tolist() == [0, 0, 29, 29]
+    assert ddf.spatial_partitions.crs == gdf.crs
+    retrieved = ddf.compute()
+    assert list(retrieved.columns) == list(gdf.columns)
+    assert retrieved.reset_index(drop=True).equals(gdf)
+
+
+class TestMemoryBudget:
+    @pytest.fixture
+    def gdf(self) -> gpd.GeoDataFrame:
+        n = 1000
+        return gpd.GeoDataFrame(
+            {"id": np.arange(n), "value": np.linspace(0, 1, n)},
+            geometry=gpd.points_from_xy(np.arange(n), np.arange(n)),
+            crs="EPSG:2193",
+        )
+
+    def test_raise(self, tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+        # Arrange
+        tmp_geoboard.pin_write(gdf, name="test-gdf", type="parquet")
+
+        # Act, Assert
+        with pytest.raises(MemoryBudgetError, match="exceeds `max_memory`"):
+            pin_read_gdf("test-gdf", max_memory=10_000, board=tmp_geoboard)
+
+    def test_bbox_within_budget(
+        self, tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame
+    ):
+        # Arrange
+        tmp_geoboard.pin_write(gdf, name="test-gdf", type="parquet")
+
+        # Act
+        retrieved = pin_read_gdf(
+            "test-gdf",
+            bbox=(0.0, 0.0, 9.5, 9.5),
+            max_memory=10_000,
+            board=tmp_geoboard,
+        )
+
+        # Assert
+        assert retrieved["id"].tolist() == list(range(10))
+
+    def test_iterate(self, tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+        # Arrange
+        tmp_geoboard.pin_write(gdf, name="test-gdf", type="parquet")
+
+        # Act
+        batches = pin_read_gdf(
+            "test-gdf", max_memory=10_000, on_exceed="iterate", board=tmp_geoboard
+        )
+
+        # Assert
+        assert isinstance(batches, Iterator)
+        batches = list(batches)
+        assert len(batches) > 1
+        assert all(batch.crs == gdf.crs for batch in batches)
+        assert pd.concat(batches, ignore_index=True).equals(gdf)
+
+    def test_iterate_bbox(self, tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+        # Arrange
+        tmp_geoboard.pin_write(gdf, name="test-gdf", type="parquet")
+
+        # Act
+        batches = pin_read_gdf(
+            "test-gdf",
+            bbox=(0.0, 0.0, 99.5, 99.5),
+            max_memory=1_000,
+            on_exceed="iterate",
+            board=tmp_geoboard,
+        )
+
+        # Assert
+        assert isinstance(batches, Iterator)
+        retrieved = pd.concat(batches, ignore_index=True)
+        assert retrieved["id"].tolist() == list(range(100))
+
+    def test_iterate_crs(self, tmp_geoboard: GeoBaseBoard, gdf: gpd.GeoDataFrame):
+        # Arrange
+        tmp_geoboard.pin_write(gdf, name="test-gdf", type="parquet")
+
+        # Act
+        batches = pin_read_gdf(
+            "test-gdf",
+            crs="EPSG:4326",
+            max_memory=10_000,
+            on_exceed="iterate",
+            board=tmp_geoboard,
+        )
+
+        # Assert
+        assert isinstance(batches, Iterator)
+        batches = list(batches)
+        assert all(batch.crs == "EPSG:4326" for batch in batches)
+        expected = gdf.to_crs("EPSG:4326")
+        assert (
+            pd.concat(batches, ignore_index=True)
+            .geom_equals_exact(expected.geometry, tolerance=1e-9)
+            .all()
+        )
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+import warnings
 from typing import TYPE_CHECKING
 
+import geopandas as gpd
+import numpy as np
+import pytest
+import rasterio
+from affine import Affine
 from pins.meta import Meta
+from pyproj import CRS
+from rasterio.windows import Window
+from rastr.meta import RasterMeta
 from rastr.raster import Raster
 
 from geopins.boards import GeoBaseBoard
+from geopins.drivers.exceptions import MemoryBudgetError
+from geopins.drivers.raster.blocks import RasterBlocks
+from geopins.drivers.raster.dispatch import (
+    pin_raster_stats,
+    pin_read_raster,
+    pin_read_raster_stack,
+    pin_sample_raster,
+    pin_write_raster,
+)
+from geopins.drivers.raster.stack import RasterStack
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
     from geopins.boards import GeoBaseBoard
 
 
@@ -22,3 +44,426 @@ def test_round_trip(tmp_geoboard: GeoBaseBoard):
 
     # Assert
     assert raster == retrieved
+
+
+class TestMemmap:
+    def test_round_trip(
+        self,
+        tmp_geoboard: GeoBaseBoard,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # Arrange
+        monkeypatch.setenv("PINS_CACHE_DIR", tmp_path.as_posix())
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        first = pin_read_raster("test-raster", mode="memmap", board=tmp_geoboard)
+        second = pin_read_raster("test-raster", mode="memmap", board=tmp_geoboard)
+
+        # Assert
+        assert isinstance(first, Raster)
+        assert isinstance(second, Raster)
+        assert first == raster
+        assert second == raster
+        assert isinstance(second.arr.base, np.memmap)
+        assert not second.arr.flags.writeable
+
+    def test_integer_nodata(
+        self,
+        tmp_geoboard: GeoBaseBoard,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # Arrange
+        monkeypatch.setenv("PINS_CACHE_DIR", tmp_path.as_posix())
+        path = tmp_path / "int.tif"
+        with rasterio.open(
+            path,
+            "w",
+            driver="GTiff",
+            height=2,
+            width=2,
+            count=1,
+            dtype="int16",
+            crs="EPSG:2193",
+            transform=Affine(1, 0, 0, 0, -1, 2),
+            nodata=-9999,
+        ) as dst:
+            dst.write(np.array([[1, 2], [3, -9999]], dtype="int16"), 1)
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+            tmp_geoboard.pin_upload(path.as_posix(), name="test-raster")
+
+        # Act
+        raster = pin_read_raster("test-raster", mode="memmap", board=tmp_geoboard)
+
+        # Assert
+        assert isinstance(raster, Raster)
+        assert raster == Raster.read_file(path)
+
+    def test_reproject(self, tmp_geoboard: GeoBaseBoard, tmp_path: Path):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+        cache_dir = tmp_path / "transcode"
+        tmp_geoboard.enable_transcode_cache(path=cache_dir)
+
+        # Act
+        first = pin_read_raster("test-raster", crs="EPSG:4326", board=tmp_geoboard)
+        second = pin_read_raster("test-raster", crs="EPSG:4326", board=tmp_geoboard)
+
+        # Assert
+        assert isinstance(first, Raster)
+        assert isinstance(second, Raster)
+        assert len(list(cache_dir.iterdir())) == 1
+        assert first.crs.to_epsg() == 4326
+        assert first == second
+        assert second.arr.flags.writeable
+        assert np.isfinite(second.arr).any()
+
+    def test_not_supported_for_zarr(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="zarr")
+
+        # Act, Assert
+        with pytest.raises(NotImplementedError, match="memmap"):
+            pin_read_raster("test-raster", mode="memmap", board=tmp_geoboard)
+
+
+class TestMemoryBudget:
+    # The example raster is 256 x 256 float32 cells, i.e. 256 KiB.
+
+    def test_raise(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        tmp_geoboard.pin_write(Raster.example(), name="test-raster", type="tif")
+
+        # Act, Assert
+        with pytest.raises(MemoryBudgetError, match="exceeds `max_memory`"):
+            pin_read_raster("test-raster", max_memory=100_000, board=tmp_geoboard)
+
+    def test_memmap(
+        self,
+        tmp_geoboard: GeoBaseBoard,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # Arrange
+        monkeypatch.setenv("PINS_CACHE_DIR", tmp_path.as_posix())
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        retrieved = pin_read_raster(
+            "test-raster", max_memory=100_000, on_exceed="memmap", board=tmp_geoboard
+        )
+
+        # Assert
+        assert retrieved == raster
+        assert isinstance(retrieved.arr.base, np.memmap)
+
+    def test_overview(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        retrieved = pin_read_raster(
+            "test-raster",
+            max_memory=100_000,
+            on_exceed="overview",
+            board=tmp_geoboard,
+        )
+
+        # Assert
+        assert isinstance(retrieved, Raster)
+        assert retrieved.arr.nbytes <= 100_000
+        assert retrieved.arr.shape == (128, 128)
+        assert retrieved.transform.a == 2 * raster.transform.a
+        assert retrieved.bounds == raster.bounds
+        # Nearest neighbour takes the cell nearest the centre of each 2 x 2 block
+        np.testing.assert_array_equal(retrieved.arr, raster.arr[1::2, 1::2])
+
+    def test_within_budget(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        retrieved = pin_read_raster(
+            "test-raster", max_memory=1024**2, on_exceed="overview", board=tmp_geoboard
+        )
+
+        # Assert
+        assert retrieved == raster
+
+
+class TestStats:
+    @pytest.fixture
+    def raster(self) -> Raster:
+        arr = np.random.default_rng(0).normal(10, 2, size=(600, 500))
+        arr[:50, :50] = np.nan
+        return Raster(
+            arr=arr,
+            raster_meta=RasterMeta(
+                crs=CRS.from_epsg(2193), transform=Affine(1, 0, 0, 0, -1, 600)
+            ),
+        )
+
+    def test_stored(self, tmp_geoboard: GeoBaseBoard, raster: Raster):
+        # Arrange
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        (stats,) = pin_raster_stats("test-raster", board=tmp_geoboard)
+
+        # Assert
+        assert stats["min"] == pytest.approx(np.nanmin(raster.arr))
+        assert stats["max"] == pytest.approx(np.nanmax(raster.arr))
+        assert stats["mean"] == pytest.approx(np.nanmean(raster.arr))
+        assert stats["std"] == pytest.approx(np.nanstd(raster.arr))
+        assert stats["nodata_count"] == 2500
+        assert sum(stats["histogram"]["counts"]) == raster.arr.size - 2500
+        assert stats["min"] is not None
+        assert stats["max"] is not None
+        assert stats["histogram"]["edges"][0] <= stats["min"]
+        assert stats["histogram"]["edges"][-1] >= stats["max"]
+
+    def test_bounds(self, tmp_geoboard: GeoBaseBoard, raster: Raster):
+        # Arrange
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        (stats,) = pin_raster_stats(
+            "test-raster", bounds=(0, 300, 250, 600), board=tmp_geoboard
+        )
+
+        # Assert
+        window = raster.arr[:300, :250]
+        assert stats["mean"] == pytest.approx(np.nanmean(window))
+        assert stats["std"] == pytest.approx(np.nanstd(window))
+        assert stats["nodata_count"] == 2500
+        assert sum(stats["histogram"]["counts"]) == window.size - 2500
+
+
+class TestSample:
+    @pytest.fixture
+    def raster(self) -> Raster:
+        arr = np.arange(600 * 500, dtype=np.float32).reshape(600, 500)
+        arr[:50, :50] = np.nan
+        return Raster(
+            arr=arr,
+            raster_meta=RasterMeta(
+                crs=CRS.from_epsg(2193), transform=Affine(1, 0, 0, 0, -1, 600)
+            ),
+        )
+
+    def test_points(self, tmp_geoboard: GeoBaseBoard, raster: Raster):
+        # Arrange
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+        rng = np.random.default_rng(0)
+        points = rng.uniform([-10, -10], [510, 610], size=(1000, 2))
+
+        # Act
+        values = pin_sample_raster("test-raster", points, board=tmp_geoboard)
+
+        # Assert
+        rows = np.floor(600 - points[:, 1]).astype(int)
+        cols = np.floor(points[:, 0]).astype(int)
+        inside = (rows >= 0) & (rows < 600) & (cols >= 0) & (cols < 500)
+        assert values.shape == (1000,)
+        assert np.isnan(values[~inside]).all()
+        np.testing.assert_array_equal(
+            values[inside], raster.arr[rows[inside], cols[inside]]
+        )
+
+    def test_geoseries(self, tmp_geoboard: GeoBaseBoard, raster: Raster):
+        # Arrange
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+        points = gpd.GeoSeries(
+            gpd.points_from_xy([100.5, 10.5], [200.5, 590.5]), crs="EPSG:2193"
+        ).to_crs("EPSG:4326")
+
+        # Act
+        values = pin_sample_raster("test-raster", points, board=tmp_geoboard)
+
+        # Assert
+        np.testing.assert_array_equal(values, [raster.arr[399, 100], np.nan])
+
+    def test_stack(self, tmp_geoboard: GeoBaseBoard, raster: Raster):
+        # Arrange
+        stack = RasterStack({"a": raster, "b": raster.apply(lambda arr: arr * 2)})
+        tmp_geoboard.pin_write(stack, name="test-stack", type="tif")
+
+        # Act
+        values = pin_sample_raster("test-stack", [(100.5, 200.5)], board=tmp_geoboard)
+
+        # Assert
+        np.testing.assert_array_equal(
+            values, [[raster.arr[399, 100], 2 * raster.arr[399, 100]]]
+        )
+
+
+class TestRasterStack:
+    def test_round_trip(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        stack = RasterStack(
+            rasters={
+                "2024-01": raster,
+                "2024-02": raster.apply(lambda arr: arr * 2, raw=True),
+                "2024-03": raster.apply(lambda arr: arr * 3, raw=True),
+            }
+        )
+
+        # Act
+        tmp_geoboard.pin_write(stack, name="test-stack", type="tif")
+        retrieved = tmp_geoboard.pin_read("test-stack", verify_type=RasterStack)
+
+        # Assert
+        assert retrieved.labels == stack.labels
+        for label in stack:
+            assert retrieved[label] == stack[label]
+
+    def test_bands(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        stack = RasterStack(
+            rasters={
+                "a": raster,
+                "b": raster.apply(lambda arr: arr * 2, raw=True),
+                "c": raster.apply(lambda arr: arr * 3, raw=True),
+            }
+        )
+        pin_write_raster(stack, name="test-stack", board=tmp_geoboard)
+
+        # Act
+        retrieved = pin_read_raster_stack(
+            "test-stack", bands=["c", "a"], board=tmp_geoboard
+        )
+
+        # Assert
+        assert isinstance(retrieved, RasterStack)
+        assert retrieved.labels == ["c", "a"]
+        assert retrieved["c"] == stack["c"]
+        assert retrieved["a"] == stack["a"]
+
+    def test_not_co_registered(self):
+        # Arrange
+        raster = Raster.example()
+        shifted = Raster(
+            arr=raster.arr,
+            raster_meta=raster.raster_meta.model_copy(
+                update={"transform": raster.transform @ Affine.translation(1, 0)}
+            ),
+        )
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="co-registered"):
+            RasterStack(rasters={"a": raster, "b": shifted})
+
+    def test_read_as_raster(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        pin_write_raster(
+            RasterStack(rasters={"a": raster}), name="test-stack", board=tmp_geoboard
+        )
+
+        # Act / Assert
+        with pytest.raises(TypeError, match="pin_read_raster_stack"):
+            pin_read_raster("test-stack", board=tmp_geoboard)
+
+
+class TestRasterBlocks:
+    def test_round_trip(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        arr = np.random.default_rng(0).normal(size=(300, 250)).astype(np.float32)
+
+        def blocks() -> Iterator[tuple[Window, np.ndarray]]:
+            for row in range(0, 300, 100):
+                for col in range(0, 250, 100):
+                    if (row, col) == (0, 0):
+                        continue  # Left as nodata
+                    window = Window.from_slices(
+                        (row, row + 100), (col, min(col + 100, 250))
+                    )
+                    yield window, arr[window.toslices()]
+
+        x = RasterBlocks(
+            shape=(300, 250),
+            transform=Affine(2, 0, 1000, 0, -2, 5000),
+            crs=CRS.from_epsg(2193),
+            dtype="float32",
+            blocks=blocks(),
+        )
+
+        # Act
+        meta = tmp_geoboard.pin_write(x, name="test-raster")
+        retrieved = pin_read_raster("test-raster", board=tmp_geoboard)
+
+        # Assert
+        expected = arr.copy()
+        expected[:100, :100] = np.nan
+        assert isinstance(retrieved, Raster)
+        np.testing.assert_array_equal(retrieved.arr, expected)
+        assert retrieved.transform == x.transform
+        (stats,) = meta.user["geopins"]["stats"]
+        assert stats["nodata_count"] == 100 * 100
+        assert stats["mean"] == pytest.approx(np.nanmean(expected))
+        assert meta.user["geopins"]["bounds"] == [1000, 4400, 1500, 5000]
+
+    def test_block_outside_raster(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        x = RasterBlocks(
+            shape=(10, 10),
+            transform=Affine(1, 0, 0, 0, -1, 10),
+            crs=CRS.from_epsg(2193),
+            dtype="float32",
+            blocks=[(Window.from_slices((5, 15), (5, 15)), np.zeros((10, 10)))],
+        )
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="outside the raster"):
+            tmp_geoboard.pin_write(x, name="test-raster")
+
+    def test_overlapping_blocks(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        x = RasterBlocks(
+            shape=(10, 10),
+            transform=Affine(1, 0, 0, 0, -1, 10),
+            crs=CRS.from_epsg(2193),
+            dtype="float32",
+            blocks=[
+                (Window.from_slices((0, 6), (0, 6)), np.zeros((6, 6))),
+                (Window.from_slices((5, 10), (5, 10)), np.zeros((5, 5))),
+            ],
+        )
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="overlaps"):
+            tmp_geoboard.pin_write(x, name="test-raster")
+
+    def test_integer_partial_coverage(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        def get_raster_blocks(nodata: float | None) -> RasterBlocks:
+            return RasterBlocks(
+                shape=(10, 10),
+                transform=Affine(1, 0, 0, 0, -1, 10),
+                crs=CRS.from_epsg(2193),
+                dtype="int16",
+                blocks=[(Window.from_slices((0, 5), (0, 10)), np.ones((5, 10)))],
+                nodata=nodata,
+            )
+
+        # Act
+        with pytest.raises(ValueError, match="`nodata` value"):
+            tmp_geoboard.pin_write(get_raster_blocks(None), name="test-raster")
+        meta = tmp_geoboard.pin_write(get_raster_blocks(-1), name="test-raster")
+
+        # Assert
+        (stats,) = meta.user["geopins"]["stats"]
+        assert stats["nodata_count"] == 50
+        assert stats["mean"] == 1
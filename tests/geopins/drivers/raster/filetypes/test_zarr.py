@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pins.meta import Meta
+from rastr.raster import Raster
+
+from geopins.drivers.raster.dispatch import pin_read_raster, pin_write_raster
+
+if TYPE_CHECKING:
+    from geopins.boards import GeoBaseBoard
+
+
+def test_round_trip(tmp_geoboard: GeoBaseBoard):
+    # Arrange
+    raster = Raster.example()
+
+    # Act
+    meta = pin_write_raster(
+        raster, name="test-raster", type="zarr", chunk_size=100, board=tmp_geoboard
+    )
+    assert isinstance(meta, Meta)
+    retrieved = tmp_geoboard.pin_read("test-raster", verify_type=Raster)
+
+    # Assert
+    assert raster == retrieved
+
+
+def test_bounds(tmp_geoboard: GeoBaseBoard):
+    # Arrange
+    raster = Raster.example()  # 2m cells, origin at (0, 0)
+    pin_write_raster(
+        raster, name="test-raster", type="zarr", chunk_size=100, board=tmp_geoboard
+    )
+
+    # Act
+    retrieved = pin_read_raster(
+        "test-raster", bounds=(10.0, 20.0, 250.0, 31.0), board=tmp_geoboard
+    )
+
+    # Assert
+    np.testing.assert_array_equal(retrieved.arr, raster.arr[10:16, 5:125])
+    assert retrieved.transform.c == 10.0
+    assert retrieved.transform.f == 20.0
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING, Any, cast
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+from geopins.boards import GeoBaseBoard
+from geopins.drivers.infer import DriverInfo, infer_driver_info
+
+if TYPE_CHECKING:
+    from pins.boards import IFileSystem
+
+
+class _RecordingMemoryFileSystem(MemoryFileSystem):
+    """An in-memory filesystem which records the number of bytes read."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.bytes_read = 0
+
+    def cat_file(self, path: str, *args: Any, **kwargs: Any) -> bytes:
+        data = super().cat_file(path, *args, **kwargs)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestInferDriverInfo:
+    @pytest.mark.parametrize("type_", ["parquet", "arrow"])
+    def test_remote(self, type_: str):
+        # Arrange
+        fs = _RecordingMemoryFileSystem(skip_instance_cache=True)
+        board = GeoBaseBoard(f"/infer-test-{type_}", fs=cast("IFileSystem", fs))
+        n = 50_000
+        gdf = gpd.GeoDataFrame(
+            {"id": np.arange(n)},
+            geometry=gpd.points_from_xy(np.arange(n), np.arange(n)),
+            crs="EPSG:2193",
+        )
+        board.pin_write(gdf, name="test-gdf", type=type_)
+        meta = board.pin_fetch("test-gdf")
+        fs.bytes_read = 0
+
+        # Act
+        info = infer_driver_info(meta, board=board)
+        bytes_read = fs.bytes_read
+        infer_driver_info(meta, board=board)
+
+        # Assert
+        assert info == DriverInfo(dtype="gdf", filetype=type_)
+        assert 0 < bytes_read <= 64 * 1024 < meta.file_size
+        assert fs.bytes_read == bytes_read  # Cached per pin version
+
+    def test_remote_dataframe(self):
+        # Arrange
+        fs = MemoryFileSystem(skip_instance_cache=True)
+        board = GeoBaseBoard("/infer-test-df", fs=cast("IFileSystem", fs))
+        with warnings.catch_warnings():
+            # Upstream issue relating to opening files without context managers
+            warnings.simplefilter("ignore", category=ResourceWarning)
+            board.pin_write(
+                pd.DataFrame({"id": [1, 2]}), name="test-df", type="parquet"
+            )
+        meta = board.pin_fetch("test-df")
+
+        # Act
+        info = infer_driver_info(meta, board=board)
+
+        # Assert
+        assert info == DriverInfo(dtype=None, filetype="parquet")
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import geopandas as gpd
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+from rastr.raster import Raster
+
+from geopins.batch import PinWriteManyError, _StagingBoard, pin_write_many
+from geopins.boards import GeoBaseBoard
+
+if TYPE_CHECKING:
+    from pins.boards import IFileSystem
+
+
+class _QualifiedNameBoard(GeoBaseBoard):
+    """A board which allows qualified pin names, e.g. "user/pin", like Posit Connect."""
+
+    def validate_pin_name(self, name: str) -> None:
+        pass
+
+
+class TestPinWriteMany:
+    def test_round_trip(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        gdf = gpd.GeoDataFrame(
+            {"id": [1, 2]}, geometry=gpd.points_from_xy([0, 1], [0, 1]), crs=2193
+        )
+        objects = {
+            "depth-1": raster,
+            "depth-2": raster.apply(lambda arr: arr * 2, raw=True),
+            "extent": gdf,
+        }
+
+        # Act
+        metas = pin_write_many(
+            tmp_geoboard, objects, metadata={"event": "test"}, max_workers=2
+        )
+
+        # Assert
+        assert list(metas) == ["depth-1", "depth-2", "extent"]
+        for name, x in objects.items():
+            assert metas[name].user["event"] == "test"
+            retrieved = tmp_geoboard.pin_read(name, version=metas[name].version.version)
+            if isinstance(x, Raster):
+                assert retrieved == x
+            else:
+                assert x.equals(retrieved)
+        # The summary metadata recorded by the writers is kept.
+        assert "bounds" in metas["extent"].user["geopins"]
+
+    def test_unsupported_type(self, tmp_geoboard: GeoBaseBoard):
+        # Act
+        with pytest.raises(PinWriteManyError) as exc_info:
+            pin_write_many(tmp_geoboard, {"test": "not geospatial"}, max_workers=1)  # pyright: ignore[reportArgumentType]
+
+        # Assert
+        assert isinstance(exc_info.value.__cause__, TypeError)
+        assert "Expected a GeoDataFrame" in str(exc_info.value.__cause__)
+
+    def test_partial_failure(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        objects = {"depth": raster, "extent": "not geospatial"}
+
+        # Act
+        with pytest.raises(PinWriteManyError, match="'extent'") as exc_info:
+            pin_write_many(tmp_geoboard, objects, max_workers=1)  # pyright: ignore[reportArgumentType]
+
+        # Assert
+        assert list(exc_info.value.metas) == ["depth"]
+        assert list(exc_info.value.errors) == ["extent"]
+        assert tmp_geoboard.pin_read("depth") == raster
+
+    def test_qualified_name(self, tmp_path: Path):
+        # Arrange
+        board = _QualifiedNameBoard(
+            tmp_path.as_posix(), fs=cast("IFileSystem", LocalFileSystem())
+        )
+        raster = Raster.example()
+
+        # Act
+        metas = pin_write_many(board, {"user/depth": raster}, max_workers=1)
+
+        # Assert
+        assert metas["user/depth"].file == "depth.tif"
+        assert board.pin_read("user/depth") == raster
+
+
+class TestStagingBoard:
+    def test_qualified_name(self, tmp_path: Path):
+        # Arrange
+        board = _StagingBoard(tmp_path)
+        path = tmp_path / "data.gpkg"
+        path.write_bytes(b"data")
+
+        # Act
+        board.pin_upload(path.as_posix(), name="user/pin")
+
+        # Assert
+        assert board.staged is not None
+        (staged,) = board.staged.paths
+        assert Path(staged).read_bytes() == b"data"
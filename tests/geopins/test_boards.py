@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
 from rastr.raster import Raster
 
+from geopins.cache import file_lock
+from geopins.drivers.exceptions import MemoryBudgetError
+from geopins.fs import get_target_fs
+
 if TYPE_CHECKING:
-    from geopins import GeoBaseBoard
+    from pathlib import Path
+
+    from http_stand_in import HTTPStandIn
+
+    from geopins.boards import GeoBaseBoard
 
 
 class TestGeoBaseBoard:
@@ -45,3 +57,178 @@ class TestGeoBaseBoard:
         # Assert
         with pytest.raises(TypeError):
             tmp_geoboard.pin_read("test", verify_type=str)  # wrong type
+
+    def test_pin_read_hash(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        meta = tmp_geoboard.pin_write(raster, "test")
+
+        # Act
+        out_raster = tmp_geoboard.pin_read("test", hash=meta.pin_hash)
+
+        # Assert
+        assert out_raster == raster
+
+
+class TestObjectCache:
+    def test_raster_read_only_view(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, "test")
+        tmp_geoboard.enable_object_cache()
+
+        # Act
+        first = tmp_geoboard.pin_read("test", verify_type=Raster)
+        second = tmp_geoboard.pin_read("test", verify_type=Raster)
+
+        # Assert
+        assert first == raster
+        assert second == raster
+        assert np.shares_memory(first.arr, second.arr)
+        assert not second.arr.flags.writeable
+
+    def test_gdf_copy_on_return(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        gdf = gpd.GeoDataFrame(
+            {"id": [1, 2, 3]},
+            geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+            crs="EPSG:4326",
+        )
+        tmp_geoboard.pin_write(gdf, "test", type="parquet")
+        tmp_geoboard.enable_object_cache()
+
+        # Act
+        first = tmp_geoboard.pin_read("test", verify_type=gpd.GeoDataFrame)
+        first["id"] = 0
+        second = tmp_geoboard.pin_read("test", verify_type=gpd.GeoDataFrame)
+
+        # Assert
+        pd.testing.assert_frame_equal(second, gdf)
+
+    def test_new_version_not_cached(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.enable_object_cache()
+        tmp_geoboard.pin_write(raster, "test")
+        tmp_geoboard.pin_read("test")
+
+        # Act
+        new_raster = raster * 2
+        meta = tmp_geoboard.pin_write(new_raster, "test")
+        retrieved = tmp_geoboard.pin_read(
+            "test", version=meta.version.version, verify_type=Raster
+        )
+
+        # Assert
+        assert retrieved == new_raster
+
+
+class TestDownloadLocks:
+    def test_waits_for_other_download(self, tmp_geoboard: GeoBaseBoard, tmp_path: Path):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, "test")
+        lock_dir = tmp_path / "locks"
+        tmp_geoboard.enable_download_locks(path=lock_dir, timeout=0.1)
+        tmp_geoboard.pin_download("test")
+        (lock_path,) = lock_dir.iterdir()
+
+        # Act
+        with file_lock(lock_path), pytest.raises(TimeoutError):
+            # Simulate another process holding the lock while downloading
+            tmp_geoboard.pin_download("test")
+
+        # Assert
+        assert tmp_geoboard.pin_read("test", verify_type=Raster) == raster
+
+    def test_single_flight_across_processes(
+        self,
+        http_geoboard: GeoBaseBoard,
+        http_local_geoboard: GeoBaseBoard,
+        http_stand_in: HTTPStandIn,
+        tmp_path: Path,
+    ):
+        # Arrange
+        raster = Raster.example()
+        metas = {
+            name: http_local_geoboard.pin_write(raster, name)
+            for name in ["test", "baseline"]
+        }
+        file_paths = {
+            name: f"/{name}/{meta.version.version}/{meta.file}"
+            for name, meta in metas.items()
+        }
+        # N.B. fsspec may request a file more than once while downloading it
+        http_geoboard.pin_download("baseline")
+        http_geoboard.enable_download_locks(path=tmp_path / "locks")
+        http_stand_in.delay = 0.5
+        n_processes = 4
+
+        # Act
+        with ProcessPoolExecutor(
+            max_workers=n_processes, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            paths = list(
+                executor.map(http_geoboard.pin_download, ["test"] * n_processes)
+            )
+
+        # Assert
+        assert len(set(map(tuple, paths))) == 1
+        assert (
+            http_stand_in.file_requests[file_paths["test"]]
+            == http_stand_in.file_requests[file_paths["baseline"]]
+        )
+
+
+class TestMemoryBudget:
+    def test_pin_read(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, "test")
+        tmp_geoboard.enable_memory_budget(max_memory=100_000)
+
+        # Act, Assert
+        with pytest.raises(MemoryBudgetError):
+            tmp_geoboard.pin_read("test")
+        tmp_geoboard.disable_memory_budget()
+        assert tmp_geoboard.pin_read("test", verify_type=Raster) == raster
+
+
+class TestConnectionPool:
+    def test_reuses_connections(
+        self,
+        http_geoboard: GeoBaseBoard,
+        http_local_geoboard: GeoBaseBoard,
+        http_stand_in: HTTPStandIn,
+    ):
+        # Arrange
+        for i in range(8):
+            gdf = gpd.GeoDataFrame(
+                {"id": [i]}, geometry=gpd.points_from_xy([i], [i]), crs="EPSG:2193"
+            )
+            http_local_geoboard.pin_write(gdf, name=f"test-{i}", type="parquet")
+        http_geoboard.enable_connection_pool(max_connections=1)
+
+        # Act
+        http_geoboard.prefetch([f"test-{i}" for i in range(8)], max_workers=8)
+        gdfs = [http_geoboard.pin_read(f"test-{i}") for i in range(8)]
+
+        # Assert
+        assert [gdf["id"].item() for gdf in gdfs] == list(range(8))
+        assert http_stand_in.peak_requests == 1
+        assert http_stand_in.connections < http_stand_in.requests
+
+    def test_disable(self, http_geoboard: GeoBaseBoard):
+        # Arrange
+        fs = get_target_fs(http_geoboard)
+        http_geoboard.enable_connection_pool()
+
+        # Act
+        http_geoboard.disable_connection_pool()
+
+        # Assert
+        assert get_target_fs(http_geoboard) is fs
+
+    def test_local_not_supported(self, tmp_geoboard: GeoBaseBoard):
+        with pytest.raises(NotImplementedError, match="not supported for 'file'"):
+            tmp_geoboard.enable_connection_pool()
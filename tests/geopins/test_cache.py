@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from geopins.cache import FileCache, ObjectCache, file_lock
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestObjectCache:
+    def test_get_missing(self):
+        # Arrange
+        cache = ObjectCache(max_bytes=100)
+
+        # Act / Assert
+        assert cache.get("a") is None
+
+    def test_lru_eviction(self):
+        # Arrange
+        cache = ObjectCache(max_bytes=100)
+        cache.put("a", 1, nbytes=40)
+        cache.put("b", 2, nbytes=40)
+
+        # Act
+        cache.get("a")  # Now "b" is the least recently used
+        cache.put("c", 3, nbytes=40)
+
+        # Assert
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.nbytes == 80
+
+    def test_too_large(self):
+        # Arrange
+        cache = ObjectCache(max_bytes=100)
+
+        # Act
+        cache.put("a", 1, nbytes=101)
+
+        # Assert
+        assert len(cache) == 0
+
+
+class TestFileCache:
+    def test_lru_eviction(self, tmp_path: Path):
+        # Arrange
+        cache = FileCache(tmp_path, max_bytes=100)
+        cache.put("a", lambda path: path.write_bytes(b"a" * 40))
+        cache.put("b", lambda path: path.write_bytes(b"b" * 40))
+        os.utime(tmp_path / "a", (0, 0))
+        os.utime(tmp_path / "b", (1, 1))
+
+        # Act
+        cache.get("a")  # Now "b" is the least recently used
+        cache.put("c", lambda path: path.write_bytes(b"c" * 40))
+
+        # Assert
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") == tmp_path / "c"
+
+    def test_failed_write(self, tmp_path: Path):
+        # Arrange
+        cache = FileCache(tmp_path, max_bytes=100)
+
+        def write(path: Path) -> None:
+            path.write_bytes(b"partial")
+            msg = "Disk full"
+            raise OSError(msg)
+
+        # Act
+        with pytest.raises(OSError, match="Disk full"):
+            cache.put("a", write)
+
+        # Assert
+        assert cache.get("a") is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFileLock:
+    def test_timeout(self, tmp_path: Path):
+        # Arrange
+        lock_path = tmp_path / "test.lock"
+        errors = []
+
+        def acquire() -> None:
+            try:
+                with file_lock(lock_path, timeout=0.1):
+                    pass
+            except TimeoutError as err:
+                errors.append(err)
+
+        # Act
+        with file_lock(lock_path):
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            thread.join()
+
+        # Assert
+        assert len(errors) == 1
+
+    def test_released(self, tmp_path: Path):
+        # Arrange
+        lock_path = tmp_path / "test.lock"
+        with file_lock(lock_path):
+            pass
+
+        # Act / Assert
+        with file_lock(lock_path, timeout=0.1):
+            pass
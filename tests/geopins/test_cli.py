@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+
+from geopins.cli import main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from geopins.boards import GeoBaseBoard
+
+
+class TestPrefetch:
+    def test_prefetch(
+        self,
+        tmp_geoboard: GeoBaseBoard,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        gdf = gpd.GeoDataFrame(
+            {"id": [1, 2]},
+            geometry=gpd.points_from_xy([0, 10], [0, 10]),
+            crs="EPSG:2193",
+        )
+        tmp_geoboard.pin_write(gdf, name="test-gdf", type="gpkg")
+
+        # Act
+        exit_code = main(["prefetch", tmp_path.as_posix(), "test-gdf"])
+
+        # Assert
+        assert exit_code == 0
+        assert "Prefetched 1 pins" in capsys.readouterr().out
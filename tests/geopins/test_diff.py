@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from rastr.raster import Raster
+
+from geopins.diff import pin_diff
+
+if TYPE_CHECKING:
+    from geopins.boards import GeoBaseBoard
+
+
+class TestPinDiff:
+    @pytest.mark.parametrize("type_", ["gpkg", "parquet", "fgb", "arrow"])
+    def test_gdf(self, tmp_geoboard: GeoBaseBoard, type_: str):
+        # Arrange
+        gdf = gpd.GeoDataFrame(
+            {"id": [1, 2, 3]},
+            geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+            crs="EPSG:2193",
+        )
+        # Reordered, with one feature moved and one added
+        changed = gpd.GeoDataFrame(
+            {"id": [3, 2, 1, 4]},
+            geometry=gpd.points_from_xy([2, 1, 5, 3], [2, 1, 5, 3]),
+            crs="EPSG:2193",
+        )
+        meta_a = tmp_geoboard.pin_write(gdf, name="test-gdf", type=type_)
+        meta_b = tmp_geoboard.pin_write(changed, name="test-gdf", type=type_)
+
+        # Act
+        diff = pin_diff(
+            tmp_geoboard,
+            "test-gdf",
+            meta_a.version.version,
+            meta_b.version.version,
+            detailed=True,
+        )
+
+        # Assert
+        assert not diff.identical
+        assert diff.changes["n_rows"] == (3, 4)
+        assert diff.changes["bounds"] == ([0, 0, 2, 2], [1, 1, 5, 5])
+        assert "crs" not in diff.changes
+        assert diff.rows_added == 2
+        assert diff.rows_removed == 1
+
+    @pytest.mark.parametrize("type_", ["parquet", "arrow"])
+    def test_gdf_nested_columns(self, tmp_geoboard: GeoBaseBoard, type_: str):
+        # Arrange
+        gdf = gpd.GeoDataFrame(
+            {"tags": [["a"], ["b", "c"]], "props": [{"x": 1}, {"x": 2}]},
+            geometry=gpd.points_from_xy([0, 1], [0, 1]),
+            crs="EPSG:2193",
+        )
+        changed = gdf.copy()
+        changed["tags"] = [["a"], ["b", "d"]]
+        changed["props"] = [{"x": 3}, {"x": 2}]
+        meta_a = tmp_geoboard.pin_write(gdf, name="test-gdf", type=type_)
+        meta_b = tmp_geoboard.pin_write(changed, name="test-gdf", type=type_)
+
+        # Act
+        diff = pin_diff(
+            tmp_geoboard,
+            "test-gdf",
+            meta_a.version.version,
+            meta_b.version.version,
+            detailed=True,
+        )
+
+        # Assert
+        assert diff.rows_added == 2
+        assert diff.rows_removed == 2
+
+    def test_raster(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        arr = raster.arr.copy()
+        arr[0, :100] = np.nan  # within the first block
+        changed = raster.apply(lambda _: arr, raw=True)
+        meta_a = tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+        meta_b = tmp_geoboard.pin_write(changed, name="test-raster", type="tif")
+
+        # Act
+        summary = tmp_geoboard.pin_diff(
+            "test-raster", meta_a.version.version, meta_b.version.version
+        )
+        detailed = tmp_geoboard.pin_diff(
+            "test-raster",
+            meta_a.version.version,
+            meta_b.version.version,
+            detailed=True,
+        )
+
+        # Assert
+        assert "stats" in summary.changes
+        assert "shape" not in summary.changes
+        assert summary.cells_changed is None
+        assert detailed.blocks_changed == 1
+        assert detailed.cells_changed == 100
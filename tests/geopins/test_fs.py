@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import geopandas as gpd
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from pins.errors import PinsError
+
+from geopins.boards import GeoBaseBoard
+from geopins.fs import (
+    get_gdal_pin_file_path,
+    get_pin_file_path,
+    get_target_fs,
+    pin_download_verified,
+)
+
+if TYPE_CHECKING:
+    from pins.boards import BaseBoard, IFileSystem
+
+
+def _write_example(board: BaseBoard) -> None:
+    gdf = gpd.GeoDataFrame(
+        {"id": [1]}, geometry=gpd.points_from_xy([0], [0]), crs="EPSG:2193"
+    )
+    board.pin_write(gdf, name="test-gdf", type="fgb")
+
+
+def _get_memory_board(tmp_path: Path) -> GeoBaseBoard:
+    # N.B. memory filesystems are global, so each test uses its own board path.
+    return GeoBaseBoard(f"/{tmp_path.name}", fs=cast("IFileSystem", MemoryFileSystem()))
+
+
+class TestGetGdalPinFilePath:
+    def test_local(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        _write_example(tmp_geoboard)
+        meta = tmp_geoboard.pin_fetch("test-gdf")
+        assert isinstance(meta.file, str)
+
+        # Act
+        path = get_gdal_pin_file_path(meta.file, meta=meta, board=tmp_geoboard)
+
+        # Assert
+        assert path == get_pin_file_path(meta.file, meta=meta, board=tmp_geoboard)
+
+    def test_no_gdal_equivalent(self, tmp_path: Path):
+        # Arrange
+        board = _get_memory_board(tmp_path)
+        _write_example(board)
+        meta = board.pin_fetch("test-gdf")
+        assert isinstance(meta.file, str)
+
+        # Act
+        path = get_gdal_pin_file_path(meta.file, meta=meta, board=board)
+
+        # Assert
+        assert path is None
+
+
+class TestPinDownloadVerified:
+    def test_local(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        _write_example(tmp_geoboard)
+        meta = tmp_geoboard.pin_fetch("test-gdf")
+        assert isinstance(meta.file, str)
+
+        # Act
+        (path,) = pin_download_verified(meta, hash=meta.pin_hash, board=tmp_geoboard)
+
+        # Assert
+        assert path.endswith(meta.file)
+
+    def test_wrong_hash(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        _write_example(tmp_geoboard)
+        meta = tmp_geoboard.pin_fetch("test-gdf")
+
+        # Act, Assert
+        with pytest.raises(PinsError, match="does not match the hash"):
+            pin_download_verified(meta, hash="0123456789abcdef", board=tmp_geoboard)
+
+    def test_remote(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setenv("PINS_CACHE_DIR", tmp_path.as_posix())
+        board = _get_memory_board(tmp_path)
+        _write_example(board)
+        meta = board.pin_fetch("test-gdf")
+        assert isinstance(meta.file, str)
+
+        # Act
+        (path,) = pin_download_verified(meta, hash=meta.pin_hash, board=board)
+
+        # Assert
+        assert path.startswith(tmp_path.as_posix())
+        fs_path = get_pin_file_path(meta.file, meta=meta, board=board)
+        assert get_target_fs(board).cat_file(fs_path) == Path(path).read_bytes()
+
+    def test_corrupted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setenv("PINS_CACHE_DIR", tmp_path.as_posix())
+        board = _get_memory_board(tmp_path)
+        _write_example(board)
+        meta = board.pin_fetch("test-gdf")
+        assert isinstance(meta.file, str)
+        fs_path = get_pin_file_path(meta.file, meta=meta, board=board)
+        get_target_fs(board).pipe_file(fs_path, b"corrupted")
+
+        # Act, Assert
+        with pytest.raises(PinsError, match="do not match its hash"):
+            pin_download_verified(meta, hash=meta.pin_hash, board=board)
+        assert not list(tmp_path.rglob("*.fgb"))
+
+    def test_bounded(self, tmp_path: Path):
+        # Arrange
+        board = _get_memory_board(tmp_path)
+        board.enable_transcode_cache(max_bytes=1, path=tmp_path)
+        _write_example(board)
+        meta = board.pin_fetch("test-gdf")
+        (old_path,) = pin_download_verified(meta, hash=meta.pin_hash, board=board)
+        gdf = gpd.GeoDataFrame(geometry=gpd.points_from_xy([1], [1]), crs="EPSG:2193")
+        board.pin_write(gdf, name="test-gdf-2", type="fgb")
+        meta = board.pin_fetch("test-gdf-2")
+
+        # Act
+        (path,) = pin_download_verified(meta, hash=meta.pin_hash, board=board)
+
+        # Assert
+        assert Path(path).parent == tmp_path
+        assert not Path(old_path).exists()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+
+from geopins.prefetch import prefetch
+
+if TYPE_CHECKING:
+    from geopins.boards import GeoBaseBoard
+
+
+def _write_pins(board: GeoBaseBoard) -> None:
+    for name, x in [("flood-a", 0), ("flood-b", 1000), ("roads", 0)]:
+        gdf = gpd.GeoDataFrame(
+            {"id": [1, 2]},
+            geometry=gpd.points_from_xy([x, x + 10], [0, 10]),
+            crs="EPSG:2193",
+        )
+        board.pin_write(gdf, name=name, type="gpkg")
+
+
+class TestPrefetch:
+    def test_all(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        _write_pins(tmp_geoboard)
+
+        # Act
+        report = prefetch(tmp_geoboard, max_workers=2)
+
+        # Assert
+        assert sorted(report.names) == ["flood-a", "flood-b", "roads"]
+        assert report.nbytes == 0  # Local boards have nothing to download
+        assert "Prefetched 3 pins" in str(report)
+
+    def test_pattern_and_bbox(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        _write_pins(tmp_geoboard)
+
+        # Act
+        report = tmp_geoboard.prefetch(pattern="flood-*", bbox=(-5, -5, 5, 5))
+
+        # Assert
+        assert report.names == ["flood-a"]
+
+    def test_cached(
+        self, http_local_geoboard: GeoBaseBoard, http_geoboard: GeoBaseBoard
+    ):
+        # Arrange
+        _write_pins(http_local_geoboard)
+
+        # Act
+        first = prefetch(http_geoboard, ["flood-a", "roads"])
+        second = prefetch(http_geoboard, ["flood-a", "roads"])
+
+        # Assert
+        assert first.nbytes > 0
+        assert second.names == ["flood-a", "roads"]
+        assert second.nbytes == 0
+
+    def test_failed(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        _write_pins(tmp_geoboard)
+
+        # Act
+        report = prefetch(
+            tmp_geoboard, ["flood-a", "roads"], versions={"roads": "missing"}
+        )
+
+        # Assert
+        assert report.names == ["flood-a"]
+        assert list(report.failed) == ["roads"]
+        assert "1 failed (roads)" in str(report)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from rastr.raster import Raster
+
+from geopins.shared import SharedPin, share_object
+
+if TYPE_CHECKING:
+    from geopins.boards import GeoBaseBoard
+
+
+def _send(handle: SharedPin) -> SharedPin:
+    # As when passing the handle to a worker process.
+    return pickle.loads(pickle.dumps(handle))  # noqa: S301
+
+
+class TestShareObject:
+    def test_raster(self):
+        # Arrange
+        raster = Raster.example()
+
+        # Act
+        with share_object(raster) as handle:
+            shared = _send(handle).get()
+
+            # Assert
+            assert shared == raster
+            assert not shared.arr.flags.writeable
+
+    def test_gdf(self):
+        # Arrange
+        gdf = gpd.GeoDataFrame(
+            {"id": [1, 2]},
+            geometry=gpd.points_from_xy([0, 1], [0, 1]),
+            crs="EPSG:2193",
+        )
+
+        # Act
+        with share_object(gdf) as handle:
+            shared = _send(handle).get()
+
+        # Assert
+        assert isinstance(shared, gpd.GeoDataFrame)
+        assert shared.crs == gdf.crs
+        assert shared.equals(gdf)
+
+    def test_unlink_copy(self):
+        # Arrange
+        with share_object(Raster.example()) as handle:
+            copy = _send(handle)
+
+            # Act, Assert
+            with pytest.raises(RuntimeError, match="Only the process"):
+                copy.unlink()
+
+    def test_unsupported(self):
+        with pytest.raises(TypeError, match="Expected a GeoDataFrame or Raster"):
+            share_object(np.zeros(3))  # pyright: ignore[reportArgumentType]
+
+
+class TestPinShare:
+    def test_workers(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.pin_write(raster, name="test-raster", type="tif")
+
+        # Act
+        with (
+            tmp_geoboard.pin_share("test-raster") as handle,
+            ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn")
+            ) as executor,
+        ):
+            # N.B. spawned workers can't import functions from the test modules.
+            results = list(executor.map(SharedPin.get, [handle, handle]))
+
+        # Assert
+        assert results == [raster, raster]
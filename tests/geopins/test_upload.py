@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pins
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from rastr.raster import Raster
+
+from geopins.boards import GeoBaseBoard
+from geopins.fs import set_target_fs
+from geopins.upload import put_file_multipart
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _MergingMemoryFileSystem(MemoryFileSystem):
+    """An in-memory filesystem which can merge files, like s3fs and gcsfs."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.merged: list[str] = []
+
+    def merge(self, path: str, paths: list[str]) -> None:
+        self.pipe_file(path, b"".join(self.cat_file(part) for part in paths))
+        self.merged.append(path)
+
+
+class _ComposingMemoryFileSystem(_MergingMemoryFileSystem):
+    """An in-memory filesystem which merges at most 32 files at once, like gcsfs."""
+
+    protocol = ("gs", "gcs")
+
+    def merge(self, path: str, paths: list[str]) -> None:
+        if len(paths) > 32:
+            msg = "The number of source components provided exceeds the maximum."
+            raise OSError(msg)
+        super().merge(path, paths)
+
+
+class _FlakyMemoryFileSystem(_MergingMemoryFileSystem):
+    """An in-memory filesystem where the first upload of each path fails."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.failed: set[str] = set()
+
+    def pipe_file(
+        self, path: str, value: bytes, mode: str = "overwrite", **kwargs: Any
+    ) -> None:
+        if ".parts/" in path and path not in self.failed:
+            self.failed.add(path)
+            msg = "Connection reset"
+            raise ConnectionResetError(msg)
+        super().pipe_file(path, value, mode=mode, **kwargs)
+
+
+class TestPutFileMultipart:
+    def test_retries(self, tmp_path: Path):
+        # Arrange
+        lpath = tmp_path / "data.bin"
+        lpath.write_bytes(bytes(range(256)) * 10)
+        fs = _FlakyMemoryFileSystem(skip_instance_cache=True)
+
+        # Act
+        put_file_multipart(fs, lpath, "/upload-test/data.bin", part_size=1000)
+
+        # Assert
+        assert fs.cat_file("/upload-test/data.bin") == lpath.read_bytes()
+        assert len(fs.failed) == 3  # One failure per part
+        assert not fs.exists("/upload-test/data.bin.parts")
+
+    def test_merge_limit(self, tmp_path: Path):
+        # Arrange
+        lpath = tmp_path / "data.bin"
+        lpath.write_bytes(bytes(range(256)) * 40)
+        fs = _ComposingMemoryFileSystem(skip_instance_cache=True)
+
+        # Act
+        put_file_multipart(fs, lpath, "/upload-test-compose/data.bin", part_size=100)
+
+        # Assert
+        assert fs.cat_file("/upload-test-compose/data.bin") == lpath.read_bytes()
+        assert len(fs.merged) == 5  # 103 parts, merged into 4 intermediate parts
+        assert not fs.exists("/upload-test-compose/data.bin.parts")
+
+    def test_failure(self, tmp_path: Path):
+        # Arrange
+        lpath = tmp_path / "data.bin"
+        lpath.write_bytes(bytes(range(256)) * 10)
+        fs = _FlakyMemoryFileSystem(skip_instance_cache=True)
+
+        # Act
+        with pytest.raises(ConnectionResetError):
+            put_file_multipart(
+                fs,
+                lpath,
+                "/upload-test-failure/data.bin",
+                part_size=1000,
+                max_attempts=1,
+            )
+
+        # Assert
+        assert not fs.exists("/upload-test-failure/data.bin")
+        assert not fs.exists("/upload-test-failure/data.bin.parts")
+
+    def test_no_merge(self, tmp_path: Path):
+        # Arrange
+        lpath = tmp_path / "data.bin"
+        lpath.write_bytes(bytes(range(256)) * 10)
+        fs = MemoryFileSystem(skip_instance_cache=True)
+
+        # Act
+        put_file_multipart(fs, lpath, "/upload-test-no-merge/data.bin", part_size=1000)
+
+        # Assert
+        assert fs.cat_file("/upload-test-no-merge/data.bin") == lpath.read_bytes()
+        assert fs.ls("/upload-test-no-merge", detail=False) == [
+            "/upload-test-no-merge/data.bin"
+        ]
+
+
+class TestPinUploadMultipart:
+    def test_round_trip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setenv("PINS_CACHE_DIR", tmp_path.as_posix())
+        board: GeoBaseBoard = pins.board(  # pyright: ignore[reportAssignmentType] https://github.com/rstudio/pins-python/issues/347
+            "memory", "/multipart-test", board_factory=GeoBaseBoard
+        )
+        fs = _MergingMemoryFileSystem(skip_instance_cache=True)
+        set_target_fs(board, fs)
+        raster = Raster.example()
+        board.enable_multipart_uploads(part_size=10_000, max_workers=4)
+
+        # Act
+        meta = board.pin_write(raster, "test", type="tif")
+        retrieved = board.pin_read("test", verify_type=Raster)
+
+        # Assert
+        assert retrieved == raster
+        assert fs.merged == [f"/multipart-test/test/{meta.version.version}/{meta.file}"]
+
+    def test_round_trip_without_merge(self, tmp_geoboard: GeoBaseBoard):
+        # Arrange
+        raster = Raster.example()
+        tmp_geoboard.enable_multipart_uploads(part_size=10_000, max_workers=4)
+
+        # Act
+        tmp_geoboard.pin_write(raster, "test", type="tif")
+        retrieved = tmp_geoboard.pin_read("test", verify_type=Raster)
+
+        # Assert
+        assert retrieved == raster
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import io
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import SimpleHTTPRequestHandler
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AnyStr, BinaryIO
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath, SupportsRead, SupportsWrite
+
+
+@dataclass
+class HTTPStandIn:
+    """A local HTTP server standing in for remote board storage, e.g. a CDN or S3.
+
+    Attributes:
+        url: The base URL of the server.
+        directory: The local directory served.
+        connections: The number of connections accepted so far.
+        requests: The number of requests received so far.
+        peak_requests: The largest number of requests handled at once, counted until
+                       each response's headers are sent.
+        file_requests: The number of GET requests for each file, by URL path.
+        delay: A delay before each file is served, in seconds, to simulate a slow
+               connection.
+    """
+
+    url: str
+    directory: Path
+    connections: int = 0
+    requests: int = 0
+    peak_requests: int = 0
+    file_requests: Counter[str] = field(default_factory=Counter)
+    delay: float = 0.0
+    _active_requests: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def _connect(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def _start_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._active_requests += 1
+            self.peak_requests = max(self.peak_requests, self._active_requests)
+
+    def _request_file(self, path: str) -> None:
+        with self._lock:
+            self.file_requests[path] += 1
+        time.sleep(self.delay)
+
+    def _end_request(self) -> None:
+        with self._lock:
+            self._active_requests -= 1
+
+
+class StandInRequestHandler(SimpleHTTPRequestHandler):
+    """Serves files with keep-alive and ranged requests, like object storage does."""
+
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args: Any, stand_in: HTTPStandIn, **kwargs: Any) -> None:
+        self.stand_in = stand_in
+        self.range_length: int | None = None
+        self.in_request = False
+        super().__init__(*args, **kwargs)
+
+    def setup(self) -> None:
+        super().setup()
+        self.stand_in._connect()
+
+    def parse_request(self) -> bool:
+        parsed = super().parse_request()
+        if parsed:
+            self.in_request = True
+            self.stand_in._start_request()
+        return parsed
+
+    def end_headers(self) -> None:
+        if self.in_request:
+            self.in_request = False
+            self.stand_in._end_request()
+        super().end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def send_header(self, keyword: str, value: str) -> None:
+        # Keep connections alive after errors (e.g. 404s), as object storage does.
+        if keyword.lower() == "connection" and value.lower() == "close":
+            return
+        super().send_header(keyword, value)
+
+    def send_head(self) -> BinaryIO | None:
+        self.range_length = None
+        path = Path(self.translate_path(self.path))
+        if self.command == "GET" and path.is_file():
+            self.stand_in._request_file(self.path)
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+        if match is None or not path.is_file():
+            return super().send_head()
+
+        size = path.stat().st_size
+        start, end = match.groups()
+        if start:
+            start, end = int(start), min(int(end or size - 1), size - 1)
+        else:
+            start, end = max(size - int(end), 0), size - 1
+        f = path.open("rb")
+        f.seek(start)
+        self.range_length = end - start + 1
+        self.send_response(206)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(self.range_length))
+        self.end_headers()
+        return f
+
+    def copyfile(
+        self, source: SupportsRead[AnyStr], outputfile: SupportsWrite[AnyStr]
+    ) -> None:
+        if self.range_length is None:
+            super().copyfile(source, outputfile)
+        else:
+            outputfile.write(source.read(self.range_length))
+
+    def list_directory(self, path: StrPath) -> io.BytesIO:
+        # Plain links, without trailing slashes, so that pins can list pin versions.
+        base = self.path.rstrip("/")
+        body = "".join(
+            f'<a href="{base}/{child.name}">{child.name}</a>\n'
+            for child in sorted(Path(path).iterdir())
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        return io.BytesIO(body)